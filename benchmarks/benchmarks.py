@@ -0,0 +1,341 @@
+""" Benchmarks for the stages of the docstring rendering pipeline.
+
+The classes follow the asv conventions (``setup`` and ``time_*``
+methods) and can also be executed with ``python -m benchmarks.run``.
+
+"""
+from benchmarks.corpus import generate_corpus
+from sectiondoc.items import (
+    AnyItem, DefinitionItem, OrDefinitionItem, MethodItem, item_cache)
+from sectiondoc.renderers import (
+    Argument, Attribute, Definition, ListItem, Method, TableRow,
+    rendering_cache)
+from sectiondoc.sections.util import get_column_lengths
+from sectiondoc.styles import (
+    DocRender, DocumentParser, SinglePassRender, default, dump_documents,
+    legacy, load_documents)
+from sectiondoc.util import get_section_header
+
+
+#: The number of docstrings in the synthetic corpus.
+CORPUS_SIZE = 1000
+
+ITEM_SECTIONS = {
+    'Parameters': DefinitionItem,
+    'Attributes': DefinitionItem,
+    'Returns': DefinitionItem,
+    'Raises': DefinitionItem,
+    'Methods': MethodItem}
+
+_corpora = {}
+
+
+def get_corpus(legacy=False):
+    key = (CORPUS_SIZE, legacy)
+    corpus = _corpora.get(key)
+    if corpus is None:
+        corpus = _corpora[key] = generate_corpus(CORPUS_SIZE, legacy=legacy)
+    return corpus
+
+
+def find_sections(corpus):
+    """ Return the ``(lines, index, item_type)`` of the item sections.
+
+    The index is the first line after the section header.
+
+    """
+    sections = []
+    for _, lines in corpus:
+        for index in range(len(lines) - 1):
+            header = get_section_header(lines[index], lines[index + 1])
+            if header in ITEM_SECTIONS:
+                sections.append((lines, index + 2, ITEM_SECTIONS[header]))
+    return sections
+
+
+def collect_blocks(lines, index, item_type):
+    """ Collect the item blocks of a section the same way that
+    :meth:`~.DocRender.extract_items` does.
+
+    """
+    doc = SinglePassRender(lines)
+    doc.index = index
+    is_item = item_type.is_item
+    blocks = []
+    while (
+            not doc.is_section() and
+            (is_item(doc.peek()) or is_item(doc.peek(1)))):
+        doc.remove_if_empty(doc.index)
+        blocks.append(doc.get_next_block())
+    return blocks
+
+
+class WithoutCaches(object):
+    """ Disable the shared caches while timing.
+
+    """
+
+    def setup(self):
+        self._sizes = item_cache.maxsize, rendering_cache.maxsize
+        item_cache.clear()
+        rendering_cache.clear()
+        item_cache.maxsize = 0
+        rendering_cache.maxsize = 0
+
+    def teardown(self):
+        item_cache.maxsize, rendering_cache.maxsize = self._sizes
+        item_cache.clear()
+        rendering_cache.clear()
+
+
+class TimeParse(WithoutCaches):
+    """ Render the whole corpus with the predefined styles.
+
+    """
+
+    def setup(self):
+        WithoutCaches.setup(self)
+        self.corpus = get_corpus()
+        self.legacy_corpus = get_corpus(legacy=True)
+        self.default_style = default.create_style()
+        self.legacy_style = legacy.create_style()
+
+    def _render(self, style, corpus):
+        render_docstring = style.render_docstring
+        for what, lines in corpus:
+            render_docstring(None, what, '', None, {}, list(lines))
+
+    def time_default_style(self):
+        self._render(self.default_style, self.corpus)
+
+    def time_legacy_style(self):
+        self._render(self.legacy_style, self.legacy_corpus)
+
+    def time_doc_render(self):
+        sections = {
+            'class': default.class_section([]).sections,
+            'function': default.function_section([]).sections}
+        sections['method'] = sections['function']
+        for what, lines in self.corpus:
+            DocRender(list(lines), sections=sections[what]).parse()
+
+    def time_default_style_cached(self):
+        item_cache.maxsize = 4096
+        rendering_cache.maxsize = 4096
+        try:
+            self._render(self.default_style, self.corpus)
+        finally:
+            item_cache.maxsize = 0
+            rendering_cache.maxsize = 0
+
+
+class TimeIsSection(object):
+    """ Check every line of the corpus for a section header.
+
+    """
+
+    def setup(self):
+        self.corpus = get_corpus()
+
+    def time_is_section(self):
+        for _, lines in self.corpus:
+            doc = SinglePassRender(lines)
+            for index in range(len(lines)):
+                doc.index = index
+                doc.is_section()
+
+
+class TimeExtractItems(WithoutCaches):
+    """ Extract the items of every item section in the corpus.
+
+    """
+
+    def setup(self):
+        WithoutCaches.setup(self)
+        self.sections = find_sections(get_corpus())
+        self.legacy_sections = [
+            (lines, index, OrDefinitionItem if item_type is DefinitionItem
+             else item_type)
+            for lines, index, item_type in find_sections(
+                get_corpus(legacy=True))]
+
+    def _extract(self, sections):
+        for lines, index, item_type in sections:
+            doc = SinglePassRender(lines)
+            doc.index = index
+            doc.extract_items(item_type)
+
+    def time_extract_items(self):
+        self._extract(self.sections)
+
+    def time_extract_items_legacy(self):
+        self._extract(self.legacy_sections)
+
+
+class TimeItemParse(object):
+    """ Parse the item blocks of the corpus with each item type.
+
+    """
+
+    def setup(self):
+        self.blocks = {}
+        self.headers = []
+        for lines, index, item_type in find_sections(get_corpus()):
+            blocks = collect_blocks(lines, index, item_type)
+            self.blocks.setdefault(item_type, []).extend(blocks)
+        for lines, index, item_type in find_sections(get_corpus(True)):
+            if item_type is DefinitionItem:
+                self.blocks.setdefault(OrDefinitionItem, []).extend(
+                    collect_blocks(lines, index, OrDefinitionItem))
+        self.blocks[AnyItem] = self.blocks[DefinitionItem]
+
+    def _parse(self, item_type):
+        parse = item_type.parse
+        for block in self.blocks[item_type]:
+            parse(block)
+
+    def time_any_item(self):
+        self._parse(AnyItem)
+
+    def time_definition_item(self):
+        self._parse(DefinitionItem)
+
+    def time_or_definition_item(self):
+        self._parse(OrDefinitionItem)
+
+    def time_method_item(self):
+        self._parse(MethodItem)
+
+
+class TimeRenderers(WithoutCaches):
+    """ Render the items of the corpus with each renderer.
+
+    """
+
+    def setup(self):
+        WithoutCaches.setup(self)
+        self.items = []
+        self.methods = []
+        for lines, index, item_type in find_sections(get_corpus()):
+            items = SinglePassRender(lines)
+            items.index = index
+            items = items.extract_items(item_type)
+            if item_type is MethodItem:
+                self.methods.append((items, get_column_lengths(items)))
+            else:
+                self.items.extend(items)
+
+    def _render(self, renderer, **options):
+        for item in self.items:
+            renderer.item = item
+            renderer.to_rst(**options)
+
+    def time_argument(self):
+        self._render(Argument())
+
+    def time_attribute(self):
+        self._render(Attribute())
+
+    def time_list_item(self):
+        self._render(ListItem(), prefix='-')
+
+    def time_definition(self):
+        self._render(Definition())
+
+    def time_table_row(self):
+        self._render(TableRow(), columns=(20, 10, 40))
+
+    def time_method(self):
+        renderer = Method()
+        for items, columns in self.methods:
+            for item in items:
+                renderer.item = item
+                renderer.to_rst(columns=columns)
+
+
+class TimeDocument(WithoutCaches):
+    """ Parse the corpus into documents, serialize and load the documents
+    and render the parsed documents.
+
+    Loading the serialized documents replaces the parsing of the
+    docstrings, compare ``time_load_documents`` with
+    ``time_parse_document``.
+
+    """
+
+    def setup(self):
+        WithoutCaches.setup(self)
+        self.corpus = get_corpus()
+        self.sections = {
+            'class': default.class_section([]).sections,
+            'function': default.function_section([]).sections}
+        self.sections['method'] = self.sections['function']
+        self.documents = self._parse()
+        self.data = dump_documents(
+            [document for _, document in self.documents])
+
+    def _parse(self):
+        sections = self.sections
+        return [
+            (what, DocumentParser(list(lines), sections[what]).parse())
+            for what, lines in self.corpus]
+
+    def time_parse_document(self):
+        self._parse()
+
+    def time_dump_documents(self):
+        dump_documents([document for _, document in self.documents])
+
+    def time_load_documents(self):
+        load_documents(self.data)
+
+    def time_render_document(self):
+        sections = self.sections
+        for what, document in self.documents:
+            document.render(sections[what])
+
+
+#: The number of repetitions in the adversarial header lines.
+ADVERSARIAL_SIZE = 2000
+
+
+class TimeAdversarialHeaders(object):
+    """ Check long header lines that almost match the item headers.
+
+    The regexes of the items would backtrack exponentially (or
+    quadratically) on these lines, the header checks have to finish in
+    time proportional to the length of the lines.
+
+    """
+
+    def setup(self):
+        size = ADVERSARIAL_SIZE
+        self.lines = {
+            DefinitionItem: [
+                'term' + ' : classifier' * size + ' !',
+                'term' + ' : callable()' * size + ' !',
+                'term' + ' : callable(x)' * size + '(!'],
+            OrDefinitionItem: [
+                'term : callable(' + ') or callable(' * size + 'x',
+                'term : int(' + ')' * size + ' or !'],
+            AnyItem: ['term' + ' text\n' * size + 'text'],
+            MethodItem: [
+                'method' * size + '(\n)',
+                'method(' + 'x\n' * size + ')']}
+
+    def _check(self, item_type):
+        is_item = item_type.is_item
+        for line in self.lines[item_type]:
+            is_item(line)
+
+    def time_any_item(self):
+        self._check(AnyItem)
+
+    def time_definition_item(self):
+        self._check(DefinitionItem)
+
+    def time_or_definition_item(self):
+        self._check(OrDefinitionItem)
+
+    def time_method_item(self):
+        self._check(MethodItem)
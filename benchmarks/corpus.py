@@ -0,0 +1,120 @@
+""" Synthetic docstring corpus for the benchmarks.
+
+The corpus is generated from a seeded random generator so that the same
+arguments always produce the same docstrings.
+
+"""
+import random
+
+
+NAMES = [
+    'axis', 'dtype', 'copy', 'out', 'index', 'value', 'name', 'shape',
+    'order', 'keepdims', 'weights', 'callback', 'parent', 'item', 'mode']
+
+TYPES = [
+    'int', 'float', 'bool', 'str', 'ndarray', 'list of str', 'dict',
+    'tuple', 'callable', 'Instance(HasTraits)', 'module.Class', 'None']
+
+WORDS = (
+    'the value of this argument is used to compute a result when the '
+    'input array has more than one dimension and the output is optional '
+    'otherwise a new array is created with the same shape and type').split()
+
+
+def sentence(rng, words=12):
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def paragraph(rng, lines=2, indent=''):
+    return [indent + sentence(rng) for _ in range(lines)]
+
+
+def definition(rng, indent='    '):
+    """ A definition body with an optional nested paragraph or list.
+
+    """
+    lines = paragraph(rng, rng.randint(1, 3), indent)
+    choice = rng.random()
+    if choice < 0.2:
+        lines += [''] + paragraph(rng, 2, indent)
+    elif choice < 0.3:
+        lines += [''] + [
+            indent + '- ' + sentence(rng, 6) for _ in range(3)]
+    elif choice < 0.35:
+        lines += ['', indent + '.. note:: ' + sentence(rng, 8),
+                  indent + '    ' + sentence(rng, 8)]
+    return lines
+
+
+def item_section(rng, header, count, legacy=False):
+    lines = [header, '-' * len(header)]
+    for index in range(count):
+        name = rng.choice(NAMES) if rng.random() < 0.7 else \
+            '{0}{1}'.format(rng.choice(NAMES), index)
+        types = rng.choice(TYPES)
+        if legacy and rng.random() < 0.2:
+            types = '{0} or {1}'.format(types, rng.choice(TYPES))
+        lines.append('{0} : {1}'.format(name, types))
+        lines += definition(rng)
+        if rng.random() < 0.6:
+            lines.append('')
+    lines.append('')
+    return lines
+
+
+def methods_section(rng, count):
+    lines = ['Methods', '-------']
+    for index in range(count):
+        arguments = ', '.join(rng.sample(NAMES, rng.randint(0, 4)))
+        lines.append('method{0}({1})'.format(index, arguments))
+        lines += paragraph(rng, 1, '    ')
+        lines.append('')
+    return lines
+
+
+def function_docstring(rng, parameters=8, legacy=False):
+    lines = [sentence(rng), ''] + paragraph(rng, 3) + ['']
+    lines += item_section(
+        rng, 'Parameters', rng.randint(1, parameters), legacy)
+    lines += item_section(rng, 'Returns', 1, legacy)
+    if rng.random() < 0.3:
+        lines += item_section(rng, 'Raises', rng.randint(1, 3), legacy)
+    if rng.random() < 0.3:
+        lines += ['Notes', '-----'] + paragraph(rng, 3) + ['']
+    if rng.random() < 0.2:
+        lines += ['Examples', '--------', '>>> function(1, 2)', '3', '']
+    return lines
+
+
+def class_docstring(rng, attributes=20, methods=50, legacy=False):
+    lines = [sentence(rng), ''] + paragraph(rng, 4) + ['']
+    lines += item_section(
+        rng, 'Attributes', rng.randint(1, attributes), legacy)
+    lines += methods_section(rng, rng.randint(1, methods))
+    if rng.random() < 0.3:
+        lines += ['Notes', '-----'] + paragraph(rng, 3) + ['']
+    return lines
+
+
+def generate_corpus(count=2000, seed=0, legacy=False):
+    """ Generate a list of ``(what, lines)`` docstrings.
+
+    About a third of the docstrings have no sections, the rest are
+    function and class docstrings with long item sections.
+
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        choice = rng.random()
+        if choice < 0.2:
+            corpus.append(('function', [sentence(rng), '']))
+        elif choice < 0.35:
+            corpus.append(
+                ('method', [sentence(rng), ''] + paragraph(rng, 4) + ['']))
+        elif choice < 0.85:
+            corpus.append(
+                ('function', function_docstring(rng, legacy=legacy)))
+        else:
+            corpus.append(('class', class_docstring(rng, legacy=legacy)))
+    return corpus
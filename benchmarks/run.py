@@ -0,0 +1,128 @@
+""" Run the benchmarks and report the timings as JSON.
+
+Usage::
+
+    $ python -m benchmarks.run --output results.json
+    $ python -m benchmarks.run --filter TimeItemParse --size 200
+
+Every ``time_*`` method of the ``Time*`` classes in the benchmark
+modules is executed ``--repeat`` times after calling the ``setup`` of
+the class. The best and median time of one call is reported in
+seconds.
+
+"""
+from __future__ import print_function
+
+import argparse
+import importlib
+import json
+import platform
+import sys
+import time
+import timeit
+
+import sectiondoc
+
+
+MODULES = ['benchmarks.benchmarks']
+
+
+def discover(modules, pattern=None):
+    """ Yield the ``(name, class, method name)`` of the benchmarks.
+
+    """
+    for module_name in modules:
+        module = importlib.import_module(module_name)
+        for class_name in sorted(dir(module)):
+            cls = getattr(module, class_name)
+            if not (class_name.startswith('Time') and isinstance(cls, type)):
+                continue
+            for method_name in sorted(dir(cls)):
+                if not method_name.startswith('time_'):
+                    continue
+                name = '{0}.{1}.{2}'.format(
+                    module_name.split('.')[-1], class_name, method_name)
+                if pattern is None or pattern in name:
+                    yield name, cls, method_name
+
+
+def run_benchmark(cls, method_name, repeat=5, min_time=0.2):
+    """ Time one benchmark method.
+
+    The number of calls per repeat is increased until a repeat takes at
+    least ``min_time`` seconds.
+
+    """
+    instance = cls()
+    if hasattr(instance, 'setup'):
+        instance.setup()
+    try:
+        timer = timeit.Timer(getattr(instance, method_name))
+        number = 1
+        while True:
+            elapsed = timer.timeit(number)
+            if elapsed >= min_time or number >= 1000:
+                break
+            number *= 2 if elapsed == 0 else min(
+                10, max(2, int(min_time / elapsed) + 1))
+        timings = sorted(
+            elapsed / number for elapsed in timer.repeat(repeat, number))
+    finally:
+        if hasattr(instance, 'teardown'):
+            instance.teardown()
+    return {
+        'best': timings[0],
+        'median': timings[len(timings) // 2],
+        'number': number,
+        'repeat': repeat}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.run',
+        description='Run the sectiondoc benchmarks.')
+    parser.add_argument(
+        '-o', '--output', help='json file to write, default is stdout')
+    parser.add_argument(
+        '-f', '--filter', help='run only benchmarks containing the text')
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=5,
+        help='number of timing repeats (default: %(default)s)')
+    parser.add_argument(
+        '-s', '--size', type=int, default=None,
+        help='number of docstrings in the synthetic corpus')
+    parser.add_argument(
+        '-m', '--module', action='append', dest='modules',
+        help='benchmark module to run (default: all)')
+    args = parser.parse_args(argv)
+
+    modules = args.modules or MODULES
+    if args.size is not None:
+        for module_name in modules:
+            module = importlib.import_module(module_name)
+            if hasattr(module, 'CORPUS_SIZE'):
+                module.CORPUS_SIZE = args.size
+
+    results = {}
+    for name, cls, method_name in discover(modules, args.filter):
+        results[name] = run_benchmark(cls, method_name, args.repeat)
+        print('{0:<60} {1:10.3f} ms'.format(
+            name, results[name]['best'] * 1e3), file=sys.stderr)
+
+    report = {
+        'sectiondoc_version': sectiondoc.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'timestamp': time.time(),
+        'results': results}
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output, 'w') as handle:
+            handle.write(text + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#  file: batch.py
+#  License: LICENSE.TXT
+#
+#  Copyright (c) 2011-14, Enthought, Inc.
+#  All rights reserved.
+# -----------------------------------------------------------------------------
+""" Render the docstrings of a source tree without running sphinx.
+
+The docstrings are extracted from the python files using the :mod:`ast`
+module (i.e. the code is not imported) and rendered with the
+``class_section`` and ``function_section`` of the selected style. The
+files are distributed to a pool of processes.
+
+Usage::
+
+    $ python -m sectiondoc --style default --output build/rst mypackage
+
+"""
+from __future__ import print_function
+
+import argparse
+import ast
+import importlib
+import inspect
+import io
+import os
+import sys
+import time
+
+
+STYLES = ('default', 'legacy')
+
+_styles = {}
+
+
+def extract_docstrings(source, filename='<unknown>'):
+    """ Extract the class, function and method docstrings from the source.
+
+    Arguments
+    ---------
+    source : str
+        The python source code.
+
+    filename : str
+        The filename to use in the syntax error messages.
+
+    Returns
+    -------
+    docstrings : list
+        A list of ``(what, name, lines)`` tuples in the order that the
+        objects are defined. The docstring lines are prepared the same
+        way autodoc prepares them.
+
+    """
+    tree = ast.parse(source, filename)
+    docstrings = []
+    _collect_docstrings(tree, '', 'function', docstrings)
+    return docstrings
+
+
+def render_docstrings(docstrings, style):
+    """ Render the extracted docstrings inplace using the style.
+
+    """
+    for what, name, lines in docstrings:
+        style.render_docstring(None, what, name, None, {}, lines)
+    return docstrings
+
+
+def format_rst(docstrings):
+    """ Format the rendered docstrings as python domain directives.
+
+    """
+    output = []
+    for what, name, lines in docstrings:
+        output.append(u'.. py:{0}:: {1}'.format(what, name))
+        output.append(u'')
+        output.extend(
+            u'    ' + line if line.strip() else u'' for line in lines)
+        output.append(u'')
+    return u'\n'.join(output)
+
+
+def render_file(task):
+    """ Render the docstrings of a python file.
+
+    Arguments
+    ---------
+    task : tuple
+        The ``(filename, style_name)`` of the file to render.
+
+    Returns
+    -------
+    result : tuple
+        The ``(filename, rst, count, error)`` of the rendered file. When
+        the file cannot be read, parsed or rendered the ``rst`` is None
+        and ``error`` holds the error message.
+
+    """
+    filename, style_name = task
+    try:
+        with io.open(filename, 'rb') as handle:
+            source = handle.read()
+        docstrings = extract_docstrings(source, filename)
+    except (IOError, OSError, SyntaxError, UnicodeDecodeError,
+            ValueError) as error:
+        return filename, None, 0, str(error)
+    try:
+        render_docstrings(docstrings, get_style(style_name))
+    except Exception as error:
+        # A failing docstring should not abort the other files.
+        return filename, None, 0, 'rendering failed: {0!r}'.format(error)
+    return filename, format_rst(docstrings), len(docstrings), None
+
+
+def get_style(name):
+    """ Return the (per process) style instance of the named style module.
+
+    """
+    style = _styles.get(name)
+    if style is None:
+        module = importlib.import_module('sectiondoc.styles.' + name)
+        style = _styles[name] = module.create_style()
+    return style
+
+
+def find_sources(paths):
+    """ Find the python files to render.
+
+    Returns
+    -------
+    sources : list
+        A list of ``(filename, relative filename)`` tuples. The relative
+        filename is relative to the directory argument that includes it.
+        The files that are passed directly keep their path relative to
+        the current directory, or their name when they are outside of it.
+
+    """
+    sources = []
+    for path in paths:
+        if os.path.isfile(path):
+            relative = os.path.relpath(os.path.abspath(path))
+            if os.path.isabs(relative) or relative.startswith(os.pardir):
+                relative = os.path.basename(path)
+            sources.append((path, relative))
+            continue
+        root = os.path.dirname(os.path.abspath(path).rstrip(os.sep))
+        for directory, folders, filenames in os.walk(path):
+            folders[:] = sorted(
+                folder for folder in folders
+                if not folder.startswith('.') and folder != '__pycache__')
+            for filename in sorted(filenames):
+                if filename.endswith('.py'):
+                    filename = os.path.join(directory, filename)
+                    sources.append((
+                        filename,
+                        os.path.relpath(os.path.abspath(filename), root)))
+    return sources
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m sectiondoc',
+        description='Render the docstrings of python source files.')
+    parser.add_argument(
+        'paths', nargs='+', help='python files or directories to render')
+    parser.add_argument(
+        '-s', '--style', choices=STYLES, default='default',
+        help='the rendering style (default: %(default)s)')
+    parser.add_argument(
+        '-o', '--output',
+        help='directory to write one rst file per python file, '
+             'print the rendered docstrings when not provided')
+    parser.add_argument(
+        '-j', '--jobs', type=_positive_int, default=None,
+        help='number of processes (default: number of cpus)')
+    args = parser.parse_args(argv)
+
+    sources = find_sources(args.paths)
+    relative = dict(sources)
+    if args.output is not None:
+        duplicates = _duplicates(name for _, name in sources)
+        if duplicates:
+            parser.error(
+                'the output files of the paths overlap: {0}'.format(
+                    ', '.join(duplicates)))
+    tasks = [(filename, args.style) for filename, _ in sources]
+    start = time.time()
+    if args.jobs == 1:
+        results = map(render_file, tasks)
+        shutdown = None
+    else:
+        shutdown, results = _map_processes(render_file, tasks, args.jobs)
+
+    count = files = errors = 0
+    try:
+        for filename, rst, number, error in results:
+            if error is not None:
+                errors += 1
+                print('{0}: {1}'.format(filename, error), file=sys.stderr)
+                continue
+            files += 1
+            count += number
+            _write(rst, relative[filename], args.output)
+    finally:
+        if shutdown is not None:
+            shutdown()
+    elapsed = time.time() - start
+
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(
+        'Rendered {0} docstrings from {1} files in {2:.2f}s '
+        '({3:.0f} docstrings/sec)'.format(count, files, elapsed, rate),
+        file=sys.stderr)
+    return 1 if errors else 0
+
+
+def _positive_int(value):
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            'expected a positive number of processes, got {0!r}'.format(
+                value))
+    return number
+
+
+def _map_processes(function, tasks, jobs):
+    """ Map the function over the tasks in a pool of processes.
+
+    The :mod:`concurrent.futures` pool is used when available (i.e. on
+    python 3 or with the ``futures`` backport) and a
+    :class:`multiprocessing.Pool` otherwise. Returns the function that
+    shuts the pool down and the iterator of the results.
+
+    """
+    chunksize = max(1, len(tasks) // (4 * (jobs or 4)))
+    try:
+        from concurrent.futures import ProcessPoolExecutor
+    except ImportError:
+        import multiprocessing
+        pool = multiprocessing.Pool(jobs)
+
+        def shutdown():
+            pool.close()
+            pool.join()
+
+        return shutdown, pool.imap(function, tasks, chunksize)
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    return (
+        executor.shutdown,
+        executor.map(function, tasks, chunksize=chunksize))
+
+
+def _write(rst, relative_filename, output):
+    if output is None:
+        if rst:
+            print(rst)
+        return
+    filename = os.path.join(
+        output, os.path.splitext(relative_filename)[0] + '.rst')
+    directory = os.path.dirname(filename)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    with io.open(filename, 'w', encoding='utf-8') as handle:
+        handle.write(rst)
+
+
+def _duplicates(names):
+    seen = set()
+    duplicates = []
+    for name in names:
+        key = os.path.normcase(os.path.normpath(name))
+        if key in seen:
+            duplicates.append(name)
+        seen.add(key)
+    return duplicates
+
+
+def _collect_docstrings(node, prefix, function_type, docstrings):
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, ast.ClassDef):
+            what = 'class'
+        elif isinstance(child, _function_nodes):
+            what = function_type
+        else:
+            continue
+        name = prefix + child.name
+        docstring = ast.get_docstring(child, clean=False)
+        if docstring is not None:
+            docstrings.append((what, name, _prepare_docstring(docstring)))
+        if what == 'class':
+            _collect_docstrings(child, name + '.', 'method', docstrings)
+
+
+def _prepare_docstring(docstring):
+    if isinstance(docstring, bytes):
+        docstring = docstring.decode('utf-8')
+    lines = inspect.cleandoc(docstring).splitlines()
+    if lines and lines[-1]:
+        lines.append(u'')
+    return lines
+
+
+_function_nodes = tuple(
+    getattr(ast, name) for name in ('FunctionDef', 'AsyncFunctionDef')
+    if hasattr(ast, name))
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#  file: cache.py
+#  License: LICENSE.TXT
+#
+#  Copyright (c) 2011-14, Enthought, Inc.
+#  All rights reserved.
+# -----------------------------------------------------------------------------
+import threading
+from collections import namedtuple, OrderedDict
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+InternInfo = namedtuple('InternInfo', ['unique', 'total'])
+
+
+class LRUCache(object):
+    """ A bounded and thread safe least recently used cache.
+
+    When the cache is full the least recently used entry is evicted to
+    make space for a new entry.
+
+    Attributes
+    ----------
+    maxsize : int
+        The maximum number of entries to keep.
+
+    hits : int
+        The number of lookups that found an entry.
+
+    misses : int
+        The number of lookups that did not find an entry.
+
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """ Return the value of the key and mark the entry as recently used.
+
+        """
+        with self._lock:
+            data = self._data
+            try:
+                value = data.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            data[key] = value
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """ Add the value in the cache evicting old entries if necessary.
+
+        """
+        with self._lock:
+            data = self._data
+            data.pop(key, None)
+            data[key] = value
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+
+    def update(self, items):
+        """ Add a sequence of (key, value) pairs in the cache.
+
+        """
+        for key, value in items:
+            self.put(key, value)
+
+    def items(self):
+        """ Return a list of the (key, value) pairs from the least to the
+        most recently used.
+
+        """
+        with self._lock:
+            return list(self._data.items())
+
+    def clear(self):
+        """ Remove all the entries and reset the counters.
+
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """ Return the cache statistics as a :class:`CacheInfo` tuple.
+
+        """
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+class InternTable(object):
+    """ A bounded and thread safe table of unique strings.
+
+    Equal strings that are passed to :meth:`intern` are replaced by the
+    first instance that was added to the table, so that the repeated
+    strings share the same object. The lookups of the strings that are
+    already in the table do not lock, only the new strings are added
+    under the lock. When the table is full it is emptied before adding a
+    new string, the strings that were already returned stay valid but
+    they are not shared with the ones interned after that.
+
+    Attributes
+    ----------
+    maxsize : int
+        The maximum number of strings to keep. Default is None (i.e. no
+        limit).
+
+    total : int
+        The number of strings that have been interned. The counter is
+        not locked, thus it is approximate when the table is used from
+        multiple threads.
+
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self.total = 0
+        self._strings = {}
+        self._lock = threading.Lock()
+
+    def intern(self, string):
+        """ Return the shared instance of the string.
+
+        """
+        self.total += 1
+        value = self._strings.get(string)
+        if value is None:
+            value = self._add(string)
+        return value
+
+    def intern_all(self, strings):
+        """ Return a tuple of the shared instances of the strings.
+
+        """
+        self.total += len(strings)
+        get = self._strings.get
+        values = []
+        for string in strings:
+            value = get(string)
+            if value is None:
+                value = self._add(string)
+            values.append(value)
+        return tuple(values)
+
+    def clear(self):
+        """ Remove all the strings and reset the counter.
+
+        """
+        with self._lock:
+            self._strings.clear()
+            self.total = 0
+
+    def info(self):
+        """ Return the table statistics as a :class:`InternInfo` tuple.
+
+        """
+        with self._lock:
+            return InternInfo(len(self._strings), self.total)
+
+    def __len__(self):
+        return len(self._strings)
+
+    def __contains__(self, string):
+        return string in self._strings
+
+    def _add(self, string):
+        with self._lock:
+            strings = self._strings
+            value = strings.get(string)
+            if value is None:
+                maxsize = self.maxsize
+                if maxsize is not None and len(strings) >= maxsize:
+                    strings.clear()
+                value = strings[string] = string
+            return value
@@ -3,10 +3,16 @@ __all__ = [
     'DefinitionItem',
     'MethodItem',
     'AnyItem',
-    'Item']
+    'Item',
+    'LineSpan',
+    'item_cache',
+    'parse_item',
+    'string_table']
 
 from sectiondoc.items.item import Item
+from sectiondoc.items.line_span import LineSpan
 from sectiondoc.items.any_item import AnyItem
 from sectiondoc.items.definition_item import DefinitionItem
 from sectiondoc.items.or_definition_item import OrDefinitionItem
 from sectiondoc.items.method_item import MethodItem
+from sectiondoc.items.cache import item_cache, parse_item, string_table
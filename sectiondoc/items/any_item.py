@@ -1,8 +1,10 @@
 import re
 
 from sectiondoc.items.regex import definition_regex, header_regex
+from sectiondoc.items.cache import string_table
 from sectiondoc.items.item import Item
-from sectiondoc.util import trim_indent
+from sectiondoc.items.line_span import LineSpan
+from sectiondoc.items.scanners import is_any_header
 
 any_item_regex = re.compile(r"""
 \*{0,2}            # no, one or two stars
@@ -33,12 +35,12 @@ class AnyItem(Item):
     term : str
         The term usually reflects the name of a parameter or an attribute.
 
-    classifiers : list
+    classifiers : tuple
         The classifiers of the definition. Commonly used to reflect the type
         of an argument or the signature of a function. Any text after the
         ` : ` till the end of the line is consider a single classifier.
 
-    definition : list
+    definition : tuple
         The list of strings that holds the description the definition item.
 
     .. note::
@@ -47,6 +49,8 @@ class AnyItem(Item):
 
     """
 
+    __slots__ = ()
+
     @classmethod
     def is_item(cls, line):
         """ Check if the line is describing a definition item.
@@ -63,7 +67,18 @@ class AnyItem(Item):
         Subclasses can restrict or expand this format.
 
         """
-        return any_item_regex.match(line) is not None
+        return is_any_header(line)
+
+    @classmethod
+    def parse_definition(cls, span, indent=0):
+        """ Parse the definition from the lines that follow the item header.
+
+        An item without definition lines has an empty definition.
+
+        """
+        if len(span) == 0:
+            return []
+        return super(AnyItem, cls).parse_definition(span, indent)
 
     @classmethod
     def parse(cls, lines):
@@ -119,6 +134,6 @@ class AnyItem(Item):
             (' :' in header) else (header, '')
         classifier = classifier.strip()
         classifier = [] if classifier == '' else [classifier]
-        trimed_lines = trim_indent(lines[1:]) if (len(lines) > 1) else []
-        definition = [line.rstrip() for line in trimed_lines]
-        return cls(term.strip(), classifier, definition)
+        return cls.lazy(
+            string_table.intern(term.strip()),
+            string_table.intern_all(classifier), LineSpan(lines, 1))
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#  file: cache.py
+#  License: LICENSE.TXT
+#
+#  Copyright (c) 2011-14, Enthought, Inc.
+#  All rights reserved.
+# -----------------------------------------------------------------------------
+from sectiondoc.cache import InternTable, LRUCache
+
+
+#: The shared cache of the parsed items keyed by item type and block lines.
+item_cache = LRUCache(maxsize=4096)
+
+#: The shared table of the terms and classifiers of the parsed items. The
+#: styles clear it at the start of every build. The table is bounded since
+#: it lives as long as the process in the other uses (e.g. the batch
+#: rendering, the live preview or the loaded documents), when it is full
+#: it starts over.
+string_table = InternTable(maxsize=65536)
+
+
+def parse_item(item_type, lines):
+    """ Parse an item block using the shared item cache.
+
+    Identical blocks of the same item type are parsed only once. The
+    items are immutable, thus the cached item is returned directly.
+
+    Arguments
+    ---------
+    item_type : type
+        The :class:`~.Item` subclass that parses the block.
+
+    lines : list
+        docstring lines of the item block without any empty lines before
+        or after.
+
+    Returns
+    -------
+    item : Item
+
+    """
+    block = tuple(lines)
+    key = (item_type, block)
+    item = item_cache.get(key)
+    if item is None:
+        item = item_type.parse(block)
+        item_cache.put(key, item)
+    return item
@@ -1,7 +1,9 @@
 import re
 
+from sectiondoc.items.cache import string_table
 from sectiondoc.items.item import Item
-from sectiondoc.util import trim_indent
+from sectiondoc.items.line_span import LineSpan
+from sectiondoc.items.scanners import is_definition_header
 
 definition_item_regex = re.compile(r"""
 \*{0,2}                        # no, one or two stars
@@ -38,16 +40,18 @@ class DefinitionItem(Item):
     term : str
         The term usually reflects the name of a parameter or an attribute.
 
-    classifiers : list
+    classifiers : tuple
         The classifiers of the definition. Commonly used to reflect the type
         of an argument or the signature of a function. Multiple classifiers
         are allowed separated by colons `` : ``.
 
-    definition : list
+    definition : tuple
         The list of strings that holds the description the definition item.
 
     """
 
+    __slots__ = ()
+
     @classmethod
     def is_item(cls, line):
         """ Check if the line is describing a definition item.
@@ -64,7 +68,7 @@ class DefinitionItem(Item):
         Subclasses can restrict or expand this format.
 
         """
-        return definition_item_regex.match(line.rstrip()) is not None
+        return is_definition_header(line.rstrip())
 
     @classmethod
     def parse(cls, lines):
@@ -118,6 +122,6 @@ class DefinitionItem(Item):
             classifiers = components[1:]
         else:
             classifiers = []
-        trimed_lines = trim_indent(lines[1:]) if (len(lines) > 1) else ['']
-        definition = [line.rstrip() for line in trimed_lines]
-        return Item(term.strip(), classifiers, definition)
+        return cls.lazy(
+            string_table.intern(term.strip()),
+            string_table.intern_all(classifiers), LineSpan(lines, 1))
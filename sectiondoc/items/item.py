@@ -1,13 +1,20 @@
-﻿import abc
-from collections import namedtuple
+﻿from sectiondoc.items.line_span import LineSpan
+from sectiondoc.util import add_indent
 
 
-class Item(namedtuple('Item', ['term', 'classifiers', 'definition'])):
+class Item(object):
     """ A section item.
 
     The Item class is responsible to check, parse a docstring
     item into a (term, classifiers, definition) tuple.
 
+    The items are immutable and behave like a three item tuple (i.e. they
+    can be unpacked, indexed and compared to tuples). The fields are kept
+    in slots and the ``classifiers`` and ``definition`` are stored as
+    tuples, while the ``mode`` is computed once on first access. Items
+    created with :meth:`lazy` keep the raw definition lines and parse
+    them only when the ``definition`` is first needed.
+
     Format diagram::
 
         +-------------------------------------------------+
@@ -26,33 +33,183 @@ class Item(namedtuple('Item', ['term', 'classifiers', 'definition'])):
     term : str
         The term usually reflects the name of a parameter or an attribute.
 
-    classifiers : list
+    classifiers : tuple
         The classifier(s) of the term. Commonly used to reflect the type
         of an argument or the signature of a function.
 
-    definition : list
-        The list of strings that holds the description of the definition item.
+    definition : tuple
+        The strings (lines) that hold the description of the definition item.
+
+    mode : str
+        The operational mode of the item based on the available info.
+        Possible values are ``{'only_term', 'no_classifiers',
+        'no_definition', 'full'}``.
 
     """
 
+    __slots__ = ('term', 'classifiers', '_definition', '_mode', '_lines')
+
+    _fields = ('term', 'classifiers', 'definition')
+
+    def __init__(self, term, classifiers, definition):
+        setattr_ = object.__setattr__
+        setattr_(self, 'term', term)
+        setattr_(self, 'classifiers', tuple(classifiers))
+        setattr_(self, '_definition', tuple(definition))
+        setattr_(self, '_mode', None)
+        setattr_(self, '_lines', None)
+
+    @classmethod
+    def lazy(cls, term, classifiers, lines):
+        """ Create an item that parses the definition on first access.
+
+        The raw definition lines are kept as they are and the
+        :attr:`definition` and :attr:`mode` are only computed (using
+        :meth:`parse_definition`) when they are first accessed.
+
+        Arguments
+        ---------
+        term : str
+            The item term.
+
+        classifiers : list
+            The item classifiers.
+
+        lines : list or LineSpan
+            The docstring lines of the item block that follow the item
+            header.
+
+        """
+        if not isinstance(lines, LineSpan):
+            lines = LineSpan(lines)
+        item = cls.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(item, 'term', term)
+        setattr_(item, 'classifiers', tuple(classifiers))
+        setattr_(item, '_definition', None)
+        setattr_(item, '_mode', None)
+        setattr_(item, '_lines', lines)
+        return item
+
+    @classmethod
+    def parse_definition(cls, span, indent=0):
+        """ Parse the definition from the lines that follow the item header.
+
+        The global indention is removed and the lines are right stripped.
+
+        Arguments
+        ---------
+        span : LineSpan
+            The definition lines of the item block.
+
+        indent : int
+            The number of spaces to add in front of the non empty lines.
+
+        """
+        if len(span) == 0:
+            return ['']
+        return span.trim().lines(indent, rstrip=True)
+
     @property
-    def mode(self):
-        """ Property (`string`), the operational mode of the item based on the
-        available info. Possible values are ``{'only_term', 'no_classifiers',
-        'no_definition', 'full'}``.
+    def definition(self):
+        # The lines are read first, they are only dropped after the
+        # definition is set (e.g. by another thread).
+        lines = self._lines
+        definition = self._definition
+        if definition is None and lines is not None:
+            definition = tuple(self.parse_definition(lines))
+            object.__setattr__(self, '_definition', definition)
+            object.__setattr__(self, '_lines', None)
+        return definition
+
+    @property
+    def raw_definition(self):
+        """ The definition lines before the global indent is removed.
+
+        Renderers that strip the lines anyway can use the raw lines and
+        avoid parsing the definition of a lazy item.
 
+        """
+        lines = self._lines
+        return self.definition if lines is None else lines
+
+    def indented_definition(self, indent=4):
+        """ Return the definition lines indented by a number of spaces.
+
+        The definition of a lazy item is trimmed and indented in one
+        step from the raw lines, without parsing the definition.
 
         """
-        if self.classifiers == [] and self.definition == ['']:
-            mode = 'only_term'
-        elif self.classifiers == []:
-            mode = 'no_classifiers'
-        elif self.definition == ['']:
-            mode = 'no_definition'
-        else:
-            mode = 'full'
+        lines = self._lines
+        if lines is None:
+            return add_indent(self.definition, indent)
+        return self.parse_definition(lines, indent)
+
+    @property
+    def mode(self):
+        mode = self._mode
+        if mode is None:
+            classifiers = self.classifiers
+            lines = self._lines
+            if lines is None:
+                no_definition = self.definition == ('',)
+            else:
+                # Only an empty block can give a single empty line.
+                no_definition = (
+                    len(lines) == 0 and self.parse_definition(lines) == [''])
+            if not classifiers and no_definition:
+                mode = 'only_term'
+            elif not classifiers:
+                mode = 'no_classifiers'
+            elif no_definition:
+                mode = 'no_definition'
+            else:
+                mode = 'full'
+            object.__setattr__(self, '_mode', mode)
         return mode
 
+    def _replace(self, **fields):
+        """ Return a new item of the same type replacing the given fields.
+
+        """
+        values = dict(zip(self._fields, self))
+        values.update(fields)
+        return type(self)(**values)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "'{0}' object is immutable".format(type(self).__name__))
+
+    def __iter__(self):
+        yield self.term
+        yield self.classifiers
+        yield self.definition
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, index):
+        return (self.term, self.classifiers, self.definition)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (Item, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        return hash((self.term, self.classifiers, self.definition))
+
+    def __reduce__(self):
+        return (type(self), (self.term, self.classifiers, self.definition))
+
+    def __repr__(self):
+        return '{0}(term={1!r}, classifiers={2!r}, definition={3!r})'.format(
+            type(self).__name__, self.term, self.classifiers, self.definition)
+
     @classmethod
     def is_item(cls, line):
         """ Check if the line is describing an item.
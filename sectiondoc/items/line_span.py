@@ -0,0 +1,107 @@
+from sectiondoc.util import get_indent, is_empty
+
+
+class LineSpan(object):
+    """ A span of docstring lines that are trimmed by a fixed indent.
+
+    The span refers to the lines of an immutable source buffer between the
+    ``start`` and ``end`` offsets and skips the first ``indent`` characters
+    of every line. Trimming the global indent (see :meth:`trim`) and
+    re-indenting the lines (see :meth:`lines`) only change the offsets,
+    the strings are created once when the lines are materialized.
+
+    Attributes
+    ----------
+    source : tuple
+        The buffer of the docstring lines.
+
+    start : int
+        The offset of the first line in the span.
+
+    end : int
+        The offset after the last line in the span.
+
+    indent : int
+        The number of characters that are skipped at the start of every
+        line.
+
+    """
+
+    __slots__ = ('source', 'start', 'end', 'indent', '_trimmed')
+
+    def __init__(self, source, start=0, end=None, indent=0):
+        source = tuple(source)
+        self.source = source
+        self.start = start
+        self.end = len(source) if end is None else end
+        self.indent = indent
+        self._trimmed = None
+
+    def trim(self):
+        """ Return the span without the global indent of the lines.
+
+        The global indent is the smallest non-zero indent of the non
+        empty lines (see :func:`~sectiondoc.util.trim_indent`). The
+        trimmed span is computed once.
+
+        """
+        trimmed = self._trimmed
+        if trimmed is not None:
+            return trimmed
+        indent = self.indent
+        indents = set(
+            len(get_indent(line[indent:]))
+            for line in self.source[self.start:self.end]
+            if not is_empty(line[indent:]))
+        indents.discard(0)
+        trimmed = self._trimmed = LineSpan(
+            self.source, self.start, self.end, indent + min(indents))
+        return trimmed
+
+    def lines(self, indent=0, rstrip=False):
+        """ Materialize the lines of the span.
+
+        Arguments
+        ---------
+        indent : int
+            The number of spaces to add in front of the non empty lines.
+
+        rstrip : bool
+            Remove the trailing whitespace of the lines.
+
+        Returns
+        -------
+        lines : list
+            The trimmed and re-indented lines. A source line that already
+            starts with the requested indent is returned without a copy.
+
+        """
+        skip = self.indent
+        prefix = ' ' * indent
+        reuse = indent == skip
+        output = []
+        for line in self.source[self.start:self.end]:
+            if rstrip:
+                line = line.rstrip()
+            # A right stripped line longer than the indent is not empty.
+            if (reuse and len(line) > skip and line.startswith(prefix) and
+                    (rstrip or not is_empty(line))):
+                output.append(line)
+                continue
+            text = line[skip:]
+            if indent != 0 and not is_empty(text):
+                text = prefix + text
+            output.append(text)
+        return output
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __iter__(self):
+        indent = self.indent
+        for line in self.source[self.start:self.end]:
+            yield line[indent:]
+
+    def __repr__(self):
+        return '{0}({1!r}, indent={2})'.format(
+            type(self).__name__, list(self), self.indent)
@@ -1,6 +1,8 @@
+from sectiondoc.items.cache import string_table
 from sectiondoc.items.item import Item
-from sectiondoc.items.regex import function_regex, signature_regex
-from sectiondoc.util import trim_indent
+from sectiondoc.items.line_span import LineSpan
+from sectiondoc.items.scanners import is_method_header
+from sectiondoc.items.regex import signature_regex
 
 
 class MethodItem(Item):
@@ -11,15 +13,17 @@ class MethodItem(Item):
     term : str
         The term usually reflects the name of the method.
 
-    classifiers : list
+    classifiers : tuple
         The classifiers reflect the signature (i.e args and kwargs) of
         the method.
 
-    definition : list
+    definition : tuple
         The list of strings that holds the description the method item.
 
     """
 
+    __slots__ = ()
+
     @property
     def signature(self):
         return '{0}({1})'.format(self.term, ', '.join(self.classifiers))
@@ -35,7 +39,18 @@ class MethodItem(Item):
           +---------------------------------------------+
 
         """
-        return function_regex.match(line)
+        return is_method_header(line)
+
+    @classmethod
+    def parse_definition(cls, span, indent=0):
+        """ Parse the definition from the lines that follow the item header.
+
+        Only the global indention is removed.
+
+        """
+        if len(span) == 0:
+            return ['']
+        return span.trim().lines(indent)
 
     @classmethod
     def parse(cls, lines):
@@ -70,5 +85,6 @@ class MethodItem(Item):
         header = lines[0].strip()
         term, classifiers, _ = signature_regex.split(header)
         classifiers = [classifiers.strip()]
-        definition = trim_indent(lines[1:]) if (len(lines) > 1) else ['']
-        return cls(term, classifiers, definition)
+        return cls.lazy(
+            string_table.intern(term), string_table.intern_all(classifiers),
+            LineSpan(lines, 1))
@@ -1,8 +1,10 @@
 import re
 
 from sectiondoc.items.regex import header_regex
+from sectiondoc.items.cache import string_table
 from sectiondoc.items.item import Item
-from sectiondoc.util import trim_indent
+from sectiondoc.items.line_span import LineSpan
+from sectiondoc.items.scanners import is_or_definition_header
 
 
 definition_regex = re.compile(r"""
@@ -44,12 +46,12 @@ class OrDefinitionItem(Item):
     term : str
         The term usually reflects the name of a parameter or an attribute.
 
-    classifiers : list
+    classifiers : tuple
         The classifiers of the definition. Commonly used to reflect the type
         of an argument or the signature of a function. Only two classifiers
         are accepted.
 
-    definition : list
+    definition : tuple
         The list of strings that holds the description the definition item.
 
     .. note:: An Or Definition item is based on the item of a section definition
@@ -58,6 +60,8 @@ class OrDefinitionItem(Item):
 
     """
 
+    __slots__ = ()
+
     @classmethod
     def is_item(cls, line):
         """ Check if the line is describing a definition item.
@@ -74,7 +78,7 @@ class OrDefinitionItem(Item):
         Subclasses can restrict or expand this format.
 
         """
-        return definition_regex.match(line) is not None
+        return is_or_definition_header(line)
 
     @classmethod
     def parse(cls, lines):
@@ -126,6 +130,6 @@ class OrDefinitionItem(Item):
             classifier.strip() for classifier in classifiers.split('or')]
         if classifiers == ['']:
             classifiers = []
-        trimed_lines = trim_indent(lines[1:]) if (len(lines) > 1) else ['']
-        definition = [line.rstrip() for line in trimed_lines]
-        return Item(term.strip(), classifiers, definition)
+        return cls.lazy(
+            string_table.intern(term.strip()),
+            string_table.intern_all(classifiers), LineSpan(lines, 1))
@@ -0,0 +1,253 @@
+""" Linear time checks of the item header lines.
+
+The item header regexes nest repeated groups and ``(.*)`` signatures, so
+the regex engine can backtrack for a very long time on long header
+lines that almost match. The functions in this module accept exactly
+the same lines as the regexes of the item classes in time proportional
+to the length of the line. The common headers are matched by simpler
+regexes that cannot backtrack, the other lines are scanned for runs of
+characters and the positions where a signature can close.
+
+"""
+import re
+
+word_run_regex = re.compile(r'\w*')
+dotted_run_regex = re.compile(r'[\w.]*')
+space_regex = re.compile(r'\s')
+
+#: The definition item header where the signatures do not contain
+#: parentheses. Every part of the line can be matched in one way only,
+#: thus the regex does not backtrack.
+simple_definition_regex = re.compile(r"""
+\*{0,2}\w+                     # the term
+(
+    \s:\s
+    (
+        [\w.]+                  # dot separated words
+    |
+        \w+\([^()\n]*\)         # a simple signature
+    )
+)*
+$
+""", re.VERBOSE)
+
+#: The or definition item header where the signatures do not contain
+#: parentheses.
+simple_or_definition_regex = re.compile(r"""
+\*{0,2}\w+\s:                  # the term
+(
+    \s
+|
+    \s[\w.]+(\([^()\n]*\))?
+|
+    \s[\w.]+(\([^()\n]*\))?\sor\s[\w.]+(\([^()\n]*\))?
+)?
+$
+""", re.VERBOSE)
+
+#: The any item header of a single line.
+simple_any_regex = re.compile(r'\*{0,2}\w')
+
+#: The method header, the signature ends at the first ``)``.
+method_regex = re.compile(r'\w+\([^)\n]*\)')
+
+
+def is_definition_header(line):
+    """ Check the line for the ``term [ " : " classifier ]*`` header.
+
+    Equivalent to ``definition_item_regex.match(line)`` for lines without
+    trailing whitespace.
+
+    """
+    if simple_definition_regex.match(line) is not None:
+        return True
+    if '(' not in line:
+        return False
+    length = len(line)
+    start = _term_end(line)
+    if start < 0:
+        return False
+    # The positions where the line can continue after a classifier and
+    # the positions that follow an opened signature.
+    reached = bytearray(length + 1)
+    opened = bytearray(length + 1)
+    reached[start] = 1
+    pending = start
+    signature = False
+    for index in range(start, length + 1):
+        if opened[index]:
+            signature = True
+        elif index > pending and not signature:
+            return False
+        if reached[index]:
+            if index == length:
+                return True
+            if (line[index + 1:index + 2] == ':' and
+                    _is_space(line, index) and _is_space(line, index + 2)):
+                first = index + 3
+                end = dotted_run_regex.match(line, first).end()
+                if end > first and _is_space_or_end(line, end):
+                    reached[end] = 1
+                    pending = max(pending, end)
+                end = word_run_regex.match(line, first).end()
+                if end > first:
+                    if _is_space_or_end(line, end):
+                        reached[end] = 1
+                        pending = max(pending, end)
+                    elif line[end] == '(':
+                        opened[end + 1] = 1
+                        pending = max(pending, end + 1)
+        if index < length:
+            character = line[index]
+            if character == '\n':
+                signature = False
+            elif (character == ')' and signature and
+                    _is_space_or_end(line, index + 1)):
+                reached[index + 1] = 1
+                pending = max(pending, index + 1)
+    return False
+
+
+def is_or_definition_header(line):
+    """ Check the line for the ``term : [ classifier [ or classifier ] ]``
+    header.
+
+    Equivalent to ``definition_regex.match(line)``.
+
+    """
+    if simple_or_definition_regex.match(line) is not None:
+        return True
+    if '(' not in line:
+        return False
+    index = _term_end(line)
+    if (index < 0 or not _is_space(line, index) or
+            line[index + 1:index + 2] != ':'):
+        return False
+    index += 2
+    if _is_end(line, index) or (
+            _is_space(line, index) and _is_end(line, index + 1)):
+        return True
+    if not _is_space(line, index):
+        return False
+    index += 1
+    closing = _closing_parentheses(line)
+    if _is_last_classifier(line, index, closing):
+        return True
+    # The first classifier can end at every ``)`` after the signature
+    # opens, thus try the ones that are followed by `` or ``.
+    end = dotted_run_regex.match(line, index).end()
+    if end == index:
+        return False
+    if _is_or_classifier(line, end, closing):
+        return True
+    if line[end:end + 1] != '(':
+        return False
+    newline = line.find('\n', end + 1)
+    if newline < 0:
+        newline = len(line)
+    close = line.find(')', end + 1, newline)
+    while close >= 0:
+        if _is_or_classifier(line, close + 1, closing):
+            return True
+        close = line.find(')', close + 1, newline)
+    return False
+
+
+def is_any_header(line):
+    """ Check the line for the ``term [ " : " text ]`` header.
+
+    Equivalent to ``any_item_regex.match(line)``.
+
+    """
+    if '\n' not in line:
+        return simple_any_regex.match(line) is not None
+    start = _stars_end(line)
+    end = word_run_regex.match(line, start).end()
+    if end == start:
+        return False
+    # A line break can only follow the term or end the line.
+    last = len(line) - 1
+    newline = line.find('\n', start)
+    while newline >= 0:
+        if newline != end and newline != last:
+            return False
+        newline = line.find('\n', newline + 1)
+    return True
+
+
+def is_method_header(line):
+    """ Check the line for the ``term "(" [ classifiers ] ")"`` header.
+
+    Equivalent to ``function_regex.match(line)``.
+
+    """
+    return method_regex.match(line) is not None
+
+
+def _stars_end(line):
+    stars = 0
+    while stars < 2 and line[stars:stars + 1] == '*':
+        stars += 1
+    return stars
+
+
+def _term_end(line):
+    """ Return the end of the term or -1 if the line has no term.
+
+    """
+    start = _stars_end(line)
+    end = word_run_regex.match(line, start).end()
+    return end if end > start else -1
+
+
+def _is_space(line, index):
+    return space_regex.match(line, index) is not None
+
+
+def _is_space_or_end(line, index):
+    return index == len(line) or _is_space(line, index)
+
+
+def _is_end(line, index):
+    """ Check if ``$`` matches at the index.
+
+    """
+    length = len(line)
+    return index == length or (index == length - 1 and line[index] == '\n')
+
+
+def _closing_parentheses(line):
+    """ Return the ``)`` that can close a signature before the end of the
+    line together with the last line break before them.
+
+    """
+    closing = []
+    for close in (len(line) - 1, len(line) - 2):
+        if close >= 0 and line[close] == ')' and _is_end(line, close + 1):
+            closing.append((close, line.rfind('\n', 0, close)))
+    return closing
+
+
+def _is_last_classifier(line, index, closing):
+    """ Check for a ``[\\w.]+(\\(.*\\))?`` classifier that ends the line.
+
+    """
+    end = dotted_run_regex.match(line, index).end()
+    if end == index:
+        return False
+    if _is_end(line, end):
+        return True
+    if line[end:end + 1] != '(':
+        return False
+    return any(
+        close > end and newline <= end for close, newline in closing)
+
+
+def _is_or_classifier(line, index, closing):
+    """ Check for `` or `` followed by the last classifier.
+
+    """
+    return (
+        line[index + 1:index + 3] == 'or' and
+        _is_space(line, index) and _is_space(line, index + 3) and
+        _is_last_classifier(line, index + 4, closing))
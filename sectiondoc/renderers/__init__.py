@@ -5,11 +5,12 @@ __all__ = [
     'Attribute',
     'ListItem',
     'TableRow',
-    'Definition']
+    'Definition',
+    'rendering_cache']
 
 from sectiondoc.renderers.method import Method
 from sectiondoc.renderers.argument import Argument
-from sectiondoc.renderers.renderer import Renderer
+from sectiondoc.renderers.renderer import Renderer, rendering_cache
 from sectiondoc.renderers.attribute import Attribute
 from sectiondoc.renderers.list_item import ListItem
 from sectiondoc.renderers.table_row import TableRow
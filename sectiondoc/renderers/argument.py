@@ -1,18 +1,18 @@
-from sectiondoc.renderers.renderer import Renderer
-from sectiondoc.util import add_indent, fix_star, fix_trailing_underscore
+from sectiondoc.renderers.renderer import TemplateRenderer
+from sectiondoc.util import fix_star, fix_trailing_underscore
 
 
-class Argument(Renderer):
+class Argument(TemplateRenderer):
     """ Render an item as a sphinx parameter role.
 
     """
     templates = {
-        "full": ":param {0}:\n{2}\n:type {0}: {1}",
-        "no_definition": ":param {0}:\n:type {0}: {1}",
-        "no_classifiers": ":param {0}:\n{2}",
-        "only_term": ":param {0}:"}
+        "full": ":param {0}:\n{2}\n:type {0}: {1}\n",
+        "no_definition": ":param {0}:\n:type {0}: {1}\n",
+        "no_classifiers": ":param {0}:\n{2}\n",
+        "only_term": ":param {0}:\n"}
 
-    def to_rst(self):
+    def render_text(self, item):
         """ Render an item as an argument using the ``:param:``
         role.
 
@@ -38,11 +38,9 @@ class Argument(Renderer):
             method.
 
         """
-        item = self.item
         argument = fix_star(item.term)
         argument = fix_trailing_underscore(argument)
         argument_types = ' or '.join(item.classifiers)
-        definition = '\n'.join(add_indent(item.definition))
-        template = self.templates[item.mode].format(
+        definition = '\n'.join(item.indented_definition())
+        return self.templates[item.mode].format(
             argument, argument_types, definition)
-        return template.splitlines()
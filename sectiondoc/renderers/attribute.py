@@ -1,8 +1,7 @@
-from sectiondoc.renderers.renderer import Renderer
-from sectiondoc.util import add_indent
+from sectiondoc.renderers.renderer import TemplateRenderer
 
 
-class Attribute(Renderer):
+class Attribute(TemplateRenderer):
     """ Render an Item instance using the sphinx attribute directive.
 
     """
@@ -13,7 +12,7 @@ class Attribute(Renderer):
         "no_classifiers": ".. attribute:: {0}\n\n{2}\n\n",
         "only_term": ".. attribute:: {0}\n\n"}
 
-    def to_rst(self):
+    def render_text(self, item):
         """ Return the attribute info using the attribute sphinx markup.
 
 
@@ -46,8 +45,6 @@ class Attribute(Renderer):
             by sphinx.
 
         """
-        item = self.item
-        definition = '\n'.join(add_indent(item.definition))
-        template = self.templates[item.mode].format(
+        definition = '\n'.join(item.indented_definition())
+        return self.templates[item.mode].format(
             item.term, ' or '.join(item.classifiers), definition)
-        return template.splitlines()
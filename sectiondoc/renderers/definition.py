@@ -1,5 +1,5 @@
 from sectiondoc.renderers.renderer import Renderer
-from sectiondoc.util import add_indent, NEW_LINE
+from sectiondoc.util import NEW_LINE
 
 
 class Definition(Renderer):
@@ -7,7 +7,7 @@ class Definition(Renderer):
 
     """
 
-    def to_rst(self, **kwards):
+    def render_item(self, item, **kwards):
         """ Outputs the Item in sphinx friendly rst.
 
         The method renders the `definition` into a list of lines that
@@ -43,8 +43,8 @@ class Definition(Renderer):
             by sphinx.
 
         """
-        item = self.item
-        postfix = ' --' if (len(item.definition) > 0) else ''
+        definition = item.indented_definition()
+        postfix = ' --' if (len(definition) > 0) else ''
         lines = []
         lines += [item.term]
         lines += [NEW_LINE]
@@ -55,6 +55,6 @@ class Definition(Renderer):
             lines += [
                 '    *({0[0]} or {0[1]})*{2}'.format(
                     item.classifiers, postfix)]
-        lines += add_indent(item.definition)  # definition is already a list
+        lines += definition  # definition is already a list
         lines += [NEW_LINE]
         return lines
@@ -1,8 +1,7 @@
-from sectiondoc.renderers import Renderer
-from sectiondoc.util import add_indent
+from sectiondoc.renderers.renderer import TemplateRenderer
 
 
-class ListItem(Renderer):
+class ListItem(TemplateRenderer):
     """ Rendered an item instance as an ordered/unordered list item.
 
     """
@@ -14,6 +13,13 @@ class ListItem(Renderer):
         "no_classifiers": "**{0}** --\n{2}\n\n"}
 
     def to_rst(self, prefix=None):
+        """ Outputs the `item` in rst as a list item, see
+        :meth:`render_text`.
+
+        """
+        return self.render_item(self.item, prefix=prefix)
+
+    def render_text(self, item, prefix=None):
         """ Renders an item as items in an rst list.
 
         Arguments
@@ -47,11 +53,10 @@ class ListItem(Renderer):
             by sphinx.
 
         """
-        item = self.item
         indent = 0 if (prefix is None) else len(prefix) + 1
-        definition = '\n'.join(add_indent(item.definition, indent))
+        definition = '\n'.join(item.indented_definition(indent))
         template = self.templates[item.mode].format(
             item.term, ' or '.join(item.classifiers), definition)
         if prefix is not None:
             template = prefix + ' ' + template
-        return template.splitlines()
+        return template
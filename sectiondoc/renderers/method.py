@@ -6,6 +6,13 @@ class Method(Renderer):
     """
 
     def to_rst(self, columns=(0, 0)):
+        """ Outputs the `item` in rst as a line in a table, see
+        :meth:`render_item`.
+
+        """
+        return self.render_item(self.item, columns=columns)
+
+    def render_item(self, item, columns=(0, 0)):
         """ Outputs definition in rst as a line in a table.
 
         Arguments
@@ -28,8 +35,7 @@ class Method(Renderer):
             :meth:`function <function(arg1, arg2)>`  This is the best fun
 
         """
-        item = self.item
-        definition = ' '.join([line.strip() for line in item.definition])
+        definition = ' '.join([line.strip() for line in item.raw_definition])
         method_role = ':meth:`{0}({1}) <{0}>`'.format(
             item.term, ', '.join(item.classifiers))
         table_line = '{0:<{first}}  {1:<{second}}'
@@ -1,23 +1,100 @@
-import abc
+from sectiondoc.cache import LRUCache
+
+
+#: The cache of the rendered items. It is disabled by default, set the
+#: ``maxsize`` to a positive number to enable it.
+rendering_cache = LRUCache(maxsize=0)
 
 
 class Renderer(object):
     """ An item renderer.
+
+    The renderers do not keep any state while rendering, thus a single
+    instance (see :meth:`shared`) can render any number of items from
+    any thread with :meth:`render` and :meth:`render_items`. The ``item``
+    attribute is kept for the :meth:`to_rst` interface.
+
     """
 
     def __init__(self, item=None):
         self.item = item
 
-    @abc.abstractmethod
-    def to_rst(self, **kwards):
-        """ Outputs the `item` in sphinx friendly rst.
+    @classmethod
+    def shared(cls):
+        """ Return the shared instance of the renderer class.
+
+        """
+        renderer = _shared_renderers.get(cls)
+        if renderer is None:
+            renderer = _shared_renderers.setdefault(cls, cls())
+        return renderer
+
+    def render(self, item=None, **options):
+        """ Render the item using the :data:`rendering_cache`.
+
+        When the cache is enabled the lines are cached using the renderer
+        type, the item contents and the options passed to
+        :meth:`render_item` as key.
+
+        Arguments
+        ---------
+        item : Item
+            The item to render. Default is the ``item`` attribute.
+
+        Returns
+        -------
+        lines : list
+            A list of string lines rendered in rst.
+
+        """
+        item = self.item if item is None else item
+        cache = rendering_cache
+        if cache.maxsize == 0:
+            return self.render_item(item, **options)
+        key = (
+            type(self), type(item), item.term, tuple(item.classifiers),
+            tuple(item.definition), tuple(sorted(options.items())))
+        lines = cache.get(key)
+        if lines is None:
+            lines = tuple(self.render_item(item, **options))
+            cache.put(key, lines)
+        return list(lines)
+
+    def render_items(self, items, **options):
+        """ Render a sequence of items into a single list of lines.
+
+        The items are rendered with the same options. When the
+        :data:`rendering_cache` is enabled every item is rendered through
+        :meth:`render`.
+
+        """
+        if rendering_cache.maxsize != 0:
+            lines = []
+            for item in items:
+                lines += self.render(item, **options)
+            return lines
+        return self._render_items(items, **options)
+
+    def render_block(self, items, **options):
+        """ Render a sequence of items into a single block of text.
+
+        Returns
+        -------
+        text : str
+            The rendered lines where every line ends with ``\n``.
+
+        """
+        return ''.join(
+            line + '\n' for line in self.render_items(items, **options))
 
-        The method renders the passed into a list of lines that follow
-        the rst markup.
+    def render_item(self, item, **options):
+        """ Render an item in sphinx friendly rst.
 
         Subclasses need to override the method to provide their custom made
         behaviour. However the signature of the method should hold only
-        keyword arguments which always have default values.
+        keyword arguments which always have default values. The default
+        implementation supports the renderers that only override
+        :meth:`to_rst`.
 
         Returns
         -------
@@ -25,3 +102,71 @@ class Renderer(object):
             A list of string lines rendered in rst.
 
         """
+        if type(self).to_rst == Renderer.to_rst:
+            raise NotImplementedError()
+        return type(self)(item).to_rst(**options)
+
+    def to_rst(self, **options):
+        """ Outputs the `item` in sphinx friendly rst.
+
+        Returns
+        -------
+        lines : list
+            A list of string lines rendered in rst.
+
+        """
+        return self.render_item(self.item, **options)
+
+    def _render_items(self, items, **options):
+        lines = []
+        render_item = self.render_item
+        for item in items:
+            lines += render_item(item, **options)
+        return lines
+
+
+class TemplateRenderer(Renderer):
+    """ A renderer that formats every item into a block of text.
+
+    Subclasses implement :meth:`render_text`. The blocks of a sequence of
+    items are joined once and split into lines at the end, or not at all
+    when the text is rendered with :meth:`render_block`.
+
+    """
+
+    def render_text(self, item, **options):
+        """ Render an item into a block of text lines that ends with a
+        line break.
+
+        """
+        raise NotImplementedError()
+
+    def render_item(self, item, **options):
+        return _split_lines(self.render_text(item, **options))
+
+    def render_block(self, items, **options):
+        if rendering_cache.maxsize != 0:
+            return super(TemplateRenderer, self).render_block(
+                items, **options)
+        # Every text ends with a line break, thus the block ends with an
+        # empty last line once it is split.
+        render_text = self.render_text
+        return ''.join(render_text(item, **options) for item in items)
+
+    def _render_items(self, items, **options):
+        render_text = self.render_text
+        return _split_lines(
+            ''.join(render_text(item, **options) for item in items))
+
+
+def _split_lines(text):
+    # Split at the line breaks like split_chunks does with the rendered
+    # blocks, str.splitlines would also split at other separators (e.g.
+    # u'\u2028' or '\x0c').
+    lines = text.split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    return lines
+
+
+_shared_renderers = {}
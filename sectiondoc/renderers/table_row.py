@@ -7,6 +7,13 @@ class TableRow(Renderer):
     """
 
     def to_rst(self, columns=(0, 0, 0)):
+        """ Outputs the `item` in rst as a line in a table, see
+        :meth:`render_item`.
+
+        """
+        return self.render_item(self.item, columns=columns)
+
+    def render_item(self, item, columns=(0, 0, 0)):
         """ Outputs definition in rst as a line in a table.
 
         Arguments
@@ -28,8 +35,7 @@ class TableRow(Renderer):
         function(arg1, arg2)   This is the best fun
 
         """
-        item = self.item
-        definition = ' '.join([line.strip() for line in item.definition])
+        definition = ' '.join([line.strip() for line in item.raw_definition])
         term = item.term[:columns[0]]
         classifiers = ', '.join(item.classifiers)[:columns[1]]
         definition = definition[:columns[2]]
@@ -20,18 +20,12 @@ def attributes(doc, header, renderer=Attribute, item_class=DefinitionItem):
     header : string
         This parameter is ignored in this method.
 
-    renderer : Renderer
-        A renderer instance to render the items.
+    renderer : type
+        The renderer class, the shared instance renders the items.
 
     item_class : type
         The item parser class to use. Default is :class:`~.orDefinitionItem`.
 
     """
     items = doc.extract_items(item_class)
-    lines = []
-    renderer = renderer()
-    for item in items:
-        renderer.item = item
-        lines += renderer.to_rst()
-    lines.append('')
-    return lines
+    return [renderer.shared().render_block(items)]
@@ -6,7 +6,7 @@
 #  Copyright (c) 2011-14, Enthought, Inc.
 #  All rights reserved.
 # -----------------------------------------------------------------------------
-from sectiondoc.util import add_indent
+from sectiondoc.util import indent_text
 from sectiondoc.items import OrDefinitionItem
 from sectiondoc.renderers import ListItem
 
@@ -22,19 +22,14 @@ def item_list(doc, header, renderer=ListItem, item_class=OrDefinitionItem):
     header : str
         The header name that is used for the fields (i.e. ``:<header>:``).
 
-    renderer : Renderer
-        A renderer instance to render the items.
+    renderer : type
+        The renderer class, the shared instance renders the items.
 
     item_class : type
         The item parser class to use. Default is :class:`~.OrDefinitionItem`.
 
     """
     items = doc.extract_items(item_class)
-    lines = [':{0}:'.format(header.lower())]
     prefix = None if len(items) == 1 else '-'
-    renderer = renderer()
-    for item in items:
-        renderer.item = item
-        lines += add_indent(renderer.to_rst(prefix))
-    lines.append('')
-    return lines
+    block = renderer.shared().render_block(items, prefix=prefix)
+    return [':{0}:'.format(header.lower()), indent_text(block)]
@@ -21,9 +21,6 @@ def methods_table(doc, header, renderer=Method, item_class=MethodItem):
     heading = '{0:<{2}}  {1:<{3}}'.format(
         'Method', 'Description', columns[0], columns[1])
     lines = [border, heading, border]
-    renderer = Method()
-    for item in items:
-        renderer.item = item
-        lines += renderer.to_rst(columns)
+    lines += renderer.shared().render_items(items, columns=columns)
     lines += [border, '', '']
     return [line.rstrip() for line in lines]
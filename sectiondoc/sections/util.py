@@ -7,9 +7,6 @@
 #  Copyright (c) 2011-14, Enthought, Inc.
 #  All rights reserved.
 # -----------------------------------------------------------------------------
-from sectiondoc.items.util import max_attribute_length, max_attribute_index
-
-
 def get_column_lengths(items):
     """ Helper function to estimate the column widths for the refactoring of
     the ``Methods`` section.
@@ -19,6 +16,10 @@ def get_column_lengths(items):
     the same then checks to see which of the two items have the largest
     string sum (i.e. self.term + self.signature).
 
+    The lengths are computed in a single pass over the items from the
+    lengths of the ``term``, ``classifiers`` and ``definition`` fields
+    without formatting the signatures or joining the definitions.
+
     Parameters
     ----------
     items : list
@@ -30,18 +31,29 @@ def get_column_lengths(items):
         A tuple of the first_column and second_column maximum widths.
 
     """
-    name_index = max_attribute_index(items, 'term')
-    signature_index = max_attribute_index(items, 'signature')
-    if signature_index != name_index:
-        index = signature_index
-        item1_width = len(items[index].term + items[index].signature)
-        index = name_index
-        item2_width = len(items[index].term + items[index].signature)
-        first_column = max(item1_width, item2_width)
-    else:
-        index = name_index
-        first_column = len(items[index].term + items[index].signature)
-
+    name_length = signature_length = -1
+    name_widths = signature_widths = None
+    definitions = []
+    for item in items:
+        term_length = len(item.term)
+        classifiers = item.classifiers
+        # The length of the ``term(classifier, classifier)`` signature.
+        signature = term_length + 2 + sum(map(len, classifiers))
+        if len(classifiers) > 1:
+            signature += 2 * (len(classifiers) - 1)
+        if term_length > name_length:
+            name_length = term_length
+            name_widths = term_length + signature
+        if signature > signature_length:
+            signature_length = signature
+            signature_widths = term_length + signature
+        definition = item.definition
+        # The length of ``' '.join(definition)``.
+        definitions.append(
+            sum(map(len, definition)) + len(definition) - 1
+            if definition else 0)
+
+    second_column = max(definitions)
+    first_column = max(name_widths, signature_widths)
     first_column += 11  # Add boilerplate characters
-    second_column = max_attribute_length(items, 'definition')
     return (first_column, second_column)
@@ -1,6 +1,26 @@
 __all__ = [
     'Style',
-    'DocRender']
+    'DocRender',
+    'SinglePassRender',
+    'StreamRender',
+    'IncrementalRender',
+    'SectionMap',
+    'Profiler',
+    'Budget',
+    'BudgetExceeded',
+    'Document',
+    'DocumentParser',
+    'Section',
+    'dump_documents',
+    'load_documents']
 
 from sectiondoc.styles.style import Style
 from sectiondoc.styles.doc_render import DocRender
+from sectiondoc.styles.single_pass_render import SinglePassRender
+from sectiondoc.styles.stream_render import StreamRender
+from sectiondoc.styles.incremental_render import IncrementalRender
+from sectiondoc.styles.section_map import SectionMap
+from sectiondoc.styles.profiler import Profiler
+from sectiondoc.styles.budget import Budget, BudgetExceeded
+from sectiondoc.styles.document import Document, DocumentParser, Section
+from sectiondoc.styles.serialize import dump_documents, load_documents
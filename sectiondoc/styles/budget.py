@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#  file: budget.py
+#  License: LICENSE.TXT
+#
+#  Copyright (c) 2011-14, Enthought, Inc.
+#  All rights reserved.
+# -----------------------------------------------------------------------------
+from timeit import default_timer
+
+
+class BudgetExceeded(RuntimeError):
+    """ Raised when the parsing of a docstring exceeds the budget.
+
+    """
+
+
+class Budget(object):
+    """ The limits of the work spent parsing a single docstring.
+
+    The :class:`~.DocRender` calls :meth:`step` on every iteration of the
+    parse loop (i.e. for every rendered section and every line that is
+    passed through) and for every item block that is read from a
+    section. When one of the limits is exceeded the parsing is
+    aborted with :class:`BudgetExceeded` and the docstring lines are
+    left unchanged.
+
+    Attributes
+    ----------
+    steps : int
+        The maximum number of steps, None for no limit.
+
+    seconds : float
+        The maximum wall-clock time in seconds, None for no limit.
+
+    .. note:: The budget keeps the counters of the docstring that is
+       parsed, thus a budget should not be shared between threads
+       (see :meth:`copy`).
+
+    """
+
+    def __init__(self, steps=None, seconds=None):
+        self.steps = steps
+        self.seconds = seconds
+        self.start()
+
+    def start(self):
+        """ Reset the counters for a new docstring.
+
+        """
+        self.count = 0
+        seconds = self.seconds
+        self._deadline = (
+            None if seconds is None else default_timer() + seconds)
+
+    def step(self):
+        """ Count a step and raise :class:`BudgetExceeded` when one of
+        the limits is exceeded.
+
+        """
+        self.count += 1
+        steps = self.steps
+        if steps is not None and self.count > steps:
+            raise BudgetExceeded(
+                'more than {0} steps'.format(steps))
+        deadline = self._deadline
+        if deadline is not None and default_timer() > deadline:
+            raise BudgetExceeded(
+                'more than {0} seconds'.format(self.seconds))
+
+    def copy(self):
+        """ Return a new budget with the same limits.
+
+        """
+        return type(self)(self.steps, self.seconds)
@@ -6,14 +6,11 @@
 #  Copyright (c) 2011-14, Enthought, Inc.
 #  All rights reserved.
 # -----------------------------------------------------------------------------
-import re
-
-from sectiondoc.items import AnyItem
-from sectiondoc.util import is_empty, get_indent
+from sectiondoc.items import AnyItem, parse_item
+from sectiondoc.util import (
+    is_empty, get_indent, get_section_header, split_chunks)
 from sectiondoc.sections import rubric
-
-
-underline_regex = re.compile(r'\s*\S+\s*\Z')
+from sectiondoc.styles.budget import BudgetExceeded
 
 
 class DocRender(object):
@@ -43,8 +40,14 @@ class DocRender(object):
         the section rendering function and optional values for the item
         renderer and parser.
 
+    budget : Budget
+        Optional limits of the work spent on a docstring (see
+        :class:`~.Budget`). Default is None (i.e. no limits).
+
     """
 
+    budget = None
+
     def __init__(self, lines, sections=None):
         """
 
@@ -61,14 +64,29 @@ class DocRender(object):
             provided the default behaviour of the class is to render
             every section using the rubric rendering function.
 
+        """
+        self.sections = {} if sections is None else sections
+        self.reset(lines)
+
+    def reset(self, lines):
+        """ Prepare the instance to render a new docstring.
+
+        The sections are kept, thus the same instance can be reused for
+        the docstrings that are rendered with the same sections.
+
+        Arguments
+        ---------
+        lines : list
+            The docstring as a list of strings where to render the sections
+
         """
         try:
             self._docstring = lines.splitlines()
         except AttributeError:
             self._docstring = lines
-        self.sections = {} if sections is None else sections
         self.bookmarks = []
         self.index = 0
+        self._headers = {}
 
     def parse(self):
         """ Parse the docstring for sections.
@@ -76,10 +94,29 @@ class DocRender(object):
         The docstring is parsed for sections. If a section is found then
         the corresponding section rendering method is called.
 
+        When the :attr:`budget` is exceeded the parsing is aborted with
+        :class:`~.BudgetExceeded` and the docstring lines are restored.
+
         """
+        budget = self.budget
+        if budget is None:
+            self._parse()
+            return
+        # The lines are changed inplace, a copy is kept to restore them.
+        original = list(self._docstring)
+        budget.start()
+        try:
+            self._parse(budget)
+        except BudgetExceeded:
+            self._docstring[:] = original
+            raise
+
+    def _parse(self, budget=None):
         self.index = 0
         self.seek_to_next_non_empty_line()
         while not self.eod:
+            if budget is not None:
+                budget.step()
             section = self.is_section()
             if len(section) > 0:
                 self._render(section)
@@ -91,7 +128,8 @@ class DocRender(object):
         """ Call the section rendering function.
 
         The header is removed from the docstring and the appropriate
-        rendering function is executed.
+        rendering function is executed. The rendering function returns a
+        list of text chunks, i.e. single lines or lines joined with ``\n``.
 
         """
         self.remove_lines(self.index, 2)  # Remove header
@@ -110,7 +148,8 @@ class DocRender(object):
         the desired type. If successful, the lines that belong to the item
         description block (i.e. item header + item body) are popped out from
         the docstring and passed to the ``item_type.parser`` class method to
-        get a new instance of ``item_type``.
+        get a new instance of ``item_type``. Identical blocks are parsed
+        once and then retrieved from the shared :data:`~.item_cache`.
 
         The process is repeated until there are no compatible ``item_type``
         items found in the section or we run out of docstring lines,
@@ -160,7 +199,7 @@ class DocRender(object):
                 (is_item(self.peek()) or is_item(self.peek(1)))):
             self.remove_if_empty(self.index)
             item_blocks.append(self.get_next_block())
-        return [item_type.parse(block) for block in item_blocks]
+        return [parse_item(item_type, block) for block in item_blocks]
 
     def get_next_block(self):
         """ Get the next item block from the docstring.
@@ -175,52 +214,56 @@ class DocRender(object):
         The end of the field is designated by a line with the same indent
         as the field header or two empty lines in sequence.
 
+        The block is found by looking ahead of the current index and its
+        lines are removed at once (see :meth:`remove_lines`). Every block
+        counts as a step of the :attr:`budget`.
+
         """
-        item_header = self.pop()
+        budget = self.budget
+        if budget is not None:
+            budget.step()
+        if self.eod:
+            raise IndexError('end of the docstring')
+        peek = self.peek
+        item_header = peek()
         sub_indent = get_indent(item_header) + ' '
         block = [item_header]
-        while not self.eod:
-            current = self.peek()
-            next = self.peek(1)
-            if is_empty(current) and is_empty(next):
-                self.seek_to_next_non_empty_line()
-                break
-            elif is_empty(current) and not next.startswith(sub_indent):
-                self.pop()
-                break
-            elif not is_empty(current) and not current.startswith(sub_indent):
+        # Past the end of the docstring peek returns empty lines.
+        count = 1
+        current = peek(1)
+        while True:
+            next = peek(count + 1)
+            if is_empty(current):
+                if is_empty(next) or not next.startswith(sub_indent):
+                    break
+            elif not current.startswith(sub_indent):
                 break
+            block.append(current.rstrip())
+            count += 1
+            current = next
+        self.remove_lines(self.index, count)
+        if is_empty(current) and not self.eod:
+            if is_empty(next):
+                self.seek_to_next_non_empty_line()
             else:
-                line = self.pop()
-                block += [line.rstrip()]
+                self.remove_lines(self.index)
         return block
 
     def is_section(self):
         """ Check if the current line defines a section.
 
-        .. todo:: split and cleanup this method.
+        The result is memorized per line index until the docstring
+        changes.
 
         """
         if self.eod:
             return False
-
-        header = self.peek()
-        line2 = self.peek(1)
-
-        # check for underline type format
-        underline = underline_regex.match(line2)
-        if underline is None:
-            return ''
-        # is the next line an rst section underline?
-        striped_header = header.rstrip()
-        expected_underline1 = re.sub(r'[A-Za-z\\]|\b\s', '-', striped_header)
-        expected_underline2 = re.sub(r'[A-Za-z\\]|\b\s', '=', striped_header)
-        if (
-                (underline.group().rstrip() == expected_underline1) or
-                (underline.group().rstrip() == expected_underline2)):
-            return header.strip()
-        else:
-            return ''
+        index = self.index
+        header = self._headers.get(index)
+        if header is None:
+            header = get_section_header(self.peek(), self.peek(1))
+            self._headers[index] = header
+        return header
 
     def insert_lines(self, lines, index):
         """ Insert lines in the docstring.
@@ -228,7 +271,7 @@ class DocRender(object):
         Arguments
         ---------
         lines : list
-            The list of lines to insert
+            The list of lines (or text chunks) to insert
 
         index : int
             Index to start the insertion
@@ -237,15 +280,16 @@ class DocRender(object):
         docstring = self.docstring
         if len(docstring) < index:
             raise IndexError('index out of bounds')
-        for line in reversed(lines):
-            docstring.insert(index, line)
+        docstring[index:index] = split_chunks(lines)
+        self._headers.clear()
 
     def insert_and_move(self, lines, index):
         """ Insert lines and move the current index to the end.
 
         """
+        size = len(self.docstring)
         self.insert_lines(lines, index)
-        self.index += len(lines)
+        self.index += len(self.docstring) - size
 
     def seek_to_next_non_empty_line(self):
         """ Goto the next non_empty line.
@@ -282,6 +326,7 @@ class DocRender(object):
         """
         docstring = self.docstring
         del docstring[index:(index + count)]
+        self._headers.clear()
 
     def remove_if_empty(self, index=None):
         """ Remove the line from the docstring if it is empty.
@@ -337,6 +382,7 @@ class DocRender(object):
 
         """
         index = self.index if index is None else index
+        self._headers.clear()
         return self._docstring.pop(index)
 
     @property
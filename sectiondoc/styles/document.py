@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#  file: document.py
+#  License: LICENSE.TXT
+#
+#  Copyright (c) 2011-14, Enthought, Inc.
+#  All rights reserved.
+# -----------------------------------------------------------------------------
+from sectiondoc.items import AnyItem, LineSpan
+from sectiondoc.sections import rubric
+from sectiondoc.styles.single_pass_render import SinglePassRender
+from sectiondoc.util import split_chunks
+
+
+class Section(object):
+    """ A parsed docstring section.
+
+    Attributes
+    ----------
+    header : str
+        The section header.
+
+    kind : str
+        What the section function read from the section: ``'items'``
+        (see :meth:`~.DocRender.extract_items`), ``'paragraph'`` (see
+        :meth:`~.DocRender.get_next_paragraph`) or ``'header'`` when
+        only the header was consumed.
+
+    item_type : type
+        The item type of the ``'items'`` sections, None otherwise.
+
+    content : tuple or LineSpan
+        The items of the ``'items'`` sections, the lines of the
+        ``'paragraph'`` sections and an empty tuple otherwise.
+
+    skipped : tuple
+        The empty lines that were passed through while reading the
+        section (e.g. the empty line after the last item), they are
+        placed before the rendered section.
+
+    start : int
+        The offset of the header line in the docstring.
+
+    body : int
+        The offset of the first line after the header (and the empty
+        line that follows it).
+
+    end : int
+        The offset after the last line of the section.
+
+    """
+
+    __slots__ = ('header', 'kind', 'item_type', 'content', 'skipped',
+                 'start', 'body', 'end')
+
+    def __init__(
+            self, header, kind, item_type, content, skipped, start, body,
+            end):
+        self.header = header
+        self.kind = kind
+        self.item_type = item_type
+        self.content = content
+        self.skipped = tuple(skipped)
+        self.start = start
+        self.body = body
+        self.end = end
+
+    def __eq__(self, other):
+        if not isinstance(other, Section):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name in self.__slots__ if name != 'content') and (
+                list(self.content) == list(other.content))
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{0}({1!r}, {2!r}, start={3}, end={4})'.format(
+            type(self).__name__, self.header, self.kind, self.start,
+            self.end)
+
+
+class Document(object):
+    """ A parsed docstring that can be rendered many times.
+
+    The document keeps the docstring lines and splits them into parts,
+    the :class:`Section` instances and the :class:`~.LineSpan` instances
+    of the lines between them that are passed through unchanged.
+
+    Attributes
+    ----------
+    source : tuple
+        The docstring lines.
+
+    parts : list
+        The sections and the spans of the lines between them in the
+        docstring order.
+
+    """
+
+    __slots__ = ('source', 'parts')
+
+    def __init__(self, source, parts):
+        self.source = tuple(source)
+        self.parts = parts
+
+    @property
+    def sections(self):
+        """ The list of the parsed sections.
+
+        """
+        return [part for part in self.parts if isinstance(part, Section)]
+
+    def render(self, sections=None):
+        """ Render the document with the section functions.
+
+        The section functions are called with a proxy of the
+        :class:`~.DocRender` that returns the items or the paragraph
+        that were read when the document was parsed. The functions can
+        use different renderers than the ones used while parsing, but
+        they should read the section in the same way. The lines of a
+        section that are not read are passed through.
+
+        Arguments
+        ---------
+        sections : dict
+            The sections that will be rendered, see :class:`~.DocRender`.
+
+        Returns
+        -------
+        lines : list
+            The rendered docstring lines.
+
+        Raises
+        ------
+        ValueError :
+            When a section function reads the section differently.
+
+        """
+        sections = {} if sections is None else sections
+        source = self.source
+        output = []
+        for part in self.parts:
+            if not isinstance(part, Section):
+                output.extend(part)
+                continue
+            header = part.header
+            method, renderer, item_class = sections.get(
+                header, (rubric, None, None))
+            replay = SectionReplay(part)
+            lines = method(replay, header, renderer, item_class)
+            if replay.consumed:
+                output.extend(part.skipped)
+                output.extend(lines)
+            else:
+                output.extend(lines)
+                output.extend(source[part.body:part.end])
+        return split_chunks(output)
+
+
+class SectionReplay(object):
+    """ Provide the parsed content of a section to a section function.
+
+    """
+
+    def __init__(self, section):
+        self.section = section
+        self.consumed = False
+
+    def extract_items(self, item_type=None):
+        return list(self._read('items'))
+
+    def get_next_paragraph(self):
+        return list(self._read('paragraph'))
+
+    def _read(self, kind):
+        section = self.section
+        if section.kind != kind or self.consumed:
+            raise ValueError(
+                'The {0!r} section was parsed as {1!r}'.format(
+                    section.header, section.kind))
+        self.consumed = True
+        return section.content
+
+
+class _Extracted(BaseException):
+    """ Stop the section function after reading the section.
+
+    It is not an ``Exception`` so that section functions which catch
+    ``Exception`` do not swallow it.
+
+    """
+
+
+class DocumentParser(SinglePassRender):
+    """ Parse a docstring into a :class:`Document` without rendering it.
+
+    The section functions are only used to find out what each section
+    holds. They are called like with :class:`~.SinglePassRender`, but they
+    are stopped at their first call to :meth:`extract_items` or
+    :meth:`get_next_paragraph` and the items or the paragraph are
+    recorded. A section function is expected to read its section with one
+    of these methods (or not at all) before rendering it.
+
+    The docstring lines are not changed.
+
+    Attributes
+    ----------
+    document : Document
+        The document of the last call to :meth:`parse`.
+
+    """
+
+    def reset(self, lines):
+        """ Prepare the instance to parse a new docstring.
+
+        """
+        super(DocumentParser, self).reset(lines)
+        self.document = None
+        self._source = None
+        self._recorded = None
+
+    def parse(self):
+        """ Parse the docstring into a document.
+
+        Returns
+        -------
+        document : Document
+            The parsed docstring.
+
+        """
+        source = self._source = tuple(self._docstring)
+        parts = []
+        budget = self.budget
+        if budget is not None:
+            budget.start()
+        self.output = []
+        self.index = start = 0
+        self.seek_to_next_non_empty_line()
+        while not self.eod:
+            if budget is not None:
+                budget.step()
+            section = self.is_section()
+            if len(section) > 0:
+                if self.index > start:
+                    parts.append(LineSpan(source, start, self.index))
+                parts.append(self._parse_section(section))
+                start = self.index
+            else:
+                self.index += 1
+                self.seek_to_next_non_empty_line()
+        if len(source) > start:
+            parts.append(LineSpan(source, start, len(source)))
+        # The passed through lines are kept in the document.
+        self.output = []
+        self._tokens = None
+        self._source = None
+        self.document = Document(source, parts)
+        return self.document
+
+    def extract_items(self, item_type=None):
+        """ Extract and record the section items.
+
+        """
+        items = super(DocumentParser, self).extract_items(item_type)
+        self._record(
+            'items', AnyItem if item_type is None else item_type,
+            tuple(items))
+
+    def get_next_paragraph(self):
+        """ Get and record the next paragraph.
+
+        """
+        start = self.index
+        super(DocumentParser, self).get_next_paragraph()
+        self._record(
+            'paragraph', None, LineSpan(self._source, start, self.index))
+
+    def _parse_section(self, section):
+        start = self.index
+        self.remove_lines(start, 2)  # Remove header
+        self.remove_if_empty(self.index)  # Remove space after header
+        body = self.index
+        method, renderer, item_class = self.sections.get(
+            section, (rubric, None, None))
+        self._recorded = ('header', None, ())
+        output = self.output
+        mark = len(output)
+        try:
+            method(self, section, renderer, item_class)
+        except _Extracted:
+            pass
+        kind, item_type, content = self._recorded
+        self._recorded = None
+        skipped = output[mark:]
+        return Section(
+            section, kind, item_type, content, skipped, start, body,
+            self.index)
+
+    def _record(self, kind, item_type, content):
+        if self._recorded is None:
+            raise RuntimeError('The sections can only be read while parsing')
+        self._recorded = (kind, item_type, content)
+        raise _Extracted()
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#  file: incremental_render.py
+#  License: LICENSE.TXT
+#
+#  Copyright (c) 2011-14, Enthought, Inc.
+#  All rights reserved.
+# -----------------------------------------------------------------------------
+from sectiondoc.cache import LRUCache
+from sectiondoc.util import split_chunks
+from sectiondoc.styles.single_pass_render import SinglePassRender
+
+
+class IncrementalRender(SinglePassRender):
+    """ Docstring rendering class that reuses the unchanged sections.
+
+    The docstring is split into regions that start at a section header
+    and end at the next boundary, i.e. a section header that follows an
+    empty line, or the end of the docstring. The rendered output of every
+    region is kept in a cache keyed by the lines of the region and of the
+    following header, thus re-rendering an edited docstring only renders
+    the regions that have changed.
+
+    A region is only cached when the rendering stops exactly at the
+    boundary. A section that consumes lines past the boundary is always
+    rendered.
+
+    Attributes
+    ----------
+    regions : LRUCache
+        The rendered regions.
+
+    recomputed : list
+        The headers of the sections that were rendered (and not reused)
+        by the last call to :meth:`parse`.
+
+    """
+
+    def __init__(self, lines=(), sections=None, maxsize=256):
+        """
+
+        Arguments
+        ---------
+        lines : list
+            The docstring as a list of strings where to render the sections
+
+        sections : dict
+            The sections that will be detected and rendered.
+
+        maxsize : int
+            The maximum number of rendered regions to keep.
+
+        """
+        self.regions = LRUCache(maxsize=maxsize)
+        self.recomputed = []
+        super(IncrementalRender, self).__init__(list(lines), sections)
+
+    def rerender(self, old_lines, new_lines):
+        """ Render the new version of a docstring.
+
+        The regions of the old docstring are rendered first (unless they
+        are already cached), so that the unchanged regions of the new
+        docstring are reused. Errors while rendering the old docstring
+        are ignored.
+
+        Arguments
+        ---------
+        old_lines : list
+            The lines of the previous version of the docstring, ``None``
+            if there is no previous version.
+
+        new_lines : list
+            The lines of the new version of the docstring.
+
+        Returns
+        -------
+        lines : list
+            The rendered lines of the new docstring.
+
+        recomputed : list
+            The headers of the sections in the new docstring that were
+            rendered and not reused.
+
+        """
+        if old_lines is not None:
+            self.reset(list(old_lines))
+            try:
+                self.parse()
+            except Exception:
+                # The regions that were rendered before the error are
+                # still cached and the new docstring is rendered anyway.
+                pass
+        lines = list(new_lines)
+        self.reset(lines)
+        self.parse()
+        return lines, list(self.recomputed)
+
+    def parse(self):
+        """ Parse the docstring for sections reusing the cached regions.
+
+        """
+        docstring = self._docstring
+        regions = self.regions
+        output = self.output = []
+        recomputed = self.recomputed = []
+        budget = self.budget
+        if budget is not None:
+            budget.start()
+        # The region that is rendered: (key, end, output position).
+        region = None
+        self.index = 0
+        self.seek_to_next_non_empty_line()
+        while not self.eod:
+            if budget is not None:
+                budget.step()
+            index = self.index
+            if region is not None and index >= region[1]:
+                if index == region[1]:
+                    regions.put(region[0], tuple(output[region[2]:]))
+                region = None
+            section = self.is_section()
+            if len(section) > 0:
+                if region is None:
+                    end = self._next_boundary(index)
+                    key = (
+                        tuple(docstring[index:end + 2]),
+                        end == len(docstring))
+                    rendered = regions.get(key)
+                    if rendered is not None:
+                        output.extend(rendered)
+                        self.index = end
+                        continue
+                    region = (key, end, len(output))
+                recomputed.append(section)
+                self._render(section)
+            else:
+                output.append(docstring[index])
+                self.index += 1
+                self.seek_to_next_non_empty_line()
+        if region is not None and self.index == region[1]:
+            regions.put(region[0], tuple(output[region[2]:]))
+        docstring[:] = split_chunks(output)
+        self._tokens = None
+
+    def _next_boundary(self, index):
+        """ Return the index of the first boundary after the index.
+
+        """
+        tokens = self.tokens
+        blank = tokens.blank
+        length = len(self._docstring)
+        for position in range(index + 1, length - 1):
+            if (blank[position - 1] and not blank[position] and
+                    tokens.section_header(position)):
+                return position
+        return length
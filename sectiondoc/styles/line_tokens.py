@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#  file: line_tokens.py
+#  License: LICENSE.TXT
+#
+#  Copyright (c) 2011-14, Enthought, Inc.
+#  All rights reserved.
+# -----------------------------------------------------------------------------
+from array import array
+
+from sectiondoc.util import get_section_header
+
+
+class LineTokens(object):
+    """ The facts about the docstring lines that the parser needs.
+
+    The lines are classified once and the results are stored in array
+    columns, so that the parser does not need to strip or match the same
+    line again every time it looks at it. The blank flags and the lengths
+    are computed for all the lines at once, the other facts are computed
+    when they are first needed.
+
+    Attributes
+    ----------
+    lines : list
+        The docstring lines. The lines should not change while the tokens
+        are used.
+
+    blank : array
+        Flags the lines that are empty or contain only whitespace.
+
+    length : array
+        The length of the lines without the trailing whitespace.
+
+    indent : array
+        The length of the leading whitespace of the lines (the length of
+        the whole line when it is blank), see :meth:`get_indent`.
+
+    underline : array
+        Flags the lines that hold a single word, i.e. the lines that can
+        be the underline of a section header.
+
+    The ``indent`` and ``underline`` columns are filled on demand, the
+    values that are not computed yet are ``-1``.
+
+    """
+
+    def __init__(self, lines):
+        self.lines = lines
+        count = len(lines)
+        self.length = array('l', [len(line.rstrip()) for line in lines])
+        self.blank = array('b', [size == 0 for size in self.length])
+        self.indent = array('l', [-1]) * count
+        self.underline = array('b', [-1]) * count
+        self._headers = [None] * count
+        self._items = {}
+
+    def get_indent(self, index):
+        """ Return the indent width of the line index.
+
+        """
+        indent = self.indent[index]
+        if indent < 0:
+            line = self.lines[index]
+            indent = self.indent[index] = len(line) - len(line.lstrip())
+        return indent
+
+    def section_header(self, index):
+        """ Return the section header that starts at the line index.
+
+        The result is the same with :func:`~.get_section_header` applied
+        to the line and the next line, the lines are only compared when
+        the next line can be an underline of the same length.
+
+        """
+        header = self._headers[index]
+        if header is None:
+            next = index + 1
+            length = self.length
+            if (next < len(length) and length[index] == length[next] and
+                    self._is_underline(next)):
+                header = get_section_header(
+                    self.lines[index], self.lines[next])
+            else:
+                header = ''
+            self._headers[index] = header
+        return header
+
+    def is_item(self, item_type, index):
+        """ Check if the line index is a header of the item type.
+
+        Past the last line the check is done on an empty line, like with
+        :meth:`~.DocRender.peek`.
+
+        """
+        flags = self._items.get(item_type)
+        if flags is None:
+            flags = self._items[item_type] = array('b', [-1]) * len(self.lines)
+        if index >= len(flags):
+            return bool(item_type.is_item(''))
+        flag = flags[index]
+        if flag < 0:
+            flag = flags[index] = bool(item_type.is_item(self.lines[index]))
+        return flag == 1
+
+    def _is_underline(self, index):
+        underline = self.underline[index]
+        if underline < 0:
+            underline = self.underline[index] = (
+                len(self.lines[index].split()) == 1)
+        return underline == 1
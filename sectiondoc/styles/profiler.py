@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#  file: profiler.py
+#  License: LICENSE.TXT
+#
+#  Copyright (c) 2011-14, Enthought, Inc.
+#  All rights reserved.
+# -----------------------------------------------------------------------------
+import threading
+from timeit import default_timer
+
+
+class Profiler(object):
+    """ Collect timing statistics of the docstring rendering.
+
+    The profiler wraps the methods of a :class:`~.DocRender` instance to
+    measure the time spent in the section detection (``is_section``),
+    the extraction of the section contents (``extract_items`` and
+    ``get_next_paragraph``) and the rendering of the sections
+    (``_render``). The time of each stage excludes the time of the
+    nested stages. The remaining time of the parsing is reported as
+    ``other``.
+
+    Attributes
+    ----------
+    docstrings : int
+        The number of profiled docstrings.
+
+    total : float
+        The total time in seconds spent parsing the docstrings.
+
+    times : dict
+        The time in seconds spent in each stage.
+
+    sections : dict
+        The number of rendered sections per section header.
+
+    slowest : list
+        The ``(seconds, name)`` of the slowest docstrings, slowest first.
+
+    size : int
+        The number of slowest docstrings to keep.
+
+    """
+
+    STAGES = ('detection', 'extraction', 'rendering', 'other')
+
+    def __init__(self, size=10):
+        self.size = size
+        self.docstrings = 0
+        self.total = 0.0
+        self.times = dict.fromkeys(self.STAGES, 0.0)
+        self.sections = {}
+        self.slowest = []
+        self._lock = threading.Lock()
+
+    def profile(self, doc_render, name):
+        """ Parse the docstring of the doc_render and record the timings.
+
+        """
+        times = dict.fromkeys(self.STAGES, 0.0)
+        sections = {}
+        stack = []
+
+        def timed(stage, method):
+            def wrapper(*args, **kwargs):
+                stack.append(0.0)
+                start = default_timer()
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    elapsed = default_timer() - start
+                    times[stage] += elapsed - stack.pop()
+                    if stack:
+                        stack[-1] += elapsed
+            return wrapper
+
+        render = doc_render._render
+
+        def count_section(section):
+            sections[section] = sections.get(section, 0) + 1
+            return render(section)
+
+        doc_render.is_section = timed('detection', doc_render.is_section)
+        doc_render.extract_items = timed(
+            'extraction', doc_render.extract_items)
+        doc_render.get_next_paragraph = timed(
+            'extraction', doc_render.get_next_paragraph)
+        doc_render._render = timed('rendering', count_section)
+        start = default_timer()
+        try:
+            doc_render.parse()
+        finally:
+            total = default_timer() - start
+            # Restore the methods since the renderers can be reused.
+            for method in (
+                    'is_section', 'extract_items', 'get_next_paragraph',
+                    '_render'):
+                delattr(doc_render, method)
+        times['other'] = total - sum(times.values())
+        self.record(name, total, times, sections)
+
+    def record(self, name, total, times, sections):
+        """ Add the timings of a docstring.
+
+        """
+        with self._lock:
+            self.docstrings += 1
+            self.total += total
+            for stage, elapsed in times.items():
+                self.times[stage] += elapsed
+            for section, count in sections.items():
+                self.sections[section] = self.sections.get(section, 0) + count
+            self._add_slowest([(total, name)])
+
+    def merge(self, other):
+        """ Add the statistics of another profiler.
+
+        """
+        with self._lock:
+            self.docstrings += other.docstrings
+            self.total += other.total
+            for stage, elapsed in other.times.items():
+                self.times[stage] += elapsed
+            for section, count in other.sections.items():
+                self.sections[section] = self.sections.get(section, 0) + count
+            self._add_slowest(other.slowest)
+
+    def summary(self):
+        """ Return the report of the collected statistics as a list of lines.
+
+        """
+        total = self.total
+        lines = [
+            'sectiondoc: parsed {0} docstrings in {1:.3f}s'.format(
+                self.docstrings, total),
+            '',
+            '{0:<40} {1:>10} {2:>8}'.format('Stage', 'Seconds', 'Share')]
+        for stage in self.STAGES:
+            elapsed = self.times[stage]
+            share = 100.0 * elapsed / total if total > 0 else 0.0
+            lines.append('{0:<40} {1:>10.4f} {2:>7.1f}%'.format(
+                stage, elapsed, share))
+        lines += ['', '{0:<40} {1:>10}'.format('Section', 'Count')]
+        for section, count in sorted(
+                self.sections.items(), key=lambda item: (-item[1], item[0])):
+            lines.append('{0:<40} {1:>10}'.format(section, count))
+        lines += ['', '{0:<40} {1:>10}'.format('Slowest docstring', 'Seconds')]
+        for elapsed, name in self.slowest:
+            lines.append('{0:<40} {1:>10.4f}'.format(name, elapsed))
+        return lines
+
+    def _add_slowest(self, entries):
+        slowest = self.slowest
+        slowest.extend(entries)
+        slowest.sort(key=lambda entry: entry[0], reverse=True)
+        del slowest[self.size:]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#  file: section_map.py
+#  License: LICENSE.TXT
+#
+#  Copyright (c) 2011-14, Enthought, Inc.
+#  All rights reserved.
+# -----------------------------------------------------------------------------
+try:
+    from collections.abc import Mapping
+except ImportError:  # Python 2
+    from collections import Mapping
+
+
+def normalize_header(header):
+    """ Return the lookup form of a section header.
+
+    The header is lower cased and the whitespace is collapsed to single
+    spaces.
+
+    """
+    return ' '.join(header.split()).lower()
+
+
+class SectionMap(Mapping):
+    """ An immutable map of the section headers to their rendering.
+
+    The map is created once and shared between the :class:`~.DocRender`
+    instances. It maps the section headers to the tuple of the section
+    rendering function and the optional item renderer and item class.
+    A header that is not found is looked up again in normalized form
+    (see :func:`normalize_header`), so that ``'PARAMETERS'`` or
+    ``'Other  Parameters'`` are rendered like ``'Parameters'`` and
+    ``'Other Parameters'``.
+
+    """
+
+    def __init__(self, sections):
+        self._sections = dict(sections)
+        normalized = {}
+        for header in sorted(self._sections):
+            normalized.setdefault(
+                normalize_header(header), self._sections[header])
+        self._normalized = normalized
+
+    def get(self, header, default=None):
+        try:
+            return self._sections[header]
+        except KeyError:
+            return self._normalized.get(normalize_header(header), default)
+
+    def __getitem__(self, header):
+        value = self.get(header, self)
+        if value is self:
+            raise KeyError(header)
+        return value
+
+    def __contains__(self, header):
+        return self.get(header, self) is not self
+
+    def __iter__(self):
+        return iter(self._sections)
+
+    def __len__(self):
+        return len(self._sections)
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, self._sections)
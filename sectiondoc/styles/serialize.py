@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#  file: serialize.py
+#  License: LICENSE.TXT
+#
+#  Copyright (c) 2011-14, Enthought, Inc.
+#  All rights reserved.
+# -----------------------------------------------------------------------------
+""" Store parsed documents in a compact binary format.
+
+The data starts with the ``SDOC`` magic and the format version (an
+unsigned short) followed by the :mod:`marshal` dump of::
+
+    (strings, item types, documents)
+
+All the strings (docstring lines, headers, terms, classifiers and
+definition lines) are kept once in the ``strings`` table and the
+documents refer to them by index, as they refer to the item types (kept
+as ``module:class`` names). A document is the tuple of the string
+indices of its source lines and of its parts. A part that is passed
+through is a ``(start, end)`` span of the source lines and a section is
+the tuple::
+
+    (header, kind, item type, content, skipped, start, body, end)
+
+where the ``content`` is a tuple of ``(item type, term, classifiers,
+definition, lazy)`` items, a ``(start, end)`` span of the paragraph lines
+or an empty tuple. The item type of the sections without items is
+``-1``. The definition of a lazy item (see :meth:`~.Item.lazy`) that is
+not parsed yet is stored as the raw lines, which are mostly the same
+strings as the docstring lines, and it is parsed again on first access
+after loading.
+
+"""
+import marshal
+import struct
+import sys
+
+from sectiondoc.items import Item, LineSpan, string_table
+from sectiondoc.styles.document import Document, Section
+
+#: The version of the binary format, it changes when the layout changes.
+FORMAT_VERSION = 1
+
+MAGIC = b'SDOC'
+
+_header = struct.Struct('<4sH')
+
+#: The marshal version that is readable by all the supported pythons.
+_MARSHAL_VERSION = 2
+
+
+def dump_documents(documents):
+    """ Serialize the parsed documents.
+
+    Arguments
+    ---------
+    documents : list
+        The :class:`~.Document` instances.
+
+    Returns
+    -------
+    data : bytes
+        The serialized documents.
+
+    """
+    strings = {}
+    types = {}
+
+    def string(value):
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    def item_type(cls):
+        if cls is None:
+            return -1
+        index = types.get(cls)
+        if index is None:
+            index = types[cls] = len(types)
+        return index
+
+    def item_record(item):
+        lines = item.raw_definition
+        lazy = isinstance(lines, LineSpan)
+        return (
+            item_type(type(item)), string(item.term),
+            tuple(map(string, item.classifiers)), tuple(map(string, lines)),
+            int(lazy))
+
+    records = []
+    for document in documents:
+        parts = []
+        for part in document.parts:
+            if not isinstance(part, Section):
+                parts.append((part.start, part.end))
+                continue
+            if part.kind == 'items':
+                content = tuple(map(item_record, part.content))
+            elif part.kind == 'paragraph':
+                content = (part.content.start, part.content.end)
+            else:
+                content = ()
+            parts.append((
+                string(part.header), string(part.kind),
+                item_type(part.item_type), content,
+                tuple(map(string, part.skipped)),
+                part.start, part.body, part.end))
+        records.append((tuple(map(string, document.source)), tuple(parts)))
+
+    strings = sorted(strings, key=strings.get)
+    types = [
+        '{0}:{1}'.format(cls.__module__, cls.__name__)
+        for cls in sorted(types, key=types.get)]
+    payload = (tuple(strings), tuple(types), tuple(records))
+    return (
+        _header.pack(MAGIC, FORMAT_VERSION) +
+        marshal.dumps(payload, _MARSHAL_VERSION))
+
+
+def load_documents(data):
+    """ Load the documents that were serialized with :func:`dump_documents`.
+
+    The terms and classifiers of the items are added to the shared
+    :data:`~.string_table`, identical items are loaded once. The modules
+    of the item types are not imported, the custom item types should be
+    imported before loading the documents.
+
+    Arguments
+    ---------
+    data : bytes
+        The serialized documents.
+
+    Returns
+    -------
+    documents : list
+        The :class:`~.Document` instances.
+
+    Raises
+    ------
+    ValueError :
+        When the data are not serialized documents of the current format
+        version, or when they are truncated or corrupted.
+
+    """
+    size = _header.size
+    try:
+        magic, version = _header.unpack(data[:size])
+    except struct.error:
+        raise ValueError('The data are not serialized documents')
+    if magic != MAGIC:
+        raise ValueError('The data are not serialized documents')
+    if version != FORMAT_VERSION:
+        raise ValueError(
+            'Unsupported format version {0} (expected {1})'.format(
+                version, FORMAT_VERSION))
+    try:
+        return _load_payload(marshal.loads(data[size:]))
+    except (EOFError, IndexError, TypeError, ValueError) as error:
+        # Truncated data or a payload of the wrong shape.
+        raise ValueError(
+            'The serialized documents are corrupted: {0}'.format(error))
+
+
+def _load_payload(payload):
+    strings, types, records = payload
+    types = [_find_item_type(name) for name in types]
+    intern = string_table.intern
+    interned = {}
+    items = {}
+
+    def term(index):
+        value = interned.get(index)
+        if value is None:
+            value = interned[index] = intern(strings[index])
+        return value
+
+    def item(record):
+        value = items.get(record)
+        if value is None:
+            type_index, term_index, classifiers, lines, lazy = record
+            cls = types[type_index]
+            lines = [strings[index] for index in lines]
+            classifiers = [term(index) for index in classifiers]
+            if lazy:
+                value = cls.lazy(term(term_index), classifiers, lines)
+            else:
+                value = cls(term(term_index), classifiers, lines)
+            items[record] = value
+        return value
+
+    documents = []
+    for lines, records in records:
+        source = tuple([strings[index] for index in lines])
+        parts = []
+        for record in records:
+            if len(record) == 2:
+                parts.append(LineSpan(source, record[0], record[1]))
+                continue
+            header, kind, type_index, content, skipped, start, body, end = (
+                record)
+            kind = strings[kind]
+            if kind == 'items':
+                content = tuple([item(entry) for entry in content])
+            elif kind == 'paragraph':
+                content = LineSpan(source, content[0], content[1])
+            parts.append(Section(
+                strings[header], kind,
+                None if type_index < 0 else types[type_index], content,
+                [strings[index] for index in skipped], start, body, end))
+        documents.append(Document(source, parts))
+    return documents
+
+
+def _find_item_type(name):
+    # The item types are only looked up in the modules that are already
+    # imported, the data should not import (i.e. run) any module.
+    module_name, _, class_name = str(name).partition(':')
+    module = sys.modules.get(module_name)
+    cls = getattr(module, class_name, None)
+    if not (isinstance(cls, type) and issubclass(cls, Item)):
+        raise ValueError('Unknown item type {0!r}'.format(name))
+    return cls
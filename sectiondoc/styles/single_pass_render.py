@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#  file: single_pass_render.py
+#  License: LICENSE.TXT
+#
+#  Copyright (c) 2011-14, Enthought, Inc.
+#  All rights reserved.
+# -----------------------------------------------------------------------------
+from sectiondoc.items import AnyItem, parse_item
+from sectiondoc.util import split_chunks
+from sectiondoc.styles.doc_render import DocRender
+from sectiondoc.styles.line_tokens import LineTokens
+
+
+class SinglePassRender(DocRender):
+    """ Docstring rendering class that renders in a single pass.
+
+    The :class:`~.DocRender` renders the sections by changing the list of
+    lines inplace (i.e. popping, removing and inserting lines), which
+    costs a shift of the remaining lines on every change. This class
+    reads the docstring lines with a cursor and appends the result to a
+    separate output buffer. The rendered sections are kept in the buffer
+    as text chunks, the lines are only materialized once when the
+    docstring list is updated at the end of :meth:`parse`.
+
+    The section rendering functions use the same interface as with
+    :class:`~.DocRender`. Lines that are popped or removed at the current
+    index are consumed, while lines that the index moves over are copied
+    to the output. Changes are only allowed at the current index and
+    the index cannot move backwards, thus :meth:`goto_bookmark` only
+    moves forward (i.e. to a bookmark at or after the current index).
+
+    Since the docstring does not change while it is parsed, the lines are
+    classified once into :class:`~.LineTokens` and the parser uses the
+    tokens instead of checking the same line strings again.
+
+    Attributes
+    ----------
+    output : list
+        The rendered lines and text chunks that have been collected so far.
+
+    """
+
+    def reset(self, lines):
+        """ Prepare the instance to render a new docstring.
+
+        """
+        super(SinglePassRender, self).reset(lines)
+        self.output = []
+        self._tokens = None
+
+    @property
+    def tokens(self):
+        """ The :class:`~.LineTokens` of the docstring lines.
+
+        """
+        tokens = self._tokens
+        if tokens is None:
+            tokens = self._tokens = LineTokens(self._docstring)
+        return tokens
+
+    def parse(self):
+        """ Parse the docstring for sections.
+
+        The docstring is parsed for sections. If a section is found then
+        the corresponding section rendering method is called. When done
+        the docstring lines are replaced with the rendered output, thus
+        the lines are not changed when the :attr:`budget` is exceeded.
+
+        """
+        docstring = self._docstring
+        output = self.output = []
+        budget = self.budget
+        if budget is not None:
+            budget.start()
+        self.index = 0
+        self.seek_to_next_non_empty_line()
+        while not self.eod:
+            if budget is not None:
+                budget.step()
+            section = self.is_section()
+            if len(section) > 0:
+                self._render(section)
+            else:
+                output.append(docstring[self.index])
+                self.index += 1
+                self.seek_to_next_non_empty_line()
+        docstring[:] = split_chunks(output)
+        self._tokens = None
+
+    def insert_lines(self, lines, index):
+        """ Append lines to the output.
+
+        Arguments
+        ---------
+        lines : list
+            The list of lines (or text chunks) to insert
+
+        index : int
+            Index to start the insertion, it should always be the current
+            index.
+
+        """
+        self._check_index(index)
+        self.output.extend(lines)
+
+    def insert_and_move(self, lines, index):
+        """ Append lines to the output.
+
+        The current index is already past the inserted lines so it does not
+        move.
+
+        """
+        self.insert_lines(lines, index)
+
+    def seek_to_next_non_empty_line(self):
+        """ Goto the next non_empty line copying the empty lines to the output.
+
+        """
+        docstring = self._docstring
+        blank = self.tokens.blank
+        output = self.output
+        index = self.index
+        length = len(docstring)
+        while index < length and blank[index]:
+            output.append(docstring[index])
+            index += 1
+        self.index = index
+
+    def is_section(self):
+        """ Check if the current line defines a section.
+
+        """
+        index = self.index
+        if index >= len(self._docstring):
+            return False
+        return self.tokens.section_header(index)
+
+    def extract_items(self, item_type=None):
+        """ Extract the section items from a docstring.
+
+        See :meth:`DocRender.extract_items`, the item headers are checked
+        once per line and item type.
+
+        """
+        item_type = AnyItem if item_type is None else item_type
+        is_item = self.tokens.is_item
+        item_blocks = []
+        while (
+                not self.is_section() and
+                (is_item(item_type, self.index) or
+                 is_item(item_type, self.index + 1))):
+            self.remove_if_empty(self.index)
+            item_blocks.append(self.get_next_block())
+        return [parse_item(item_type, block) for block in item_blocks]
+
+    def get_next_block(self):
+        """ Get the next item block from the docstring.
+
+        See :meth:`DocRender.get_next_block`, the end of the block is found
+        using the blank flags of the lines.
+
+        """
+        budget = self.budget
+        if budget is not None:
+            budget.step()
+        docstring = self._docstring
+        tokens = self.tokens
+        blank = tokens.blank
+        start = self.index
+        length = len(docstring)
+        if start >= length:
+            raise IndexError('end of the docstring')
+        item_header = docstring[start]
+        sub_indent = item_header[:tokens.get_indent(start)] + ' '
+        block = [item_header]
+        index = start + 1
+        while index < length:
+            if blank[index]:
+                next = index + 1
+                if (next >= length or blank[next] or
+                        not docstring[next].startswith(sub_indent)):
+                    break
+            elif not docstring[index].startswith(sub_indent):
+                break
+            block.append(docstring[index].rstrip())
+            index += 1
+        self.index = index
+        if index < length and blank[index]:
+            if index + 1 >= length or blank[index + 1]:
+                self.seek_to_next_non_empty_line()
+            else:
+                self.index += 1
+        return block
+
+    def get_next_paragraph(self):
+        """ Get the next paragraph designated by an empty line.
+
+        """
+        docstring = self._docstring
+        blank = self.tokens.blank
+        start = index = self.index
+        length = len(docstring)
+        while index < length and not blank[index]:
+            index += 1
+        self.index = index
+        return docstring[start:index]
+
+    def remove_lines(self, index, count=1):
+        """ Consume the lines without copying them to the output.
+
+        """
+        self._check_index(index)
+        self.index = min(index + count, len(self._docstring))
+
+    def pop(self, index=None):
+        """ Consume a line without copying it to the output.
+
+        """
+        if index is not None:
+            self._check_index(index)
+        return self.read()
+
+    def goto_bookmark(self, bookmark_index=-1):
+        """ Move forward to bookmark copying the lines to the output.
+
+        See :meth:`DocRender.goto_bookmark`, the bookmark cannot be before
+        the current index.
+
+        """
+        bookmark = self.bookmarks[bookmark_index]
+        index = self.index
+        if bookmark < index:
+            raise IndexError(
+                'Cannot move back to the bookmark ({0}) from the current '
+                'index ({1})'.format(bookmark, index))
+        output = self.output
+        read = self.read
+        for _ in range(bookmark - index):
+            output.append(read())
+        return self.bookmarks.pop(bookmark_index)
+
+    def _check_index(self, index):
+        if index != self.index:
+            raise IndexError(
+                'Lines can only change at the current index ({0})'.format(
+                    self.index))
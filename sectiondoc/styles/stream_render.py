@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+#  file: stream_render.py
+#  License: LICENSE.TXT
+#
+#  Copyright (c) 2011-14, Enthought, Inc.
+#  All rights reserved.
+# -----------------------------------------------------------------------------
+from collections import deque
+from itertools import islice
+
+from sectiondoc.util import is_empty, split_chunks
+from sectiondoc.styles.doc_render import DocRender
+from sectiondoc.styles.single_pass_render import SinglePassRender
+
+
+class StreamRender(SinglePassRender):
+    """ Docstring rendering class that renders a stream of lines.
+
+    The renderer accepts any iterable of lines (e.g. a generator reading
+    a file) and yields the rendered lines lazily from :meth:`render`.
+    The parser only looks a couple of lines ahead of the current index,
+    thus the lines are read into a small lookahead window and dropped
+    as soon as the index moves past them. The memory use does not depend
+    on the length of the docstring but only on the size of the largest
+    section, since a section is rendered from all its items at once.
+
+    The :attr:`index` is the absolute line number in the stream. Like
+    with the :class:`~.SinglePassRender` the index only moves forward.
+    The lines are not known in advance, thus the parser checks the lines
+    in the window like the :class:`~.DocRender` instead of using the
+    :class:`~.LineTokens`.
+
+    """
+
+    is_section = DocRender.__dict__['is_section']
+    extract_items = DocRender.__dict__['extract_items']
+    get_next_block = DocRender.__dict__['get_next_block']
+    get_next_paragraph = DocRender.__dict__['get_next_paragraph']
+
+    def reset(self, lines):
+        """ Prepare the instance to render a new stream of lines.
+
+        """
+        self._window = deque()
+        self._index = 0
+        super(StreamRender, self).reset(lines)
+        self._lines = iter(self._docstring)
+
+    def render(self):
+        """ Parse the docstring for sections and yield the rendered lines.
+
+        The stream is consumed by the generator, so the rendering can
+        only take place once. When the :attr:`budget` is exceeded the
+        generator raises :class:`~.BudgetExceeded`, the lines that are
+        already yielded cannot be restored.
+
+        """
+        output = self.output = []
+        budget = self.budget
+        if budget is not None:
+            budget.start()
+        self.seek_to_next_non_empty_line()
+        while not self.eod:
+            if budget is not None:
+                budget.step()
+            section = self.is_section()
+            if len(section) > 0:
+                self._render(section)
+            else:
+                output.append(self.read())
+                self.seek_to_next_non_empty_line()
+            if output:
+                for line in split_chunks(output):
+                    yield line
+                del output[:]
+        for line in split_chunks(output):
+            yield line
+
+    def parse(self):
+        """ Parse the docstring for sections.
+
+        When the renderer was created from a list of lines the list is
+        updated with the rendered lines. The rendered lines are always
+        available in :attr:`output`.
+
+        """
+        output = list(self.render())
+        if isinstance(self._docstring, list):
+            self._docstring[:] = output
+        self.output = output
+
+    def seek_to_next_non_empty_line(self):
+        """ Goto the next non_empty line copying the empty lines to the output.
+
+        """
+        window = self._window
+        output = self.output
+        while self._fill(0) and is_empty(window[0]):
+            output.append(window[0])
+            self.index += 1
+
+    def read(self):
+        """ Return the next line and advance the index.
+
+        """
+        if not self._fill(0):
+            raise IndexError('end of the docstring stream')
+        line = self._window[0]
+        self.index += 1
+        return line
+
+    def remove_lines(self, index, count=1):
+        """ Consume the lines without copying them to the output.
+
+        """
+        self._check_index(index)
+        self.index = index + count
+
+    def remove_if_empty(self, index=None):
+        """ Consume the line if it is empty.
+
+        """
+        index = self.index if index is None else index
+        self._check_index(index)
+        if not self._fill(0):
+            raise IndexError('end of the docstring stream')
+        if is_empty(self._window[0]):
+            self.remove_lines(index)
+
+    def peek(self, ahead=0):
+        """ Peek ahead a number of lines
+
+        Returns an empty string when the stream ends before the line.
+
+        """
+        if self._fill(ahead):
+            return self._window[ahead]
+        return ''
+
+    @property
+    def eod(self):
+        """ End of docstring.
+
+        """
+        return not self._fill(0)
+
+    @property
+    def index(self):
+        """ The absolute line number of the current line in the stream.
+
+        Moving the index forward drops the lines that it moves past, lines
+        that were never read are skipped until the end of the stream.
+
+        """
+        return self._index
+
+    @index.setter
+    def index(self, value):
+        count = value - self._index
+        if count == 0:
+            return
+        if count < 0:
+            raise IndexError('The stream renderer cannot move backwards')
+        window = self._window
+        buffered = min(count, len(window))
+        for _ in range(buffered):
+            window.popleft()
+        skipped = sum(1 for _ in islice(self._lines, count - buffered))
+        self._index += buffered + skipped
+        self._headers.clear()
+
+    def _fill(self, ahead):
+        """ Read lines until the window holds the line that is ``ahead``
+        of the index, return False when the stream ends before it.
+
+        """
+        window = self._window
+        lines = self._lines
+        while len(window) <= ahead:
+            for line in lines:
+                window.append(line)
+                break
+            else:
+                return False
+        return True
@@ -1,10 +1,494 @@
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import threading
+
+import sectiondoc
+from sectiondoc.cache import LRUCache
+from sectiondoc.items import string_table
+from sectiondoc.renderers import rendering_cache
+from sectiondoc.styles.budget import Budget, BudgetExceeded
+from sectiondoc.styles.doc_render import DocRender
+from sectiondoc.styles.document import DocumentParser
+from sectiondoc.styles.profiler import Profiler
+from sectiondoc.styles.section_map import SectionMap
+from sectiondoc.styles.stream_render import StreamRender
+from sectiondoc.util import has_section_headers
+
+
+CACHE_FILENAME = 'sectiondoc.cache'
+
+logger = logging.getLogger('sphinx.sectiondoc')
+
+#: Marks the factories that do not share their sections.
+_NOT_SHARED = object()
+
+
 class Style(object):
+    """ Docstring rendering style.
+
+    The style maps the object types provided by autodoc to the
+    :class:`~.DocRender` factories that render their docstrings.
+
+    Attributes
+    ----------
+    rendering_map : dict
+        Maps the autodoc object type (e.g. ``'class'``) to a factory
+        returning the :class:`~.DocRender` for the docstring lines.
+
+    cache : LRUCache
+        Optional cache of the rendered docstrings. The cache is keyed by
+        the style identity, the object type, the hash of the input lines
+        and the sectiondoc version. Default is None (i.e. no caching).
+
+    profiler : Profiler
+        Optional profiler that collects the timings of the docstring
+        rendering. Default is None (i.e. no profiling).
 
-    def __init__(self, rendering_map):
+    budget : Budget
+        Optional limits of the work spent on a single docstring. The
+        docstrings that exceed the budget are left unchanged and their
+        names are added to :attr:`exceeded`. Default is None (i.e. no
+        limits).
+
+    exceeded : list
+        The names of the docstrings that exceeded the budget.
+
+    .. note:: The :class:`~.DocRender` instances are reused between the
+       docstrings of the same factory (see :meth:`~.DocRender.reset`)
+       and they are kept per thread. The caches are thread safe, thus
+       the same style can be used from multiple threads or forked
+       processes.
+
+    """
+
+    def __init__(
+            self, rendering_map, cache=None, profiler=None, budget=None):
         self.rendering_map = rendering_map
+        self.cache = cache
+        self.profiler = profiler
+        self.budget = budget
+        self.exceeded = []
+        self._local = threading.local()
+
+    @property
+    def rendering_map(self):
+        return self._rendering_map
+
+    @rendering_map.setter
+    def rendering_map(self, rendering_map):
+        self._rendering_map = rendering_map
+        self._identity = None
+
+    @property
+    def identity(self):
+        """ A string that identifies the rendering map between builds.
+
+        The identity is a digest of the factories, of the section
+        functions, renderers and item classes of their sections and of
+        the source code of the modules that define them, so it changes
+        when the code changes. It is computed once for the
+        :attr:`rendering_map`, thus the map should be replaced rather than
+        changed in place.
+
+        """
+        identity = self._identity
+        if identity is None:
+            identity = self._identity = _fingerprint(self._rendering_map)
+        return identity
 
     def render_docstring(self, app, what, name, obj, options, lines):
         renderer_factory = self.rendering_map.get(what, None)
-        if renderer_factory is not None:
-            docstring_renderer = renderer_factory(lines)
+        # Docstrings without section headers are left unchanged by the
+        # renderers, a quick scan of the lines avoids parsing them.
+        if renderer_factory is not None and has_section_headers(lines):
+            cache = self.cache
+            if cache is None:
+                self._parse(
+                    app, name, self._get_renderer(renderer_factory, lines))
+                return
+            key = self.cache_key(what, lines)
+            rendered = cache.get(key)
+            if rendered is None:
+                if not self._parse(
+                        app, name,
+                        self._get_renderer(renderer_factory, lines)):
+                    return
+                rendered = tuple(lines)
+                cache.put(key, rendered)
+                self._record(app, key, rendered)
+            else:
+                lines[:] = rendered
+
+    def iter_rendered(self, what, lines):
+        """ Return an iterator over the rendered lines of a docstring.
+
+        The docstring lines can be any iterable, they are read lazily by a
+        :class:`~.StreamRender` using the sections of the object type
+        factory. The cache and the profiler are not used.
+
+        """
+        renderer_factory = self.rendering_map.get(what, None)
+        if renderer_factory is None:
+            return iter(lines)
+        sections = renderer_factory([]).sections
+        return StreamRender(lines, sections=sections).render()
+
+    def parse_document(self, what, lines):
+        """ Parse the docstring lines into a :class:`~.Document`.
+
+        The document is parsed with the sections of the object type
+        factory and can be rendered many times (see
+        :meth:`render_document`). The lines are not changed. Returns None
+        when the object type is not rendered by the style.
+
+        """
+        renderer_factory = self.rendering_map.get(what, None)
+        if renderer_factory is None:
+            return None
+        sections = renderer_factory([]).sections
+        return DocumentParser(lines, sections=sections).parse()
+
+    def render_document(self, what, document):
+        """ Render a parsed :class:`~.Document` with the sections of the
+        object type factory and return the rendered lines.
+
+        """
+        renderer_factory = self.rendering_map.get(what, None)
+        if renderer_factory is None:
+            return list(document.source)
+        return document.render(renderer_factory([]).sections)
+
+    def cache_key(self, what, lines):
+        """ Return the render cache key for the docstring lines.
+
+        """
+        digest = hashlib.sha1(
+            u'\n'.join(lines).encode('utf-8')).hexdigest()
+        return (self.identity, what, digest, sectiondoc.__version__)
+
+    def setup(self, app):
+        """ Connect the style to the sphinx application.
+
+        Returns
+        -------
+        metadata : dict
+            The extension metadata. The style can be used by parallel
+            builds; rendered docstrings that are added to the cache while
+            reading in parallel are merged back through the
+            ``env-merge-info`` event.
+
+        """
+        app.setup_extension('sphinx.ext.autodoc')
+        app.add_config_value('sectiondoc_cache', False, 'env')
+        app.add_config_value('sectiondoc_cache_size', 10000, 'env')
+        app.add_config_value('sectiondoc_rendering_cache_size', 0, 'env')
+        app.add_config_value('sectiondoc_profile', False, '')
+        app.add_config_value('sectiondoc_budget_steps', 0, '')
+        app.add_config_value('sectiondoc_budget_seconds', 0, '')
+        app.connect('builder-inited', self.load_cache)
+        app.connect('builder-inited', self.setup_rendering_cache)
+        app.connect('builder-inited', self.setup_profiler)
+        app.connect('builder-inited', self.setup_budget)
+        app.connect('builder-inited', self.clear_string_table)
+        app.connect('env-merge-info', self.merge_cache)
+        app.connect('env-merge-info', self.merge_profiler)
+        app.connect('env-merge-info', self.merge_exceeded)
+        app.connect('env-updated', self.clear_env)
+        app.connect('build-finished', self.save_cache)
+        app.connect('build-finished', self.report_profiler)
+        app.connect('build-finished', self.report_exceeded)
+        app.connect('autodoc-process-docstring', self.render_docstring)
+        return {
+            'version': sectiondoc.__version__,
+            'parallel_read_safe': True,
+            'parallel_write_safe': True}
+
+    def load_cache(self, app):
+        """ Create the render cache and load the entries of the last build.
+
+        The cache is stored in the sphinx doctree directory when the
+        ``sectiondoc_cache`` configuration value is set. The stored
+        entries are discarded when the sphinx environment is fresh (e.g.
+        a build with ``-E``).
+
+        """
+        if not app.config.sectiondoc_cache:
+            self.cache = None
+            return
+        self.cache = LRUCache(maxsize=app.config.sectiondoc_cache_size)
+        # A fresh environment has not read any document yet.
+        if not getattr(getattr(app, 'env', None), 'all_docs', None):
+            return
+        filename = os.path.join(app.doctreedir, CACHE_FILENAME)
+        try:
+            with open(filename, 'rb') as handle:
+                version, entries = pickle.load(handle)
+        except Exception:
+            return
+        if version == sectiondoc.__version__:
+            self.cache.update(entries)
+
+    def setup_rendering_cache(self, app):
+        """ Resize the shared cache of the rendered items.
+
+        The size is set by the ``sectiondoc_rendering_cache_size``
+        configuration value, ``0`` disables the cache.
+
+        """
+        rendering_cache.clear()
+        rendering_cache.maxsize = app.config.sectiondoc_rendering_cache_size
+
+    def setup_profiler(self, app):
+        """ Create the profiler when the ``sectiondoc_profile``
+        configuration value is set.
+
+        """
+        self.profiler = Profiler() if app.config.sectiondoc_profile else None
+
+    def setup_budget(self, app):
+        """ Create the budget of the docstrings from the
+        ``sectiondoc_budget_steps`` and ``sectiondoc_budget_seconds``
+        configuration values, ``0`` disables the limit.
+
+        """
+        steps = app.config.sectiondoc_budget_steps or None
+        seconds = app.config.sectiondoc_budget_seconds or None
+        if steps is None and seconds is None:
+            self.budget = None
+        else:
+            self.budget = Budget(steps, seconds)
+        self.exceeded = []
+
+    def clear_string_table(self, app):
+        """ Clear the shared table of the item terms and classifiers.
+
+        The strings are shared for the duration of a build.
+
+        """
+        string_table.clear()
+
+    def merge_cache(self, app, env, docnames, other):
+        """ Add the docstrings rendered by a parallel reader to the cache.
+
+        """
+        entries = getattr(other, 'sectiondoc_rendered', None)
+        if entries and self.cache is not None:
+            self.cache.update(entries.items())
+
+    def merge_profiler(self, app, env, docnames, other):
+        """ Add the timings of a parallel reader to the profiler.
+
+        """
+        profiler = getattr(other, 'sectiondoc_profile', None)
+        if profiler is not None and self.profiler is not None:
+            self.profiler.merge(profiler)
+
+    def merge_exceeded(self, app, env, docnames, other):
+        """ Add the docstrings that exceeded the budget in a parallel
+        reader.
+
+        """
+        exceeded = getattr(other, 'sectiondoc_exceeded', None)
+        if exceeded:
+            self.exceeded.extend(exceeded)
+
+    def clear_env(self, app, env):
+        """ Remove the rendered docstrings, the timings and the docstrings
+        that exceeded the budget from the environment so that they are not
+        pickled.
+
+        """
+        if hasattr(env, 'sectiondoc_rendered'):
+            del env.sectiondoc_rendered
+        if hasattr(env, 'sectiondoc_profile'):
+            if self.profiler is not None:
+                self.profiler.merge(env.sectiondoc_profile)
+            del env.sectiondoc_profile
+        if hasattr(env, 'sectiondoc_exceeded'):
+            self.exceeded.extend(env.sectiondoc_exceeded)
+            del env.sectiondoc_exceeded
+
+    def report_profiler(self, app, exception):
+        """ Log the summary of the profiler.
+
+        """
+        if self.profiler is None or exception is not None:
+            return
+        logger.info('\n'.join(self.profiler.summary()))
+
+    def report_exceeded(self, app, exception):
+        """ Log the names of the docstrings that exceeded the budget.
+
+        """
+        if not self.exceeded or exception is not None:
+            return
+        logger.warning(
+            'sectiondoc: %d docstrings exceeded the budget and were not '
+            'rendered:\n%s', len(self.exceeded),
+            '\n'.join(sorted(self.exceeded)))
+
+    def save_cache(self, app, exception):
+        """ Store the render cache in the sphinx doctree directory.
+
+        """
+        if self.cache is None or exception is not None:
+            return
+        if not os.path.isdir(app.doctreedir):
+            os.makedirs(app.doctreedir)
+        filename = os.path.join(app.doctreedir, CACHE_FILENAME)
+        with open(filename, 'wb') as handle:
+            pickle.dump(
+                (sectiondoc.__version__, self.cache.items()), handle,
+                protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _record(self, app, key, rendered):
+        """ Keep the new cache entry in the sphinx environment.
+
+        Parallel readers run in forked processes and the only state that
+        returns to the main process is their environment.
+
+        """
+        env = getattr(app, 'env', None)
+        if env is None:
+            return
+        entries = getattr(env, 'sectiondoc_rendered', None)
+        if entries is None:
+            entries = env.sectiondoc_rendered = {}
+        entries[key] = rendered
+
+    def _get_renderer(self, renderer_factory, lines):
+        """ Return the renderer of the factory prepared for the lines.
+
+        A renderer is only reused when the factory returns
+        :class:`~.DocRender` instances that share the same
+        :class:`~.SectionMap`, i.e. when two calls of the factory in
+        the same thread return renderers with the same map. The reused
+        renderer is reset for the next docstrings in the thread. Other
+        factories are called for every docstring.
+
+        """
+        local = self._local
+        renderers = getattr(local, 'renderers', None)
+        if renderers is None:
+            renderers = local.renderers = {}
+            local.sections = {}
+        doc_render = renderers.get(renderer_factory)
+        if doc_render is not None:
+            doc_render.reset(lines)
+            return doc_render
+        doc_render = renderer_factory(lines)
+        sections = getattr(doc_render, 'sections', None)
+        if not (isinstance(doc_render, DocRender) and
+                isinstance(sections, SectionMap)):
+            return doc_render
+        first = local.sections.get(renderer_factory)
+        if first is None:
+            local.sections[renderer_factory] = sections
+        elif first is sections:
+            renderers[renderer_factory] = doc_render
+        else:
+            # The factory creates new sections, it is always called.
+            local.sections[renderer_factory] = _NOT_SHARED
+        return doc_render
+
+    def _parse(self, app, name, docstring_renderer):
+        """ Parse the docstring and return False when the budget was
+        exceeded (i.e. the lines are not rendered).
+
+        """
+        budget = self.budget
+        # The budget of the style is shared by the threads, every parse
+        # gets its own counters.
+        docstring_renderer.budget = None if budget is None else budget.copy()
+        try:
+            self._profile(app, name, docstring_renderer)
+        except BudgetExceeded as exception:
+            logger.debug('sectiondoc: %s: %s', name, exception)
+            self._record_exceeded(app, name)
+            return False
+        return True
+
+    def _record_exceeded(self, app, name):
+        """ Add the name to the docstrings that exceeded the budget.
+
+        The names are collected in the sphinx environment (when available)
+        so that they return from the parallel readers.
+
+        """
+        env = getattr(app, 'env', None)
+        if env is None:
+            self.exceeded.append(name)
+            return
+        exceeded = getattr(env, 'sectiondoc_exceeded', None)
+        if exceeded is None:
+            exceeded = env.sectiondoc_exceeded = []
+        exceeded.append(name)
+
+    def _profile(self, app, name, docstring_renderer):
+        profiler = self.profiler
+        if profiler is None:
             docstring_renderer.parse()
+            return
+        # The timings are collected in the sphinx environment (when
+        # available) so that they return from the parallel readers.
+        env = getattr(app, 'env', None)
+        if env is not None:
+            profiler = getattr(env, 'sectiondoc_profile', None)
+            if profiler is None:
+                profiler = env.sectiondoc_profile = Profiler(
+                    self.profiler.size)
+        profiler.profile(docstring_renderer, name)
+
+
+def _fingerprint(rendering_map):
+    """ Return the digest that identifies the rendering map.
+
+    """
+    description = []
+    objects = []
+    for what in sorted(rendering_map):
+        factory = rendering_map[what]
+        description.append('{0}={1}'.format(what, _qualified_name(factory)))
+        objects.append(factory)
+        try:
+            sections = factory([]).sections
+            headers = sorted(sections)
+        except Exception:
+            continue
+        for header in headers:
+            entry = tuple(sections[header])
+            description.append('{0}:{1}'.format(
+                header, ','.join(_qualified_name(obj) for obj in entry)))
+            objects.extend(entry)
+    modules = set()
+    for obj in objects:
+        for cls in getattr(obj, '__mro__', (obj,)):
+            modules.add(getattr(cls, '__module__', None))
+    modules.discard(None)
+    for module in sorted(modules):
+        description.append('{0}#{1}'.format(module, _source_digest(module)))
+    return hashlib.sha1(
+        u'\n'.join(description).encode('utf-8')).hexdigest()
+
+
+def _qualified_name(obj):
+    if obj is None:
+        return ''
+    return '{0}.{1}'.format(
+        getattr(obj, '__module__', ''), getattr(obj, '__name__', repr(obj)))
+
+
+def _source_digest(module_name):
+    filename = getattr(sys.modules.get(module_name), '__file__', None)
+    if filename is None:
+        return ''
+    if filename.endswith(('.pyc', '.pyo')):
+        filename = filename[:-1]
+    try:
+        with open(filename, 'rb') as handle:
+            return hashlib.sha1(handle.read()).hexdigest()
+    except (IOError, OSError):
+        return ''
@@ -0,0 +1,235 @@
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+from sectiondoc import batch
+from sectiondoc.batch import extract_docstrings, main, render_file
+from sectiondoc.tests._compat import unittest
+
+
+SOURCE = u'''
+class Dummy(object):
+    """ A dummy class.
+
+    Attributes
+    ----------
+    value : int
+        The value.
+
+    """
+
+    def method(self):
+        """ A method.
+
+        Returns
+        -------
+        value : int
+            The value.
+
+        """
+
+    class Inner(object):
+        """ An inner class. """
+
+
+def function():
+    """ A function. """
+
+    def inner():
+        """ Not documented by autodoc. """
+'''
+
+
+class FailingStyle(object):
+
+    def render_docstring(self, app, what, name, obj, options, lines):
+        raise RuntimeError('failing style')
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def write(self, filename, source):
+        filename = os.path.join(self.folder, filename)
+        directory = os.path.dirname(filename)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        with io.open(filename, 'w', encoding='utf-8') as handle:
+            handle.write(source)
+        return filename
+
+    def test_extract_docstrings(self):
+        # when
+        docstrings = extract_docstrings(SOURCE)
+
+        # then
+        self.assertEqual(
+            [(what, name) for what, name, _ in docstrings],
+            [('class', 'Dummy'),
+             ('method', 'Dummy.method'),
+             ('class', 'Dummy.Inner'),
+             ('function', 'function')])
+        self.assertEqual(
+            docstrings[0][2],
+            ['A dummy class.', '', 'Attributes', '----------',
+             'value : int', '    The value.', ''])
+        self.assertEqual(docstrings[2][2], ['An inner class. ', ''])
+
+    def test_render_file(self):
+        # given
+        filename = self.write('module.py', SOURCE)
+
+        # when
+        result = render_file((filename, 'default'))
+
+        # then
+        self.assertEqual(result[0], filename)
+        self.assertEqual(result[2], 4)
+        self.assertIsNone(result[3])
+        self.assertIn('    .. attribute:: value\n', result[1])
+        self.assertIn('.. py:method:: Dummy.method\n', result[1])
+        self.assertIn('    :returns:\n', result[1])
+
+    def test_render_invalid_file(self):
+        # given
+        filename = self.write('module.py', u'class :')
+
+        # when
+        result = render_file((filename, 'legacy'))
+
+        # then
+        self.assertEqual(result[:3], (filename, None, 0))
+        self.assertIsNotNone(result[3])
+
+    def test_render_missing_file(self):
+        # given
+        filename = os.path.join(self.folder, 'missing.py')
+
+        # when
+        result = render_file((filename, 'default'))
+
+        # then
+        self.assertEqual(result[:3], (filename, None, 0))
+        self.assertIsNotNone(result[3])
+
+    def test_render_failing_docstring(self):
+        # given
+        filename = self.write('module.py', SOURCE)
+        batch._styles['failing'] = FailingStyle()
+        try:
+            # when
+            result = render_file((filename, 'failing'))
+        finally:
+            del batch._styles['failing']
+
+        # then
+        self.assertEqual(result[:3], (filename, None, 0))
+        self.assertIn('rendering failed', result[3])
+
+    def test_main_invalid_jobs(self):
+        # given
+        filename = self.write('module.py', SOURCE)
+
+        for jobs in ('0', '-2', 'many'):
+            # when/then
+            with self.assertRaises(SystemExit):
+                main([filename, '--jobs', jobs])
+
+    def test_main_without_concurrent_futures(self):
+        # given
+        self.write(os.path.join('package', 'module.py'), SOURCE)
+        output = os.path.join(self.folder, 'output')
+        modules = {
+            name: sys.modules.pop(name) for name in list(sys.modules)
+            if name.startswith('concurrent')}
+        # A None entry makes the import fail.
+        sys.modules['concurrent.futures'] = None
+        try:
+            # when
+            code = main([
+                os.path.join(self.folder, 'package'),
+                '--output', output, '--jobs', '2'])
+        finally:
+            del sys.modules['concurrent.futures']
+            sys.modules.update(modules)
+
+        # then
+        self.assertEqual(code, 0)
+        self.assertTrue(os.path.isfile(
+            os.path.join(output, 'package', 'module.rst')))
+
+    def test_main_with_files(self):
+        # given
+        self.write(os.path.join('a', 'module.py'), SOURCE)
+        self.write(os.path.join('b', 'module.py'), u'')
+        output = os.path.join(self.folder, 'output')
+        cwd = os.getcwd()
+        os.chdir(self.folder)
+        try:
+            # when
+            code = main([
+                os.path.join('a', 'module.py'),
+                os.path.join('b', 'module.py'),
+                '--output', output, '--jobs', '1'])
+        finally:
+            os.chdir(cwd)
+
+        # then
+        self.assertEqual(code, 0)
+        with io.open(os.path.join(output, 'a', 'module.rst')) as handle:
+            self.assertIn('.. py:method:: Dummy.method\n', handle.read())
+        with io.open(os.path.join(output, 'b', 'module.rst')) as handle:
+            self.assertEqual(handle.read(), '')
+
+    def test_main_with_overlapping_outputs(self):
+        # given
+        first = self.write(os.path.join('a', 'module.py'), SOURCE)
+        second = self.write(os.path.join('b', 'module.py'), SOURCE)
+        output = os.path.join(self.folder, 'output')
+        cwd = os.getcwd()
+        os.chdir(os.path.join(self.folder, 'a'))
+        try:
+            # when/then
+            with self.assertRaises(SystemExit):
+                main([first, second, '--output', output, '--jobs', '1'])
+        finally:
+            os.chdir(cwd)
+        self.assertFalse(os.path.exists(output))
+
+    def test_main(self):
+        # given
+        self.write(os.path.join('package', '__init__.py'), u'')
+        self.write(os.path.join('package', 'sub', 'module.py'), SOURCE)
+        self.write(os.path.join('package', '.hidden', 'module.py'), SOURCE)
+        output = os.path.join(self.folder, 'output')
+
+        # when
+        for jobs in ('1', '2'):
+            code = main([
+                os.path.join(self.folder, 'package'),
+                '--output', os.path.join(output, jobs), '--jobs', jobs])
+
+            # then
+            self.assertEqual(code, 0)
+            filename = os.path.join(
+                output, jobs, 'package', 'sub', 'module.rst')
+            with io.open(filename, encoding='utf-8') as handle:
+                rst = handle.read()
+            self.assertEqual(rst, render_file((self.write(
+                'module.py', SOURCE), 'default'))[1])
+            self.assertTrue(os.path.isfile(os.path.join(
+                output, jobs, 'package', '__init__.rst')))
+            self.assertFalse(os.path.exists(os.path.join(
+                output, jobs, 'package', '.hidden')))
+
+
+if __name__ == '__main__':
+    unittest.main()
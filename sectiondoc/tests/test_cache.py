@@ -0,0 +1,165 @@
+import threading
+
+from sectiondoc.cache import InternTable, LRUCache
+from sectiondoc.tests._compat import unittest
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_get_and_put(self):
+        # given
+        cache = LRUCache(maxsize=2)
+
+        # when
+        cache.put('a', 1)
+        cache.put('b', 2)
+
+        # then
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c', 3), 3)
+        self.assertEqual(cache.info(), (1, 1, 2, 2))
+
+    def test_evict_least_recently_used(self):
+        # given
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+
+        # when
+        cache.put('c', 3)
+
+        # then
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.items(), [('a', 1), ('c', 3)])
+
+    def test_update_and_clear(self):
+        # given
+        cache = LRUCache(maxsize=10)
+
+        # when
+        cache.update([('a', 1), ('b', 2)])
+        cache.get('a')
+
+        # then
+        self.assertEqual(len(cache), 2)
+
+        # when
+        cache.clear()
+
+        # then
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.info(), (0, 0, 10, 0))
+
+    def test_threads(self):
+        # given
+        cache = LRUCache(maxsize=50)
+
+        def work(offset):
+            for index in range(1000):
+                key = (offset + index) % 100
+                if cache.get(key) is None:
+                    cache.put(key, index)
+
+        threads = [
+            threading.Thread(target=work, args=(offset,))
+            for offset in range(8)]
+
+        # when
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # then
+        info = cache.info()
+        self.assertEqual(info.hits + info.misses, 8000)
+        self.assertEqual(info.currsize, 50)
+
+
+class TestInternTable(unittest.TestCase):
+
+    def test_intern(self):
+        # given
+        table = InternTable()
+        first = ''.join(['in', 't'])
+        second = ''.join(['i', 'nt'])
+
+        # when
+        interned = table.intern(first)
+        other = table.intern(second)
+
+        # then
+        self.assertIs(interned, first)
+        self.assertIs(other, first)
+        self.assertIn('int', table)
+        self.assertEqual(table.info(), (1, 2))
+
+    def test_intern_all_and_clear(self):
+        # given
+        table = InternTable()
+
+        # when
+        strings = table.intern_all(['int', 'float', 'int'])
+
+        # then
+        self.assertEqual(strings, ('int', 'float', 'int'))
+        self.assertIs(strings[0], strings[2])
+        self.assertEqual(table.info(), (2, 3))
+
+        # when
+        table.clear()
+
+        # then
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.info(), (0, 0))
+
+    def test_maxsize(self):
+        # given
+        table = InternTable(maxsize=2)
+        first = ''.join(['in', 't'])
+
+        # when
+        interned = table.intern_all([first, 'float', 'int'])
+
+        # then
+        self.assertIs(interned[2], first)
+        self.assertEqual(table.info(), (2, 3))
+
+        # when
+        table.intern('str')
+        other = table.intern(''.join(['i', 'nt']))
+
+        # then
+        self.assertEqual(len(table), 2)
+        self.assertIn('str', table)
+        self.assertIsNot(other, first)
+        self.assertIs(table.intern('int'), other)
+
+    def test_intern_from_threads(self):
+        # given
+        table = InternTable(maxsize=20)
+        strings = [str(index) for index in range(50)]
+        results = []
+
+        def worker():
+            for _ in range(20):
+                for string in strings:
+                    if table.intern(string) != string:
+                        results.append(string)
+
+        # when
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # then
+        self.assertEqual(results, [])
+        self.assertLessEqual(len(table), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,119 @@
 from sectiondoc.items import (
     OrDefinitionItem, MethodItem, Item, AnyItem, DefinitionItem)
 from sectiondoc.renderers import (
-    Argument, Attribute, Definition, ListItem, Method, TableRow)
+    Argument, Attribute, Definition, ListItem, Method, Renderer, TableRow)
 from sectiondoc.tests._compat import unittest
 
 
+class RacingItem(DefinitionItem):
+    """ An item where another thread parses the definition right after
+    the first read of the missing definition.
+
+    """
+
+    def _get_definition(self):
+        definition = Item._definition.__get__(self)
+        if definition is None:
+            Item._definition.__set__(self, ('Text.',))
+            Item._lines.__set__(self, None)
+        return definition
+
+    def _set_definition(self, definition):
+        Item._definition.__set__(self, definition)
+
+    _definition = property(_get_definition, _set_definition)
+
+
+class TestItem(unittest.TestCase):
+
+    def test_fields(self):
+        # given
+        item = Item('term', ['int', 'float'], ['Definition.'])
+
+        # when/then
+        self.assertEqual(item.classifiers, ('int', 'float'))
+        self.assertEqual(item.definition, ('Definition.',))
+        self.assertEqual(item, ('term', ('int', 'float'), ('Definition.',)))
+        self.assertEqual(item[0], 'term')
+        term, classifiers, definition = item
+        self.assertEqual(term, 'term')
+        self.assertEqual(len(item), 3)
+        self.assertFalse(hasattr(item, '__dict__'))
+        with self.assertRaises(AttributeError):
+            item.term = 'other'
+
+    def test_mode(self):
+        self.assertEqual(Item('term', [], ['']).mode, 'only_term')
+        self.assertEqual(Item('term', [], ['Text.']).mode, 'no_classifiers')
+        self.assertEqual(Item('term', ['int'], ['']).mode, 'no_definition')
+        self.assertEqual(Item('term', ['int'], ['Text.']).mode, 'full')
+        self.assertEqual(Item('term', ['int'], []).mode, 'full')
+
+    def test_replace(self):
+        # given
+        item = MethodItem('function', ['arg'], ['Text.'])
+
+        # when
+        other = item._replace(classifiers=[])
+
+        # then
+        self.assertIsInstance(other, MethodItem)
+        self.assertEqual(other, ('function', (), ('Text.',)))
+        self.assertEqual(other.mode, 'no_classifiers')
+        self.assertEqual(item.mode, 'full')
+
+    def test_hash(self):
+        # given
+        item = DefinitionItem('term', ['int'], ['Text.'])
+
+        # when/then
+        self.assertEqual(hash(item), hash(Item('term', ('int',), ('Text.',))))
+        self.assertNotEqual(item, Item('term', ['int'], ['Other.']))
+
+    def test_lazy(self):
+        # given
+        lines = ['        Text.', '', '            More text.  ']
+
+        # when
+        item = DefinitionItem.lazy('term', ['int'], lines)
+
+        # then
+        self.assertIsInstance(item, DefinitionItem)
+        self.assertEqual(tuple(item.raw_definition), tuple(lines))
+        self.assertEqual(item.mode, 'full')
+        self.assertEqual(
+            item.indented_definition(),
+            ['    Text.', '', '        More text.'])
+        self.assertEqual(item.definition, ('Text.', '', '    More text.'))
+        self.assertEqual(item.raw_definition, item.definition)
+        self.assertEqual(
+            item, Item('term', ['int'], ['Text.', '', '    More text.']))
+
+    def test_lazy_definition_set_by_other_thread(self):
+        # given
+        item = RacingItem.lazy('term', [], ['    Text.'])
+
+        # when/then
+        self.assertEqual(item.definition, ('Text.',))
+        self.assertEqual(item.definition, ('Text.',))
+
+    def test_indented_definition(self):
+        # given
+        item = Item('term', [], ['Text.', '', '    More text.'])
+
+        # when/then
+        self.assertEqual(
+            item.indented_definition(2),
+            ['  Text.', '', '      More text.'])
+
+    def test_lazy_without_definition(self):
+        self.assertEqual(
+            DefinitionItem.lazy('term', [], []).mode, 'only_term')
+        self.assertEqual(AnyItem.lazy('term', ['int'], []).definition, ())
+        self.assertEqual(
+            MethodItem.lazy('function', ['arg'], []).mode, 'no_definition')
+
+
 class TestOrDefinitionItem(unittest.TestCase):
 
     def setUp(self):
@@ -195,6 +304,99 @@ class TestAnyItem(unittest.TestCase):
                 'term', ['classifier'], ['Block.', '    Definition.']))
 
 
+class LegacyRenderer(Renderer):
+
+    def to_rst(self, prefix=''):
+        return [prefix + self.item.term]
+
+
+class TestRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.items = [
+            Item('first', ['int'], ['The first item.', '', 'More.']),
+            Item('second', [], ['']),
+            Item('third', ['str'], ['']),
+            Item('fourth', [], ['The fourth item.']),
+            Item('fifth', ['float'], [])]
+
+    def test_shared(self):
+        self.assertIs(Argument.shared(), Argument.shared())
+        self.assertIsInstance(ListItem.shared(), ListItem)
+        self.assertIsNot(ListItem.shared(), Argument.shared())
+
+    def test_render_items(self):
+        for renderer, options in (
+                (Argument, {}), (Attribute, {}), (Definition, {}),
+                (ListItem, {'prefix': '-'}), (ListItem, {'prefix': None}),
+                (TableRow, {'columns': (10, 10, 10)})):
+            # given
+            expected = []
+            for item in self.items:
+                expected += renderer(item).to_rst(**options)
+
+            # when
+            lines = renderer.shared().render_items(self.items, **options)
+
+            # then
+            self.assertEqual(lines, expected)
+            self.assertEqual(renderer.shared().render_items([]), [])
+
+    def test_render_block(self):
+        for renderer, options in (
+                (Argument, {}), (Attribute, {}), (ListItem, {'prefix': '-'}),
+                (Method, {'columns': (30, 20)})):
+            # given
+            expected = renderer.shared().render_items(self.items, **options)
+
+            # when
+            block = renderer.shared().render_block(self.items, **options)
+
+            # then
+            self.assertTrue(block.endswith('\n'))
+            self.assertEqual(block.split('\n'), expected + [''])
+            self.assertEqual(renderer.shared().render_block([]), '')
+
+    def test_render_item(self):
+        # given
+        item = self.items[0]
+        renderer = Argument.shared()
+
+        # when/then
+        self.assertEqual(renderer.render(item), Argument(item).to_rst())
+        self.assertEqual(renderer.render_item(item), Argument(item).to_rst())
+        self.assertIsNone(renderer.item)
+
+    def test_to_rst_with_positional_arguments(self):
+        # given
+        item = self.items[0]
+
+        # when/then
+        self.assertEqual(
+            Method(item).to_rst((20, 10)),
+            Method(item).to_rst(columns=(20, 10)))
+        self.assertEqual(
+            TableRow(item).to_rst((10, 5, 10)),
+            TableRow(item).to_rst(columns=(10, 5, 10)))
+        self.assertEqual(
+            ListItem(item).to_rst('-'), ListItem(item).to_rst(prefix='-'))
+        self.assertEqual(
+            ListItem(item).to_rst('-'),
+            ListItem.shared().render_item(item, prefix='-'))
+
+    def test_renderer_with_only_to_rst(self):
+        # given
+        renderer = LegacyRenderer.shared()
+
+        # when
+        lines = renderer.render_items(self.items[:2], prefix='- ')
+
+        # then
+        self.assertEqual(lines, ['- first', '- second'])
+        with self.assertRaises(NotImplementedError):
+            Renderer().render_item(self.items[0])
+
+
 class TestDefintionRenderer(unittest.TestCase):
 
     def test_to_rst(self):
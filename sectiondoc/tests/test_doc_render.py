@@ -1,4 +1,4 @@
-from sectiondoc.styles import DocRender
+from sectiondoc.styles import Budget, BudgetExceeded, DocRender
 from sectiondoc.tests._compat import unittest
 
 
@@ -206,6 +206,18 @@ class TestDocRender(unittest.TestCase):
         with self.assertRaises(IndexError):
             doc_render.insert_and_move(['6', '2'], index=10)
 
+    def test_insert_text_chunks(self):
+        # given
+        doc_render = DocRender(['A', 'B'])
+
+        # when
+        doc_render.insert_and_move(['C\n\nD', 'E\n'], index=1)
+
+        # then
+        self.assertEqual(
+            doc_render.docstring, ['A', 'C', '', 'D', 'E', '', 'B'])
+        self.assertEqual(doc_render.index, 5)
+
     def test_is_section(self):
         # given
         doc_render = DocRender([
@@ -247,6 +259,54 @@ class TestDocRender(unittest.TestCase):
         doc_render.index = 8
         self.assertFalse(doc_render.is_section())
 
+    def test_is_section_after_changes(self):
+        # given
+        doc_render = DocRender([
+            "Text",
+            "My Header",
+            "---------"])
+
+        # when/then
+        self.assertFalse(doc_render.is_section())
+        self.assertFalse(doc_render.is_section())
+
+        # when
+        doc_render.remove_lines(0)
+
+        # then
+        self.assertEqual(doc_render.is_section(), 'My Header')
+
+        # when
+        doc_render.insert_lines(['Text'], 0)
+
+        # then
+        self.assertFalse(doc_render.is_section())
+
+        # when
+        doc_render.pop()
+
+        # then
+        self.assertEqual(doc_render.is_section(), 'My Header')
+
+    def test_reset(self):
+        # given
+        sections = {}
+        doc_render = DocRender(["My Header", "---------"], sections=sections)
+        doc_render.is_section()
+        doc_render.index = 1
+        doc_render.bookmark()
+        lines = ["Text", "Other", "-----"]
+
+        # when
+        doc_render.reset(lines)
+
+        # then
+        self.assertIs(doc_render.docstring, lines)
+        self.assertIs(doc_render.sections, sections)
+        self.assertEqual(doc_render.index, 0)
+        self.assertEqual(doc_render.bookmarks, [])
+        self.assertFalse(doc_render.is_section())
+
     def test_get_next_block(self):
         doc_render = DocRender([
             'term1',
@@ -305,15 +365,15 @@ class TestDocRender(unittest.TestCase):
         doc_render.index = 5
         self.assertEqual(
             doc_render.extract_items(),
-            [('term1', [], ['Definition1']),
-             ('term2', ['classifier'], ['Definition2'])])
+            [('term1', (), ('Definition1',)),
+             ('term2', ('classifier',), ('Definition2',))])
 
         # when/then
         doc_render.index = 7
         self.assertEqual(
             doc_render.extract_items(),
-            [('term4', ['classifier'],
-              ['Definition3', '', 'MoreDefinition3'])])
+            [('term4', ('classifier',),
+              ('Definition3', '', 'MoreDefinition3'))])
 
     def test_render_header(self):
         docstring =\
@@ -360,6 +420,42 @@ This is just some sample text.
         output = '\n'.join(docstring_lines) + '\n'
         self.assertMultiLineEqual(rst, output)
 
+    def test_budget(self):
+        # given
+        docstring = [
+            'Header', '------', 'Some text.', '', 'Other', '-----', 'More']
+        lines = list(docstring)
+        doc_render = DocRender(lines)
+        doc_render.budget = Budget(steps=1)
+
+        # when/then
+        with self.assertRaises(BudgetExceeded):
+            doc_render.parse()
+        self.assertEqual(lines, docstring)
+
+        # given
+        expected = list(docstring)
+        DocRender(expected).parse()
+        doc_render.reset(lines)
+        doc_render.budget = Budget(steps=10)
+
+        # when
+        doc_render.parse()
+
+        # then
+        self.assertEqual(lines, expected)
+
+    def test_budget_seconds(self):
+        # given
+        lines = ['Header', '------', 'Some text.']
+        doc_render = DocRender(lines)
+        doc_render.budget = Budget(seconds=-1.0)
+
+        # when/then
+        with self.assertRaises(BudgetExceeded):
+            doc_render.parse()
+        self.assertEqual(lines, ['Header', '------', 'Some text.'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,163 @@
+from sectiondoc.items import DefinitionItem, LineSpan
+from sectiondoc.renderers import ListItem
+from sectiondoc.sections import item_list
+from sectiondoc.styles import (
+    Document, DocumentParser, Section, SinglePassRender, Style)
+from sectiondoc.styles.default import FUNCTION_SECTIONS, function_section
+from sectiondoc.styles.section_map import SectionMap
+from sectiondoc.tests._compat import unittest
+
+
+DOCSTRING = """ This is a sample docstring.
+
+Parameters
+----------
+inputa : str
+    The first argument.
+inputb : float
+    The second argument.
+
+Example
+-------
+Some text.
+
+Notes
+-----
+This is the note.
+
+This is not a note.
+"""
+
+
+def render(lines, sections):
+    lines = list(lines)
+    SinglePassRender(lines, sections=sections).parse()
+    return lines
+
+
+class TestDocument(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.lines = DOCSTRING.splitlines()
+
+    def test_parse(self):
+        # given
+        parser = DocumentParser(self.lines, sections=FUNCTION_SECTIONS)
+
+        # when
+        document = parser.parse()
+
+        # then
+        self.assertIsInstance(document, Document)
+        self.assertIs(parser.document, document)
+        self.assertEqual(self.lines, DOCSTRING.splitlines())
+        self.assertEqual(document.source, tuple(self.lines))
+        parameters, example, notes = document.sections
+        self.assertEqual(parameters.header, 'Parameters')
+        self.assertEqual(parameters.kind, 'items')
+        self.assertIs(parameters.item_type, DefinitionItem)
+        self.assertEqual(
+            [item.term for item in parameters.content], ['inputa', 'inputb'])
+        self.assertEqual(parameters.skipped, ())
+        self.assertEqual(
+            (parameters.start, parameters.body, parameters.end), (2, 4, 9))
+        self.assertEqual(example.header, 'Example')
+        self.assertEqual(example.kind, 'header')
+        self.assertEqual(example.content, ())
+        self.assertEqual(notes.kind, 'paragraph')
+        self.assertIsInstance(notes.content, LineSpan)
+        self.assertEqual(list(notes.content), ['This is the note.'])
+        self.assertEqual(
+            [list(part) for part in document.parts
+             if not isinstance(part, Section)],
+            [[' This is a sample docstring.', ''],
+             ['Some text.', ''],
+             ['', 'This is not a note.']])
+
+    def test_render(self):
+        # given
+        document = DocumentParser(
+            self.lines, sections=FUNCTION_SECTIONS).parse()
+
+        # when/then
+        self.assertEqual(
+            document.render(FUNCTION_SECTIONS),
+            render(self.lines, FUNCTION_SECTIONS))
+        self.assertEqual(
+            document.render(FUNCTION_SECTIONS),
+            render(self.lines, FUNCTION_SECTIONS))
+
+    def test_render_with_other_sections(self):
+        # given
+        document = DocumentParser(
+            self.lines, sections=FUNCTION_SECTIONS).parse()
+        sections = SectionMap({
+            'Parameters': (item_list, ListItem, DefinitionItem)})
+
+        # when
+        lines = document.render(sections)
+
+        # then
+        # The paragraph of the Notes is not read by the rubric.
+        self.assertEqual(lines, render(self.lines, sections))
+        self.assertIn(':parameters:', lines)
+        self.assertIn('.. rubric:: Notes', lines)
+
+    def test_render_reads_section_differently(self):
+        # given
+        document = DocumentParser(
+            self.lines, sections=FUNCTION_SECTIONS).parse()
+        sections = SectionMap({
+            'Notes': (item_list, ListItem, DefinitionItem)})
+
+        # when/then
+        with self.assertRaises(ValueError):
+            document.render(sections)
+
+    def test_parse_with_broad_except(self):
+        # given
+        def guarded(doc, header, renderer, item_class):
+            try:
+                items = doc.extract_items(item_class)
+            except Exception:
+                items = []
+            lines = [renderer.shared().render_block(items)]
+            try:
+                lines += doc.get_next_paragraph()
+            except Exception:
+                pass
+            return lines
+
+        sections = SectionMap({
+            'Parameters': (guarded, ListItem, DefinitionItem)})
+
+        # when
+        document = DocumentParser(self.lines, sections=sections).parse()
+
+        # then
+        # The function is stopped after the items are read.
+        parameters, example, notes = document.sections
+        self.assertEqual(parameters.kind, 'items')
+        self.assertEqual(
+            [item.term for item in parameters.content], ['inputa', 'inputb'])
+        self.assertEqual(example.header, 'Example')
+
+    def test_style(self):
+        # given
+        style = Style({'function': function_section})
+
+        # when
+        document = style.parse_document('function', self.lines)
+
+        # then
+        self.assertEqual(
+            style.render_document('function', document),
+            render(self.lines, FUNCTION_SECTIONS))
+        self.assertIsNone(style.parse_document('module', self.lines))
+        self.assertEqual(
+            style.render_document('module', document), self.lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
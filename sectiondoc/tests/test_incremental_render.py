@@ -0,0 +1,79 @@
+from sectiondoc.styles import IncrementalRender, SinglePassRender
+from sectiondoc.styles.default import FUNCTION_SECTIONS
+from sectiondoc.tests._compat import unittest
+from sectiondoc.tests.test_single_pass_render import DOCSTRING
+
+
+class TestIncrementalRender(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def render(self, lines):
+        lines = list(lines)
+        SinglePassRender(lines, sections=FUNCTION_SECTIONS).parse()
+        return lines
+
+    def test_rerender(self):
+        # given
+        old = DOCSTRING.splitlines()
+        new = [line.replace('is a float', 'is an int') for line in old]
+        doc_render = IncrementalRender(sections=FUNCTION_SECTIONS)
+
+        # when
+        lines, recomputed = doc_render.rerender(old, new)
+
+        # then
+        self.assertEqual(lines, self.render(new))
+        self.assertEqual(recomputed, ['Parameters', 'Input\\Output header'])
+
+    def test_rerender_unchanged(self):
+        # given
+        lines = DOCSTRING.splitlines()
+        doc_render = IncrementalRender(sections=FUNCTION_SECTIONS)
+        doc_render.rerender(None, lines)
+
+        # when
+        rendered, recomputed = doc_render.rerender(lines, lines)
+
+        # then
+        self.assertEqual(rendered, self.render(lines))
+        self.assertEqual(recomputed, [])
+        self.assertEqual(len(doc_render.regions), 6)
+
+    def test_rerender_with_old_error(self):
+        # given
+        doc_render = IncrementalRender(sections=FUNCTION_SECTIONS)
+        lines = DOCSTRING.splitlines()
+
+        # when
+        rendered, _ = doc_render.rerender(['Notes', '-----'], lines)
+
+        # then
+        self.assertEqual(rendered, self.render(lines))
+
+    def test_section_past_boundary_is_not_cached(self):
+        # given
+        lines = [
+            'Parameters',
+            '----------',
+            'x : int',
+            '    Text.',
+            '',
+            '    Notes',
+            '    -----',
+            '    More.']
+        doc_render = IncrementalRender(sections=FUNCTION_SECTIONS)
+        doc_render.rerender(None, lines)
+
+        # when
+        rendered, recomputed = doc_render.rerender(None, lines)
+
+        # then
+        self.assertEqual(rendered, self.render(lines))
+        self.assertEqual(recomputed, ['Parameters'])
+        self.assertEqual(len(doc_render.regions), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
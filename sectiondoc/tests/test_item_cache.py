@@ -0,0 +1,92 @@
+from sectiondoc.items import (
+    AnyItem, DefinitionItem, MethodItem, OrDefinitionItem, item_cache,
+    parse_item, string_table)
+from sectiondoc.tests._compat import unittest
+
+
+class TestParseItem(unittest.TestCase):
+
+    def setUp(self):
+        item_cache.clear()
+
+    def tearDown(self):
+        item_cache.clear()
+
+    def test_parse_item(self):
+        # given
+        block = ['copy : bool', '    Copy the array.']
+
+        # when
+        item = parse_item(DefinitionItem, block)
+        other = parse_item(DefinitionItem, list(block))
+
+        # then
+        self.assertEqual(item, DefinitionItem.parse(block))
+        self.assertEqual(other, item)
+        self.assertEqual(item_cache.info()[:2], (1, 1))
+
+    def test_item_type_is_part_of_the_key(self):
+        # given
+        block = ['copy : bool or None', '    Copy the array.']
+
+        # when
+        item = parse_item(DefinitionItem, block)
+        other = parse_item(OrDefinitionItem, block)
+
+        # then
+        self.assertEqual(item.classifiers, ('bool or None',))
+        self.assertEqual(other.classifiers, ('bool', 'None'))
+        self.assertEqual(item_cache.info()[:2], (0, 2))
+
+    def test_returned_items_are_shared(self):
+        # given
+        block = ['copy : bool', '    Copy the array.']
+        item = parse_item(DefinitionItem, block)
+
+        # when
+        other = parse_item(DefinitionItem, block)
+
+        # then
+        self.assertIs(other, item)
+        with self.assertRaises(AttributeError):
+            item.term = 'other'
+
+
+class TestStringTable(unittest.TestCase):
+
+    def setUp(self):
+        string_table.clear()
+
+    def tearDown(self):
+        string_table.clear()
+
+    def test_parsers_share_strings(self):
+        for item_type in (AnyItem, DefinitionItem, OrDefinitionItem):
+            # given
+            block = ['axis : int', '    The axis.']
+            other_block = [' axis : int ', '    Other axis.']
+
+            # when
+            item = item_type.parse(block)
+            other = item_type.parse(other_block)
+
+            # then
+            self.assertIs(item.term, other.term)
+            self.assertIs(item.classifiers[0], other.classifiers[0])
+
+    def test_method_item(self):
+        # given
+        block = ['function(arg1, arg2)', '    Summary.']
+
+        # when
+        item = MethodItem.parse(block)
+        other = MethodItem.parse(list(block))
+
+        # then
+        self.assertIs(item.term, other.term)
+        self.assertIs(item.classifiers[0], other.classifiers[0])
+        self.assertEqual(string_table.info(), (2, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
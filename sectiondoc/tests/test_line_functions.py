@@ -1,6 +1,7 @@
 from sectiondoc.util import (
     add_indent, remove_indent, get_indent, fix_star, fix_backspace, is_empty,
-    replace_at)
+    replace_at, get_section_header, has_section_headers, indent_text,
+    split_chunks)
 from sectiondoc.tests._compat import unittest
 
 
@@ -23,6 +24,22 @@ class TestLineFunctions(unittest.TestCase):
         output = add_indent(input)
         self.assertEqual(output, expected)
 
+    def test_indent_text(self):
+        text = "This is the first line\n\n  \n   This is the fourth line\n"
+        expected = (
+            "   This is the first line\n\n  \n      This is the fourth line\n")
+        self.assertEqual(indent_text(text, indent=3), expected)
+        self.assertEqual(indent_text(text, indent=0), text)
+        self.assertEqual(
+            indent_text('line'), '\n'.join(add_indent(['line'])))
+        self.assertEqual(indent_text(''), '')
+
+    def test_split_chunks(self):
+        self.assertEqual(split_chunks([]), [])
+        self.assertEqual(split_chunks(['']), [''])
+        self.assertEqual(
+            split_chunks(['A', 'B\nC\n', 'D']), ['A', 'B', 'C', '', 'D'])
+
     def test_remove_indent(self):
         input = [
             "   This is the first line", "", "      This is the third line"]
@@ -44,6 +61,39 @@ class TestLineFunctions(unittest.TestCase):
         output = is_empty('         .         ')
         self.assertFalse(output)
 
+    def test_get_section_header(self):
+        output = get_section_header('My Header  ', '---------   ')
+        self.assertEqual(output, 'My Header')
+        output = get_section_header(r'Input\Output header', '=' * 19)
+        self.assertEqual(output, r'Input\Output header')
+        output = get_section_header('  Header', '  ------')
+        self.assertEqual(output, 'Header')
+        output = get_section_header('Section 2', '---------')
+        self.assertEqual(output, '')
+        output = get_section_header('Section 2', '--------2')
+        self.assertEqual(output, 'Section 2')
+        output = get_section_header('MyHeader', '---------')
+        self.assertEqual(output, '')
+        output = get_section_header('My Header', ' --------')
+        self.assertEqual(output, '')
+        output = get_section_header('My  Header', '----------')
+        self.assertEqual(output, '')
+        output = get_section_header('My Header', '----=----')
+        self.assertEqual(output, '')
+        output = get_section_header('', '')
+        self.assertEqual(output, '')
+
+    def test_has_section_headers(self):
+        self.assertTrue(has_section_headers(['Text', '', 'Header', '------']))
+        self.assertTrue(has_section_headers(['  Header', '  ======  ']))
+        self.assertTrue(has_section_headers(['123', '123']))
+        self.assertTrue(has_section_headers(['Text\nHeader', '------']))
+        self.assertFalse(has_section_headers([]))
+        self.assertFalse(has_section_headers(['A one-liner.']))
+        self.assertFalse(has_section_headers(['Text', '', 'More text.', '']))
+        self.assertFalse(has_section_headers(['Text', '- item', '- item']))
+        self.assertFalse(has_section_headers(['Text', 'Text']))
+
     def test_fix_star(self):
         output = fix_star('*arg')
         self.assertEqual(r'\*arg', output)
@@ -0,0 +1,63 @@
+from sectiondoc.items import LineSpan
+from sectiondoc.util import add_indent, trim_indent
+from sectiondoc.tests._compat import unittest
+
+
+class TestLineSpan(unittest.TestCase):
+
+    def setUp(self):
+        self.lines = [
+            'term : int',
+            '        Definition.',
+            '',
+            '            Indented definition.  ',
+            '        ']
+
+    def test_span(self):
+        # given
+        span = LineSpan(self.lines, 1, 3)
+
+        # when/then
+        self.assertEqual(len(span), 2)
+        self.assertIsInstance(span.source, tuple)
+        self.assertEqual(list(span), ['        Definition.', ''])
+
+    def test_trim(self):
+        # given
+        span = LineSpan(self.lines, 1)
+
+        # when
+        trimmed = span.trim()
+
+        # then
+        self.assertIs(trimmed.source, span.source)
+        self.assertEqual(trimmed.indent, 8)
+        self.assertEqual(list(trimmed), trim_indent(self.lines[1:]))
+        with self.assertRaises(ValueError):
+            LineSpan(['', '   ']).trim()
+
+    def test_lines(self):
+        # given
+        span = LineSpan(self.lines, 1).trim()
+        expected = [line.rstrip() for line in trim_indent(self.lines[1:])]
+
+        # when/then
+        self.assertEqual(span.lines(), trim_indent(self.lines[1:]))
+        self.assertEqual(span.lines(rstrip=True), expected)
+        self.assertEqual(span.lines(4, rstrip=True), add_indent(expected))
+        self.assertEqual(
+            span.lines(8, rstrip=True), add_indent(expected, 8))
+
+    def test_lines_are_not_copied(self):
+        # given
+        span = LineSpan(self.lines, 1, 2).trim()
+
+        # when
+        lines = span.lines(8)
+
+        # then
+        self.assertIs(lines[0], self.lines[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+from sectiondoc.items import DefinitionItem, MethodItem
+from sectiondoc.styles.line_tokens import LineTokens
+from sectiondoc.util import get_indent, get_section_header, is_empty
+from sectiondoc.tests._compat import unittest
+
+
+class TestLineTokens(unittest.TestCase):
+
+    def setUp(self):
+        self.lines = [
+            'Parameters',
+            '----------  ',
+            '',
+            'x : int',
+            '    The value.',
+            '   ',
+            'method(arg)',
+            '\tText with tab',
+            'Input\\Output',
+            '------------',
+            'Word']
+
+    def test_columns(self):
+        # given
+        lines = self.lines
+
+        # when
+        tokens = LineTokens(lines)
+
+        # then
+        self.assertEqual(
+            list(tokens.blank), [is_empty(line) for line in lines])
+        self.assertEqual(
+            list(tokens.length), [len(line.rstrip()) for line in lines])
+        self.assertEqual(
+            [tokens.get_indent(index) for index in range(len(lines))],
+            [len(get_indent(line)) for line in lines])
+
+    def test_section_header(self):
+        # given
+        lines = self.lines
+        tokens = LineTokens(lines)
+
+        # when
+        headers = [tokens.section_header(index) for index in range(11)]
+
+        # then
+        expected = [
+            get_section_header(header, line)
+            for header, line in zip(lines, lines[1:] + [''])]
+        self.assertEqual(headers, expected)
+        self.assertEqual(headers[0], 'Parameters')
+        self.assertEqual(headers[8], 'Input\\Output')
+        self.assertEqual(tokens.underline[0], -1)
+
+    def test_is_item(self):
+        # given
+        tokens = LineTokens(self.lines)
+
+        # when/then
+        self.assertTrue(tokens.is_item(DefinitionItem, 3))
+        self.assertFalse(tokens.is_item(DefinitionItem, 2))
+        self.assertTrue(tokens.is_item(MethodItem, 6))
+        self.assertFalse(tokens.is_item(MethodItem, 3))
+        self.assertFalse(tokens.is_item(MethodItem, 11))
+        self.assertEqual(
+            list(tokens._items[DefinitionItem]),
+            [-1, -1, 0, 1, -1, -1, -1, -1, -1, -1, -1])
+
+
+if __name__ == '__main__':
+    unittest.main()
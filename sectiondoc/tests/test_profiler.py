@@ -0,0 +1,104 @@
+import pickle
+
+from sectiondoc.styles import Profiler
+from sectiondoc.styles.default import function_section
+from sectiondoc.tests._compat import unittest
+
+
+DOCSTRING = """ This is a sample function docstring.
+
+Parameters
+----------
+inputa : str
+    The first argument.
+
+Returns
+-------
+myvalue : list
+    A list of important values.
+
+Notes
+-----
+This is the test.
+"""
+
+
+class TestProfiler(unittest.TestCase):
+
+    def profile(self, profiler, name):
+        lines = DOCSTRING.splitlines()
+        profiler.profile(function_section(lines), name)
+        return lines
+
+    def test_profile(self):
+        # given
+        profiler = Profiler()
+        expected = DOCSTRING.splitlines()
+        function_section(expected).parse()
+
+        # when
+        lines = self.profile(profiler, 'sample')
+
+        # then
+        self.assertEqual(lines, expected)
+        self.assertEqual(profiler.docstrings, 1)
+        self.assertEqual(
+            profiler.sections, {'Parameters': 1, 'Returns': 1, 'Notes': 1})
+        self.assertEqual(sorted(profiler.times), sorted(Profiler.STAGES))
+        for stage in ('detection', 'extraction', 'rendering'):
+            self.assertGreater(profiler.times[stage], 0.0)
+        self.assertAlmostEqual(sum(profiler.times.values()), profiler.total)
+        self.assertEqual(
+            profiler.slowest, [(profiler.total, 'sample')])
+
+    def test_slowest(self):
+        # given
+        profiler = Profiler(size=2)
+
+        # when
+        profiler.record('a', 0.1, {}, {})
+        profiler.record('b', 0.3, {}, {})
+        profiler.record('c', 0.2, {}, {})
+
+        # then
+        self.assertEqual(profiler.slowest, [(0.3, 'b'), (0.2, 'c')])
+        self.assertAlmostEqual(profiler.total, 0.6)
+
+    def test_merge(self):
+        # given
+        profiler = Profiler()
+        other = Profiler()
+        self.profile(profiler, 'first')
+        self.profile(other, 'second')
+        total = profiler.total + other.total
+
+        # when
+        profiler.merge(pickle.loads(pickle.dumps(other)))
+
+        # then
+        self.assertEqual(profiler.docstrings, 2)
+        self.assertAlmostEqual(profiler.total, total)
+        self.assertEqual(profiler.sections['Returns'], 2)
+        self.assertEqual(
+            sorted(name for _, name in profiler.slowest),
+            ['first', 'second'])
+
+    def test_summary(self):
+        # given
+        profiler = Profiler()
+        self.profile(profiler, 'sample')
+
+        # when
+        summary = profiler.summary()
+
+        # then
+        self.assertTrue(
+            summary[0].startswith('sectiondoc: parsed 1 docstrings in'))
+        stages = [line.split()[0] for line in summary[3:7]]
+        self.assertEqual(stages, list(Profiler.STAGES))
+        self.assertIn('Parameters', '\n'.join(summary))
+        self.assertEqual(summary[-1].split()[0], 'sample')
+
+
+if __name__ == '__main__':
+    unittest.main()
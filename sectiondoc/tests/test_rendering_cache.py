@@ -0,0 +1,97 @@
+from sectiondoc.items import Item, MethodItem
+from sectiondoc.renderers import (
+    Argument, Attribute, ListItem, Method, rendering_cache)
+from sectiondoc.styles.default import function_section
+from sectiondoc.tests._compat import unittest
+
+
+class TestRenderingCache(unittest.TestCase):
+
+    def setUp(self):
+        rendering_cache.clear()
+        rendering_cache.maxsize = 10
+
+    def tearDown(self):
+        rendering_cache.clear()
+        rendering_cache.maxsize = 0
+
+    def test_render(self):
+        # given
+        item = Item('indent', ['int'], ['The indent to use.'])
+
+        # when
+        lines = Argument(item).render()
+        other = Argument(Item('indent', ['int'], ['The indent to use.']))
+
+        # then
+        self.assertEqual(lines, Argument(item).to_rst())
+        self.assertEqual(other.render(), lines)
+        self.assertEqual(rendering_cache.info()[:2], (1, 1))
+
+    def test_options_are_part_of_the_key(self):
+        # given
+        renderer = ListItem(Item('indent', ['int'], ['The indent to use.']))
+
+        # when
+        lines = renderer.render(prefix='-')
+        other = renderer.render(prefix=None)
+
+        # then
+        self.assertEqual(lines, renderer.to_rst(prefix='-'))
+        self.assertEqual(other, renderer.to_rst(prefix=None))
+        self.assertEqual(rendering_cache.info()[:2], (0, 2))
+
+        # given
+        renderer = Method(MethodItem('function', ['arg1'], ['Summary.']))
+
+        # when
+        lines = renderer.render(columns=(40, 10))
+
+        # then
+        self.assertEqual(renderer.render(columns=(40, 10)), lines)
+        self.assertNotEqual(renderer.render(columns=(40, 5)), lines)
+
+    def test_disabled(self):
+        # given
+        rendering_cache.maxsize = 0
+        item = Item('indent', ['int'], ['The indent to use.'])
+
+        # when
+        lines = Argument(item).render()
+
+        # then
+        self.assertEqual(lines, Argument(item).to_rst())
+        self.assertEqual(rendering_cache.info(), (0, 0, 0, 0))
+
+    def test_same_lines_with_and_without_cache(self):
+        # given
+        docstring = [
+            u'Parameters', u'----------',
+            u'value : int', u'    The value\u2028with\x0cseparators\x1c.',
+            u'']
+        items = [Item(u'value', [u'int'], [u'Text\u2028more\x0c.'])]
+
+        for maxsize in (0, 10):
+            rendering_cache.clear()
+            rendering_cache.maxsize = maxsize
+            lines = list(docstring)
+
+            # when
+            function_section(lines).parse()
+
+            # then
+            self.assertIn(
+                u'    The value\u2028with\x0cseparators\x1c.', lines)
+
+            for renderer in (Argument, Attribute, ListItem):
+                # when
+                block = renderer.shared().render_block(items)
+                rendered = renderer.shared().render_items(items)
+
+                # then
+                self.assertEqual(block.split(u'\n')[:-1], rendered)
+                self.assertEqual(renderer.shared().render(items[0]), rendered)
+
+
+if __name__ == '__main__':
+    unittest.main()
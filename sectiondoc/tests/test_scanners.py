@@ -0,0 +1,93 @@
+from sectiondoc.items.any_item import any_item_regex
+from sectiondoc.items.definition_item import definition_item_regex
+from sectiondoc.items.or_definition_item import definition_regex
+from sectiondoc.items.regex import function_regex
+from sectiondoc.items.scanners import (
+    is_any_header, is_definition_header, is_method_header,
+    is_or_definition_header)
+from sectiondoc.tests._compat import unittest
+
+
+LINES = [
+    '',
+    ' ',
+    'term',
+    '*args',
+    '**kwargs',
+    '***kwargs',
+    'term : int',
+    'term :int',
+    'term :',
+    'term : ',
+    'term : numpy.ndarray',
+    'term : int : float',
+    'term : int or float',
+    'term : int or',
+    'term : callable(x, y)',
+    'term : callable(x) : int',
+    'term : callable(f(x)) or int',
+    'term : int or callable(f(x))',
+    'term : callable(x)(y)',
+    'term : callable(x) or callable(y)',
+    'term : callable(x\n) or y',
+    'term : callable(x',
+    'term : callable(x))',
+    'term : callable(x)\n',
+    'term\n',
+    'term\n : text',
+    'term : text\nmore',
+    'The definition (of the term).',
+    'get_field()',
+    'get_field(a, b)  ',
+    'get_field(\n)',
+    'get_field(a)\n(b)',
+    'get_field',
+    '(x)']
+
+
+class TestScanners(unittest.TestCase):
+
+    def test_same_as_regexes(self):
+        # given
+        checks = [
+            (is_definition_header, definition_item_regex),
+            (is_or_definition_header, definition_regex),
+            (is_any_header, any_item_regex),
+            (is_method_header, function_regex)]
+
+        for scanner, regex in checks:
+            for line in LINES:
+                if scanner is is_definition_header:
+                    line = line.rstrip()
+
+                # when
+                result = scanner(line)
+
+                # then
+                self.assertEqual(
+                    result, regex.match(line) is not None,
+                    msg='{0} {1!r}'.format(scanner.__name__, line))
+
+    def test_adversarial_lines(self):
+        # given
+        # The item regexes do not finish on these lines in a reasonable
+        # time.
+        size = 1000
+        lines = [
+            (is_definition_header, 'x' + ' : a' * size + ' !'),
+            (is_definition_header, 'x' + ' : a()' * size + ' !'),
+            (is_definition_header, 'x' + ' : a(b)' * size + '(!'),
+            (is_or_definition_header, 'x : a(' + ') or b(' * size + 'z')]
+
+        for scanner, line in lines:
+            # when/then
+            self.assertFalse(scanner(line))
+
+        # when/then
+        self.assertTrue(is_definition_header('x' + ' : a(b)' * size))
+        self.assertTrue(
+            is_or_definition_header('x : a(' + ') or b(' * size + ')'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+from sectiondoc.sections import arguments, notes_paragraph
+from sectiondoc.renderers import Argument
+from sectiondoc.items import DefinitionItem
+from sectiondoc.styles import SectionMap, SinglePassRender
+from sectiondoc.styles.section_map import normalize_header
+from sectiondoc.tests._compat import unittest
+
+
+class TestSectionMap(unittest.TestCase):
+
+    def setUp(self):
+        self.arguments = (arguments, Argument, DefinitionItem)
+        self.notes = (notes_paragraph, None, None)
+        self.sections = SectionMap({
+            'Other Parameters': self.arguments, 'Notes': self.notes})
+
+    def test_normalize_header(self):
+        self.assertEqual(
+            normalize_header('Other  Parameters '), 'other parameters')
+        self.assertEqual(normalize_header('NOTES'), 'notes')
+
+    def test_get(self):
+        sections = self.sections
+
+        self.assertIs(sections.get('Notes'), self.notes)
+        self.assertIs(sections.get('NOTES'), self.notes)
+        self.assertIs(sections.get('other  parameters'), self.arguments)
+        self.assertIsNone(sections.get('Returns'))
+        self.assertEqual(sections.get('Returns', 1), 1)
+
+    def test_mapping(self):
+        sections = self.sections
+
+        self.assertEqual(len(sections), 2)
+        self.assertEqual(sorted(sections), ['Notes', 'Other Parameters'])
+        self.assertIn('notes', sections)
+        self.assertNotIn('Returns', sections)
+        self.assertIs(sections['notes'], self.notes)
+        with self.assertRaises(KeyError):
+            sections['Returns']
+        with self.assertRaises(TypeError):
+            sections['Returns'] = self.notes
+
+    def test_render_normalized_header(self):
+        # given
+        lines = ['Text', '', 'NOTES', '-----', 'A note.', '']
+
+        # when
+        SinglePassRender(lines, sections=self.sections).parse()
+
+        # then
+        self.assertEqual(
+            lines, ['Text', '', '.. note::', '    A note.', ''])
+
+
+if __name__ == '__main__':
+    unittest.main()
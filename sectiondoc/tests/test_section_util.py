@@ -0,0 +1,56 @@
+from sectiondoc.items import MethodItem
+from sectiondoc.sections.util import get_column_lengths
+from sectiondoc.tests._compat import unittest
+
+
+class TestGetColumnLengths(unittest.TestCase):
+
+    def test_same_item(self):
+        # given
+        items = [
+            MethodItem('function', ['arg1, arg2'], ['Summary', 'line.']),
+            MethodItem('f', ['a'], ['A longer summary line.'])]
+
+        # when
+        columns = get_column_lengths(items)
+
+        # then
+        signature = items[0].signature
+        self.assertEqual(
+            columns,
+            (len('function' + signature) + 11, len('A longer summary line.')))
+
+    def test_different_items(self):
+        # given
+        items = [
+            MethodItem('long_name', [''], ['']),
+            MethodItem('f', ['a, b, c, d, e, f, g'], ['Summary.'])]
+
+        # when
+        columns = get_column_lengths(items)
+
+        # then
+        widths = [len(item.term + item.signature) for item in items]
+        self.assertEqual(columns, (max(widths) + 11, len('Summary.')))
+
+    def test_first_of_equal_items(self):
+        # given
+        items = [
+            MethodItem('abc', ['x'], []),
+            MethodItem('def', ['x'], ['Text.']),
+            MethodItem('g', ['x, y'], ['  Text ', 'more  '])]
+
+        # when
+        columns = get_column_lengths(items)
+
+        # then
+        self.assertEqual(
+            columns, (len('abcabc(x)') + 11, len('  Text  more  ')))
+
+    def test_no_items(self):
+        with self.assertRaises(ValueError):
+            get_column_lengths([])
+
+
+if __name__ == '__main__':
+    unittest.main()
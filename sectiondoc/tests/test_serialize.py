@@ -0,0 +1,172 @@
+import marshal
+import struct
+import sys
+
+from sectiondoc.items import item_cache, string_table
+from sectiondoc.styles import (
+    DocumentParser, Section, dump_documents, load_documents)
+from sectiondoc.styles.default import CLASS_SECTIONS, FUNCTION_SECTIONS
+from sectiondoc.styles.serialize import FORMAT_VERSION, MAGIC
+from sectiondoc.tests._compat import unittest
+
+
+FUNCTION_DOCSTRING = """ This is a sample docstring.
+
+Parameters
+----------
+inputa : str
+    The first argument.
+
+        Indented more.
+inputb : float
+
+Returns
+-------
+myvalue : list
+    A list of important values.
+
+
+Notes
+-----
+This is the note.
+"""
+
+CLASS_DOCSTRING = """ This is a sample class.
+
+Methods
+-------
+get_field(name)
+    Get the field description.
+set_field()
+
+Example
+-------
+Some text.
+"""
+
+
+class TestSerialize(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        # The items are not shared with the other tests, thus their
+        # definitions are not parsed yet.
+        item_cache.clear()
+        self.documents = [
+            DocumentParser(
+                FUNCTION_DOCSTRING.splitlines(),
+                sections=FUNCTION_SECTIONS).parse(),
+            DocumentParser(
+                CLASS_DOCSTRING.splitlines(), sections=CLASS_SECTIONS).parse()]
+
+    def test_round_trip(self):
+        # given
+        data = dump_documents(self.documents)
+        string_table.clear()
+
+        # when
+        documents = load_documents(data)
+
+        # then
+        self.assertEqual(len(documents), 2)
+        for document, loaded in zip(self.documents, documents):
+            self.assertEqual(loaded.source, document.source)
+            self.assertEqual(
+                [type(part) for part in loaded.parts],
+                [type(part) for part in document.parts])
+            self.assertEqual(loaded.sections, document.sections)
+            for section, loaded_section in zip(
+                    document.sections, loaded.sections):
+                self.assertIs(loaded_section.item_type, section.item_type)
+                if section.kind != 'items':
+                    continue
+                for item, loaded_item in zip(
+                        section.content, loaded_section.content):
+                    self.assertIs(type(loaded_item), type(item))
+                    self.assertEqual(loaded_item.term, item.term)
+                    self.assertEqual(
+                        loaded_item.classifiers, item.classifiers)
+                    self.assertEqual(
+                        loaded_item.definition, item.definition)
+                    self.assertIn(loaded_item.term, string_table)
+        self.assertEqual(
+            documents[0].render(FUNCTION_SECTIONS),
+            self.documents[0].render(FUNCTION_SECTIONS))
+        self.assertEqual(
+            documents[1].render(CLASS_SECTIONS),
+            self.documents[1].render(CLASS_SECTIONS))
+
+    def test_round_trip_parsed_definitions(self):
+        # given
+        section = self.documents[0].sections[0]
+        definitions = [item.definition for item in section.content]
+
+        # when
+        documents = load_documents(dump_documents(self.documents))
+
+        # then
+        loaded = documents[0].sections[0]
+        self.assertIsInstance(loaded, Section)
+        self.assertEqual(
+            [item.definition for item in loaded.content], definitions)
+        self.assertEqual(
+            [item.definition for item in section.content],
+            [('The first argument.', '', '    Indented more.'), ('',)])
+
+    def test_shared_strings(self):
+        # given
+        document = self.documents[0]
+
+        # when
+        data = dump_documents([document, document])
+
+        # then
+        self.assertLess(
+            len(data), 2 * len(dump_documents([document])))
+
+    def test_format_version(self):
+        # given
+        data = dump_documents(self.documents)
+        header = struct.pack('<4sH', MAGIC, FORMAT_VERSION + 1)
+
+        # when/then
+        with self.assertRaises(ValueError):
+            load_documents(header + data[len(header):])
+        with self.assertRaises(ValueError):
+            load_documents(b'DATA' + data[4:])
+        with self.assertRaises(ValueError):
+            load_documents(b'')
+
+    def test_corrupted_data(self):
+        # given
+        data = dump_documents(self.documents)
+        header = struct.pack('<4sH', MAGIC, FORMAT_VERSION)
+
+        # when/then
+        for corrupted in (
+                data[:-10], data[:50], data[:len(header) + 1],
+                header + marshal.dumps((), 2),
+                header + marshal.dumps(((), (), ((0, ()),)), 2),
+                header + marshal.dumps(((), (), ((), ((0, 1, 2),))), 2)):
+            with self.assertRaises(ValueError):
+                load_documents(corrupted)
+
+    def test_item_types_are_not_imported(self):
+        # given
+        data = dump_documents(self.documents)
+        size = struct.calcsize('<4sH')
+        strings, types, records = marshal.loads(data[size:])
+        self.assertNotIn('this', sys.modules)
+
+        for name in ('this:Item', 'sys:path', 'sectiondoc.items:Item2'):
+            corrupted = data[:size] + marshal.dumps(
+                (strings, (name,) * len(types), records), 2)
+
+            # when/then
+            with self.assertRaises(ValueError):
+                load_documents(corrupted)
+        self.assertNotIn('this', sys.modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
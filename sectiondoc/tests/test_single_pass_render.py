@@ -0,0 +1,270 @@
+from sectiondoc.styles import (
+    Budget, BudgetExceeded, DocRender, DocumentParser, SinglePassRender,
+    StreamRender)
+from sectiondoc.styles.default import (
+    FUNCTION_SECTIONS, class_section, function_section)
+from sectiondoc.tests._compat import unittest
+
+
+DOCSTRING = """ This is a sample docstring.
+
+
+Parameters
+----------
+
+inputa : str
+    The first argument holds the first input!.
+
+    This is the second paragraph.
+
+
+inputb : float
+    The second argument is a float.
+Input\\Output header
+-------------------
+Some text.
+
+Methods
+-------
+get_field()
+    Get the field description.
+
+Returns
+-------
+myvalue : list
+    A list of important values.
+
+Raises
+------
+TypeError
+
+ValueError
+    Description of another case where errors are raised.
+
+Attributes
+----------
+index : int
+    The current zero-based line number.
+
+Notes
+-----
+This is the test.
+
+This is not a note.
+"""
+
+
+class TestSinglePassRender(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_pop(self):
+        # given
+        doc_render = SinglePassRender(['A', 'B'])
+
+        # when/then
+        self.assertEqual(doc_render.pop(), 'A')
+        self.assertEqual(doc_render.pop(index=1), 'B')
+        with self.assertRaises(IndexError):
+            doc_render.pop()
+        self.assertEqual(doc_render.docstring, ['A', 'B'])
+        self.assertEqual(doc_render.output, [])
+
+    def test_remove_lines(self):
+        # given
+        doc_render = SinglePassRender(['A', ' ', 'B'])
+
+        # when
+        doc_render.remove_if_empty()
+
+        # then
+        self.assertEqual(doc_render.index, 0)
+
+        # when
+        doc_render.remove_lines(0)
+        doc_render.remove_if_empty()
+
+        # then
+        self.assertEqual(doc_render.index, 2)
+
+        # when/then
+        with self.assertRaises(IndexError):
+            doc_render.remove_lines(0)
+
+        # when
+        doc_render.remove_lines(2, count=3)
+
+        # then
+        self.assertTrue(doc_render.eod)
+        self.assertEqual(doc_render.output, [])
+
+    def test_seek_to_next_empty_line(self):
+        # given
+        doc_render = SinglePassRender(['A', '', ' ', 'B'])
+
+        # when
+        doc_render.seek_to_next_non_empty_line()
+
+        # then
+        self.assertEqual(doc_render.index, 0)
+        self.assertEqual(doc_render.output, [])
+
+        # when
+        doc_render.index = 1
+        doc_render.seek_to_next_non_empty_line()
+
+        # then
+        self.assertEqual(doc_render.index, 3)
+        self.assertEqual(doc_render.output, ['', ' '])
+
+    def test_get_next_block(self):
+        # given
+        doc_render = SinglePassRender([
+            'term1',
+            '    Definition1',
+            'term2 : classifier',
+            '    Definition2',
+            '     ',
+            'term3',
+            '',
+            '',
+            'term4 : classifier',
+            '    Definition3',
+            '',
+            '    MoreDefinition3  ',
+            ''])
+
+        # when/then
+        self.assertEqual(
+            doc_render.get_next_block(), ['term1', '    Definition1'])
+        self.assertEqual(
+            doc_render.get_next_block(),
+            ['term2 : classifier', '    Definition2'])
+        self.assertEqual(doc_render.get_next_block(), ['term3'])
+        self.assertEqual(doc_render.output, ['', ''])
+        self.assertEqual(
+            doc_render.get_next_block(),
+            ['term4 : classifier',
+             '    Definition3', '', '    MoreDefinition3'])
+        self.assertEqual(doc_render.output, ['', '', ''])
+        self.assertTrue(doc_render.eod)
+        with self.assertRaises(IndexError):
+            doc_render.get_next_block()
+
+    def test_get_next_paragraph(self):
+        # given
+        doc_render = SinglePassRender(['A', 'B', '', 'C'])
+
+        # when/then
+        self.assertEqual(doc_render.get_next_paragraph(), ['A', 'B'])
+        self.assertEqual(doc_render.index, 2)
+        self.assertEqual(doc_render.get_next_paragraph(), [])
+
+    def test_insert_and_move(self):
+        # given
+        doc_render = SinglePassRender(['A', 'B'])
+
+        # when
+        doc_render.insert_and_move(['C', ''], index=0)
+
+        # then
+        self.assertEqual(doc_render.output, ['C', ''])
+        self.assertEqual(doc_render.index, 0)
+
+        # when/then
+        with self.assertRaises(IndexError):
+            doc_render.insert_and_move(['6', '2'], index=1)
+
+    def test_text_chunks(self):
+        # given
+        lines = ['A', 'Header', '------', 'B']
+
+        def section(doc, header, renderer, item_class):
+            return ['C\n\n', 'D']
+
+        doc_render = SinglePassRender(
+            lines, sections={'Header': (section, None, None)})
+
+        # when
+        doc_render.parse()
+
+        # then
+        self.assertEqual(lines, ['A', 'C', '', '', 'D', 'B'])
+
+    def test_goto_bookmark(self):
+        # given
+        doc_render = SinglePassRender(['A', 'B', 'C'])
+        doc_render.bookmark()
+        doc_render.bookmarks.append(2)
+
+        # when
+        bookmark = doc_render.goto_bookmark()
+
+        # then
+        self.assertEqual(bookmark, 2)
+        self.assertEqual(doc_render.index, 2)
+        self.assertEqual(doc_render.output, ['A', 'B'])
+
+        # when/then
+        with self.assertRaises(IndexError):
+            doc_render.goto_bookmark()
+        self.assertEqual(doc_render.bookmarks, [0])
+
+    def test_same_output_as_doc_render(self):
+        for factory in (class_section, function_section):
+            # given
+            expected = DOCSTRING.splitlines()
+            DocRender(expected, sections=factory([]).sections).parse()
+            lines = DOCSTRING.splitlines()
+            doc_render = factory(lines)
+
+            # when
+            doc_render.parse()
+
+            # then
+            self.assertIsInstance(doc_render, SinglePassRender)
+            self.assertEqual(lines, expected)
+
+    def test_parse_replaces_lines(self):
+        # given
+        lines = DOCSTRING.splitlines()
+
+        # when
+        SinglePassRender(lines).parse()
+
+        # then
+        self.assertIn('.. rubric:: Parameters', lines)
+
+    def test_budget(self):
+        # given
+        lines = DOCSTRING.splitlines()
+        doc_render = SinglePassRender(lines)
+        doc_render.budget = Budget(steps=3)
+
+        # when/then
+        with self.assertRaises(BudgetExceeded):
+            doc_render.parse()
+        self.assertEqual(lines, DOCSTRING.splitlines())
+        self.assertEqual(doc_render.budget.count, 4)
+
+    def test_budget_counts_item_blocks(self):
+        # given
+        docstring = ['Parameters', '----------']
+        for index in range(20):
+            docstring += ['arg{0} : int'.format(index), '    Argument.']
+        for engine in (
+                DocRender, SinglePassRender, StreamRender, DocumentParser):
+            lines = list(docstring)
+            doc_render = engine(lines, sections=FUNCTION_SECTIONS)
+            doc_render.budget = Budget(steps=5)
+
+            # when/then
+            with self.assertRaises(BudgetExceeded):
+                doc_render.parse()
+            self.assertEqual(lines, docstring)
+            self.assertEqual(doc_render.budget.count, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+from sectiondoc.styles import DocRender, StreamRender, Style
+from sectiondoc.styles.default import class_section, function_section
+from sectiondoc.tests._compat import unittest
+from sectiondoc.tests.test_single_pass_render import DOCSTRING
+
+
+class TestStreamRender(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+
+    def test_render_iterator(self):
+        for factory in (class_section, function_section):
+            # given
+            sections = factory([]).sections
+            expected = DOCSTRING.splitlines()
+            DocRender(expected, sections=sections).parse()
+            doc_render = StreamRender(
+                iter(DOCSTRING.splitlines()), sections=sections)
+
+            # when
+            lines = list(doc_render.render())
+
+            # then
+            self.assertEqual(lines, expected)
+
+    def test_parse_replaces_lines(self):
+        # given
+        lines = DOCSTRING.splitlines()
+        expected = list(lines)
+        DocRender(expected).parse()
+
+        # when
+        StreamRender(lines).parse()
+
+        # then
+        self.assertEqual(lines, expected)
+
+    def test_bounded_window(self):
+        # given
+        sizes = []
+        renderers = []
+
+        def lines():
+            for index in range(2000):
+                for line in ('Notes', '-----', 'Paragraph', 'more', '', ''):
+                    if renderers:
+                        sizes.append(len(renderers[0]._window))
+                    yield line
+
+        doc_render = StreamRender(
+            lines(), sections=function_section([]).sections)
+        renderers.append(doc_render)
+
+        # when
+        count = sum(1 for _ in doc_render.render())
+
+        # then
+        self.assertEqual(count, 2000 * 5)
+        self.assertLessEqual(max(sizes), 2)
+        self.assertEqual(doc_render.index, 2000 * 6)
+
+    def test_render_is_lazy(self):
+        # given
+        read = []
+
+        def lines():
+            for line in DOCSTRING.splitlines():
+                read.append(line)
+                yield line
+
+        doc_render = StreamRender(lines())
+
+        # when
+        first = next(doc_render.render())
+
+        # then
+        self.assertEqual(first, ' This is a sample docstring.')
+        self.assertLessEqual(len(read), 4)
+
+    def test_cannot_move_backwards(self):
+        # given
+        doc_render = StreamRender(iter(['A', 'B', 'C']))
+        doc_render.read()
+
+        # when/then
+        with self.assertRaises(IndexError):
+            doc_render.index = 0
+        self.assertEqual(doc_render.peek(), 'B')
+        self.assertEqual(doc_render.peek(1), 'C')
+        self.assertEqual(doc_render.peek(2), '')
+
+    def test_style_iter_rendered(self):
+        # given
+        style = Style({'function': function_section})
+        expected = DOCSTRING.splitlines()
+        function_section(expected).parse()
+
+        # when
+        lines = style.iter_rendered('function', iter(DOCSTRING.splitlines()))
+
+        # then
+        self.assertEqual(list(lines), expected)
+        self.assertEqual(
+            list(style.iter_rendered('module', iter(['A', 'B']))), ['A', 'B'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,562 @@
+import contextlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+
+from sectiondoc.cache import LRUCache
+from sectiondoc.items import DefinitionItem, item_cache, string_table
+from sectiondoc.renderers import Definition, rendering_cache
+from sectiondoc.sections import item_list
+from sectiondoc.styles import (
+    Budget, Profiler, SinglePassRender, Style, default, legacy)
+from sectiondoc.styles.default import (
+    FUNCTION_SECTIONS, class_section, function_section)
+from sectiondoc.styles.section_map import SectionMap
+from sectiondoc.tests._compat import unittest
+
+
+DOCSTRING = """ This is a sample function docstring.
+
+Returns
+-------
+myvalue : list
+    A list of important values.
+"""
+
+RST = """ This is a sample function docstring.
+
+:returns:
+    **myvalue** (*list*) --
+    A list of important values.
+
+
+"""
+
+
+class Config(object):
+    pass
+
+
+class Environment(object):
+    pass
+
+
+class DummyApp(object):
+
+    def __init__(self, doctreedir):
+        self.doctreedir = doctreedir
+        self.config = Config()
+        self.env = Environment()
+        self.events = {}
+        self.extensions = []
+
+    def setup_extension(self, name):
+        self.extensions.append(name)
+
+    def add_config_value(self, name, default, rebuild):
+        setattr(self.config, name, default)
+
+    def connect(self, event, callback):
+        self.events.setdefault(event, []).append(callback)
+
+    def emit(self, event, *args):
+        return [callback(self, *args) for callback in self.events[event]]
+
+
+class RecordingHandler(logging.Handler):
+
+    def __init__(self, level):
+        logging.Handler.__init__(self, level)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+@contextlib.contextmanager
+def captured_logs(name, level):
+    """ Collect the messages of the logger (``assertLogs`` is not
+    available on python 2.7).
+
+    """
+    handler = RecordingHandler(level)
+    logger = logging.getLogger(name)
+    previous = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    try:
+        yield handler.messages
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(previous)
+
+
+class CountingFactory(object):
+
+    __name__ = 'counting_factory'
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.calls = 0
+
+    def __call__(self, lines):
+        self.calls += 1
+        return self.factory(lines)
+
+
+class TestStyle(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.doctreedir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.doctreedir)
+
+    def render(self, app):
+        lines = DOCSTRING.splitlines()
+        app.emit(
+            'autodoc-process-docstring', 'function', 'name', None, {}, lines)
+        return '\n'.join(lines) + '\n'
+
+    def test_render_docstring(self):
+        # given
+        style = Style({'function': function_section})
+        lines = DOCSTRING.splitlines()
+
+        # when
+        style.render_docstring(None, 'function', 'name', None, {}, lines)
+
+        # then
+        self.assertMultiLineEqual('\n'.join(lines) + '\n', RST)
+
+        # when
+        lines = DOCSTRING.splitlines()
+        style.render_docstring(None, 'module', 'name', None, {}, lines)
+
+        # then
+        self.assertEqual(lines, DOCSTRING.splitlines())
+
+    def test_setup(self):
+        # given
+        app = DummyApp(self.doctreedir)
+        style = Style({'function': function_section})
+        item_cache.clear()
+
+        # when
+        style.setup(app)
+        app.emit('builder-inited')
+
+        # then
+        self.assertEqual(app.extensions, ['sphinx.ext.autodoc'])
+        self.assertFalse(app.config.sectiondoc_cache)
+        self.assertIsNone(style.cache)
+        self.assertEqual(rendering_cache.maxsize, 0)
+        self.assertEqual(len(string_table), 0)
+        self.assertMultiLineEqual(self.render(app), RST)
+        self.assertIn('myvalue', string_table)
+
+    def test_setup_metadata(self):
+        for module in (default, legacy):
+            # given
+            app = DummyApp(self.doctreedir)
+
+            # when
+            metadata = module.setup(app)
+
+            # then
+            self.assertTrue(metadata['parallel_read_safe'])
+            self.assertTrue(metadata['parallel_write_safe'])
+            self.assertIn('autodoc-process-docstring', app.events)
+            self.assertIn('env-merge-info', app.events)
+
+    def test_merge_parallel_render_cache(self):
+        # given
+        app = DummyApp(self.doctreedir)
+        style = Style({'function': function_section})
+        style.setup(app)
+        app.config.sectiondoc_cache = True
+        app.emit('builder-inited')
+        worker_app = DummyApp(self.doctreedir)
+        worker_style = Style({'function': function_section})
+        worker_style.setup(worker_app)
+        worker_app.config.sectiondoc_cache = True
+        worker_app.emit('builder-inited')
+
+        # when
+        self.render(worker_app)
+        app.emit('env-merge-info', app.env, ['index'], worker_app.env)
+        app.emit('env-updated', app.env)
+
+        # then
+        self.assertEqual(len(style.cache), 1)
+        self.assertEqual(style.cache.items(), worker_style.cache.items())
+        self.assertFalse(hasattr(app.env, 'sectiondoc_rendered'))
+
+    def test_setup_rendering_cache(self):
+        # given
+        app = DummyApp(self.doctreedir)
+        style = Style({'function': function_section})
+        style.setup(app)
+        app.config.sectiondoc_rendering_cache_size = 100
+
+        # when
+        try:
+            app.emit('builder-inited')
+            self.render(app)
+            self.render(app)
+            info = rendering_cache.info()
+        finally:
+            rendering_cache.maxsize = 0
+
+        # then
+        self.assertEqual(info, (1, 1, 100, 1))
+
+    def test_render_cache(self):
+        # given
+        factory = CountingFactory(function_section)
+        style = Style({'function': factory}, cache=LRUCache())
+        # The identity of the style reads the sections of the factory.
+        style.cache_key('function', [])
+        factory.calls = 0
+
+        # when
+        first = DOCSTRING.splitlines()
+        style.render_docstring(None, 'function', 'name', None, {}, first)
+        lines = DOCSTRING.splitlines()
+        style.render_docstring(None, 'function', 'name', None, {}, lines)
+
+        # then
+        self.assertEqual(lines, first)
+        self.assertMultiLineEqual('\n'.join(lines) + '\n', RST)
+        self.assertEqual(factory.calls, 1)
+        self.assertEqual(style.cache.info().hits, 1)
+
+        # when
+        lines = DOCSTRING.splitlines()
+        style.render_docstring(None, 'class', 'name', None, {}, lines)
+
+        # then
+        self.assertEqual(factory.calls, 1)
+
+    def test_reuse_renderers(self):
+        # given
+        factory = CountingFactory(function_section)
+        style = Style({'function': factory, 'method': factory})
+        results = []
+
+        def render(what):
+            lines = DOCSTRING.splitlines()
+            style.render_docstring(None, what, 'name', None, {}, lines)
+            results.append('\n'.join(lines) + '\n')
+
+        # when
+        for what in ('function', 'method', 'function', 'method'):
+            render(what)
+        thread = threading.Thread(
+            target=lambda: [render('function') for _ in range(3)])
+        thread.start()
+        thread.join()
+
+        # then
+        # The second call of the factory shows that the sections are
+        # shared, the renderer is reused after that.
+        self.assertEqual(results, [RST] * 7)
+        self.assertEqual(factory.calls, 4)
+
+    def test_do_not_reuse_other_renderers(self):
+        # given
+        def per_call_section(lines):
+            return SinglePassRender(
+                lines, sections=SectionMap(FUNCTION_SECTIONS))
+
+        class Renderer(object):
+
+            def __init__(self, lines):
+                self.lines = lines
+
+            def parse(self):
+                self.lines[:] = RST.splitlines()
+
+        for function in (per_call_section, Renderer):
+            factory = CountingFactory(function)
+            style = Style({'function': factory})
+
+            # when
+            for _ in range(4):
+                lines = DOCSTRING.splitlines()
+                style.render_docstring(
+                    None, 'function', 'name', None, {}, lines)
+
+                # then
+                self.assertMultiLineEqual('\n'.join(lines) + '\n', RST)
+            self.assertEqual(factory.calls, 4)
+
+    def test_profiler_with_reused_renderers(self):
+        # given
+        style = Style({'function': function_section}, profiler=Profiler())
+
+        # when
+        for _ in range(3):
+            lines = DOCSTRING.splitlines()
+            style.render_docstring(None, 'function', 'name', None, {}, lines)
+
+        # then
+        self.assertEqual(style.profiler.docstrings, 3)
+        self.assertEqual(style.profiler.sections, {'Returns': 3})
+
+    def test_skip_docstrings_without_headers(self):
+        # given
+        factory = CountingFactory(function_section)
+        style = Style({'function': factory}, cache=LRUCache())
+        # The identity of the style reads the sections of the factory.
+        style.cache_key('function', [])
+        factory.calls = 0
+        lines = ['A one-liner.', '']
+
+        # when
+        style.render_docstring(None, 'function', 'name', None, {}, lines)
+
+        # then
+        self.assertEqual(lines, ['A one-liner.', ''])
+        self.assertEqual(factory.calls, 0)
+        self.assertEqual(len(style.cache), 0)
+
+    def test_render_cache_keys(self):
+        # given
+        style = Style({'function': function_section})
+        other_style = Style({'function': class_section})
+        lines = DOCSTRING.splitlines()
+
+        # when
+        key = style.cache_key('function', lines)
+
+        # then
+        self.assertEqual(key, style.cache_key('function', list(lines)))
+        self.assertNotEqual(key, style.cache_key('method', lines))
+        self.assertNotEqual(key, style.cache_key('function', lines[:-1]))
+        self.assertNotEqual(key, other_style.cache_key('function', lines))
+
+        # when
+        style.rendering_map = {'function': class_section}
+
+        # then
+        self.assertEqual(style.identity, other_style.identity)
+        self.assertEqual(
+            style.cache_key('function', lines),
+            other_style.cache_key('function', lines))
+
+    def test_persistent_render_cache(self):
+        # given
+        factory = CountingFactory(function_section)
+        app = DummyApp(os.path.join(self.doctreedir, 'doctrees'))
+        style = Style({'function': factory})
+        style.setup(app)
+        app.config.sectiondoc_cache = True
+        app.config.sectiondoc_cache_size = 5
+
+        # when
+        app.emit('builder-inited')
+        first = self.render(app)
+        app.emit('build-finished', None)
+
+        # then
+        # The factory is also called once for the identity of the style.
+        self.assertEqual(factory.calls, 2)
+
+        # given
+        app = DummyApp(app.doctreedir)
+        app.env.all_docs = {'index': 0}
+        style = Style({'function': factory})
+        style.setup(app)
+        app.config.sectiondoc_cache = True
+        app.config.sectiondoc_cache_size = 5
+
+        # when
+        app.emit('builder-inited')
+        second = self.render(app)
+
+        # then
+        self.assertEqual(factory.calls, 3)
+        self.assertEqual(style.cache.maxsize, 5)
+        self.assertMultiLineEqual(first, second)
+
+        # given
+        app = DummyApp(app.doctreedir)
+        style = Style({'function': factory})
+        style.setup(app)
+        app.config.sectiondoc_cache = True
+
+        # when
+        app.emit('builder-inited')
+
+        # then
+        # The environment is fresh, the cache of the last build is stale.
+        self.assertEqual(len(style.cache), 0)
+
+    def test_render_cache_identity(self):
+        # given
+        style = Style({'function': function_section})
+        same_style = Style({'function': function_section})
+        lines = DOCSTRING.splitlines()
+
+        def other_section(lines):
+            return SinglePassRender(lines, sections=SectionMap(dict(
+                FUNCTION_SECTIONS, Returns=(
+                    item_list, Definition, DefinitionItem))))
+
+        other_section.__name__ = 'function_section'
+        other_section.__module__ = function_section.__module__
+        other_style = Style({'function': other_section})
+
+        # when/then
+        self.assertEqual(style.identity, same_style.identity)
+        self.assertNotEqual(style.identity, other_style.identity)
+        self.assertNotEqual(
+            style.cache_key('function', lines),
+            other_style.cache_key('function', lines))
+
+    def test_failed_build_does_not_save_cache(self):
+        # given
+        app = DummyApp(self.doctreedir)
+        style = Style({'function': function_section})
+        style.setup(app)
+        app.config.sectiondoc_cache = True
+
+        # when
+        app.emit('builder-inited')
+        self.render(app)
+        app.emit('build-finished', RuntimeError())
+
+        # then
+        self.assertEqual(os.listdir(self.doctreedir), [])
+
+    def test_profiler(self):
+        # given
+        style = Style({'function': function_section}, profiler=Profiler())
+        lines = DOCSTRING.splitlines()
+
+        # when
+        style.render_docstring(None, 'function', 'name', None, {}, lines)
+
+        # then
+        self.assertMultiLineEqual('\n'.join(lines) + '\n', RST)
+        self.assertEqual(style.profiler.docstrings, 1)
+        self.assertEqual(style.profiler.sections, {'Returns': 1})
+
+    def test_merge_parallel_profiler(self):
+        # given
+        app = DummyApp(self.doctreedir)
+        style = Style({'function': function_section})
+        style.setup(app)
+        app.config.sectiondoc_profile = True
+        app.emit('builder-inited')
+        worker_app = DummyApp(self.doctreedir)
+        worker_style = Style({'function': function_section})
+        worker_style.setup(worker_app)
+        worker_app.config.sectiondoc_profile = True
+        worker_app.emit('builder-inited')
+
+        # when
+        self.render(worker_app)
+        self.render(app)
+        app.emit('env-merge-info', app.env, ['index'], worker_app.env)
+        app.emit('env-updated', app.env)
+
+        # then
+        self.assertEqual(style.profiler.docstrings, 2)
+        self.assertFalse(hasattr(app.env, 'sectiondoc_profile'))
+
+    def test_profiler_report(self):
+        # given
+        app = DummyApp(self.doctreedir)
+        style = Style({'function': function_section})
+        style.setup(app)
+        app.config.sectiondoc_profile = True
+        app.emit('builder-inited')
+        self.render(app)
+        app.emit('env-updated', app.env)
+
+        # when
+        with captured_logs('sphinx.sectiondoc', logging.INFO) as messages:
+            app.emit('build-finished', None)
+
+        # then
+        self.assertIn('parsed 1 docstrings', messages[0])
+
+    def test_profiler_disabled(self):
+        # given
+        app = DummyApp(self.doctreedir)
+        style = Style({'function': function_section})
+        style.setup(app)
+
+        # when
+        app.emit('builder-inited')
+        self.render(app)
+
+        # then
+        self.assertIsNone(style.profiler)
+        self.assertFalse(hasattr(app.env, 'sectiondoc_profile'))
+
+    def test_budget(self):
+        # given
+        style = Style(
+            {'function': function_section}, cache=LRUCache(),
+            budget=Budget(steps=1))
+        lines = DOCSTRING.splitlines()
+
+        # when
+        style.render_docstring(None, 'function', 'name', None, {}, lines)
+
+        # then
+        self.assertEqual(lines, DOCSTRING.splitlines())
+        self.assertEqual(style.exceeded, ['name'])
+        self.assertEqual(len(style.cache), 0)
+        self.assertEqual(style.budget.count, 0)
+
+    def test_budget_report(self):
+        # given
+        app = DummyApp(self.doctreedir)
+        style = Style({'function': function_section})
+        style.setup(app)
+        app.config.sectiondoc_budget_steps = 1
+        app.emit('builder-inited')
+        worker_app = DummyApp(self.doctreedir)
+        worker_style = Style({'function': function_section})
+        worker_style.setup(worker_app)
+        worker_app.config.sectiondoc_budget_steps = 1
+        worker_app.emit('builder-inited')
+
+        # when
+        self.assertMultiLineEqual(self.render(worker_app), DOCSTRING)
+        self.assertMultiLineEqual(self.render(app), DOCSTRING)
+        app.emit('env-merge-info', app.env, ['index'], worker_app.env)
+        app.emit('env-updated', app.env)
+        with captured_logs(
+                'sphinx.sectiondoc', logging.WARNING) as messages:
+            app.emit('build-finished', None)
+
+        # then
+        self.assertEqual(style.exceeded, ['name', 'name'])
+        self.assertFalse(hasattr(app.env, 'sectiondoc_exceeded'))
+        self.assertIn('2 docstrings exceeded the budget', messages[0])
+
+    def test_budget_disabled(self):
+        # given
+        app = DummyApp(self.doctreedir)
+        style = Style({'function': function_section})
+        style.setup(app)
+
+        # when
+        app.emit('builder-inited')
+
+        # then
+        self.assertIsNone(style.budget)
+        self.assertMultiLineEqual(self.render(app), RST)
+        self.assertEqual(style.exceeded, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,6 +13,14 @@ import re
 #  Pre-compiled regexes
 #-----------------------------------------------------------------------------
 indent_regex = re.compile(r'\s+')
+non_empty_line_regex = re.compile(r'^(?=[^\n]*\S)', re.MULTILINE)
+header_char_regex = re.compile(r'[A-Za-z\\]|\b\s')
+underline_candidate_regex = re.compile(r"""
+^[^\S\n]*\S*[-=]\S*[^\S\n]*$                    # a single word with - or =
+|
+^([^\S\n]*[^\sA-Za-z\\]+)[^\S\n]*\n\1[^\S\n]*$  # or a repeated word without
+                                                # letters
+""", re.MULTILINE | re.VERBOSE)
 
 
 #-----------------------------------------------------------------------------
@@ -56,6 +64,32 @@ def add_indent(lines, indent=4):
     return output
 
 
+def indent_text(text, indent=4):
+    """ Add spaces to indent the lines of a text chunk.
+
+    Arguments
+    ---------
+    text : str
+        The lines joined with ``\n``.
+
+    indent : int
+        The number of spaces to add.
+
+    Returns
+    -------
+    text : str
+        The indented text.
+
+    Notes
+    -----
+    Empty lines are not changed.
+
+    """
+    if indent == 0:
+        return text
+    return non_empty_line_regex.sub(' ' * indent, text)
+
+
 def remove_indent(lines):
     """ Remove all indentation from the lines.
 
@@ -68,6 +102,17 @@ def remove_indent(lines):
     return [line.lstrip() for line in lines]
 
 
+def split_chunks(chunks):
+    """ Split a list of text chunks into lines.
+
+    The chunks are joined once and split at the ``\n`` line breaks.
+
+    """
+    if not chunks:
+        return []
+    return '\n'.join(chunks).split('\n')
+
+
 def trim_indent(lines):
     """ Trim global intention level from lines.
 
@@ -98,6 +143,64 @@ def is_empty(line):
     return not line.strip()
 
 
+def get_section_header(header, line):
+    """ Check if the line is an rst underline of the header line.
+
+    The underline is expected to replace the letters, the backslashes
+    and the spaces after words in the header with ``-`` or ``=``.
+    Lines with a different length or more than one word are rejected
+    before building the expected underline.
+
+    Arguments
+    ---------
+    header : str
+        The candidate header line.
+
+    line : str
+        The line that follows the header.
+
+    Returns
+    -------
+    header : str
+        The striped header or an empty string when the line is not an
+        underline of the header.
+
+    """
+    underline = line.rstrip()
+    striped_header = header.rstrip()
+    if len(underline) != len(striped_header) or len(underline.split()) != 1:
+        return ''
+    for fill in '-=':
+        if header_char_regex.sub(fill, striped_header) == underline:
+            return header.strip()
+    return ''
+
+
+def has_section_headers(lines):
+    """ Check if the docstring lines can contain a section header.
+
+    A section header is followed by a single word underline where at
+    least one letter of the header is replaced with ``-`` or ``=``. The
+    only other case accepted by :func:`get_section_header` is a single
+    word without letters repeated in the next line. The check searches
+    the joined lines once and never rejects lines that contain a section
+    header.
+
+    Arguments
+    ---------
+    lines : list
+        The docstring lines.
+
+    """
+    if len(lines) < 2:
+        return False
+    text = '\n'.join(lines)
+    if text.count('\n') != len(lines) - 1:
+        # The lines include line breaks, do not try to be clever.
+        return True
+    return underline_candidate_regex.search(text) is not None
+
+
 #------------------------------------------------------------------------------
 #  Functions to adjust strings
 #------------------------------------------------------------------------------